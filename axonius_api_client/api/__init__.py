@@ -4,7 +4,7 @@ from . import api_endpoints, json_api
 from .adapters import Adapters, Cnx
 from .api_endpoint import ApiEndpoint
 from .api_endpoints import ApiEndpoints
-from .assets import Devices, Runner, Users, Vulnerabilities
+from .assets import Devices, FetchPlan, Runner, Users, Vulnerabilities
 from .enforcements import Enforcements
 from .folders import Folders
 from .openapi import OpenAPISpec
@@ -57,4 +57,5 @@ __all__ = (
     "DataScopes",
     "Vulnerabilities",
     "Folders",
+    "FetchPlan",
 )
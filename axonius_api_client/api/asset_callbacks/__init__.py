@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 """Callbacks for formatting asset data and exporting to various formats."""
 from .base import Base
+from .base_aggregate import Aggregate, Aggregator
 from .base_csv import Csv
+from .base_dataframe import DataFrame
 from .base_json import Json
 from .base_json_to_csv import JsonToCsv
+from .base_profile import FieldProfile, Profile
+from .base_sqlite import Sqlite
 from .base_table import Table
 from .base_xlsx import Xlsx
 from .base_xml import Xml
+from .sketches import FrequentItems, HyperLogLog
 from .tools import CB_MAP, get_callbacks_cls
 
 __all__ = (
@@ -17,6 +22,14 @@ __all__ = (
     "Xlsx",
     "Xml",
     "JsonToCsv",
+    "Sqlite",
+    "Aggregate",
+    "Aggregator",
+    "DataFrame",
+    "Profile",
+    "FieldProfile",
+    "HyperLogLog",
+    "FrequentItems",
     "get_callbacks_cls",
     "CB_MAP",
 )
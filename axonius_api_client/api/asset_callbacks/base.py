@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 """Base callbacks."""
+import contextlib
 import logging
 import pathlib
-import re
 import sys
-from typing import IO, Generator, List, Optional, Tuple, Union
+from typing import IO, Dict, Generator, List, Optional, Tuple, Union
 
 from ... import DEFAULT_PATH
-from ...constants.api import FIELD_JOINER, FIELD_TRIM_LEN, FIELD_TRIM_STR
+from ...constants.api import (
+    FIELD_JOINER,
+    FIELD_TRIM_LEN,
+    FIELD_TRIM_STR,
+    TRANSFORM_CHUNK_SIZE,
+)
 from ...constants.fields import (
     AGG_ADAPTER_NAME,
     FIELDS_DETAILS,
@@ -21,6 +26,7 @@ from ...exceptions import ApiError
 from ...tools import calc_percent  # json_dump,
 from ...tools import (
     PathLike,
+    PatternMatcher,
     check_path_is_not_dir,
     coerce_int,
     dt_now,
@@ -30,12 +36,16 @@ from ...tools import (
     echo_warn,
     get_path,
     get_paths_format,
+    is_tty,
     join_kv,
     listify,
     longest_str,
     path_backup_file,
     strip_right,
 )
+from .profile import CallbacksProfile
+from .progress import FetchProgress
+from .transform import TransformPool
 
 
 def crjoin(value):
@@ -127,6 +137,17 @@ class Base:
 
             >>> assets = apiobj.get(do_echo=True, page_progress=100)
 
+            Render a progress bar with rows/sec, bytes/sec, fetch vs process time, and ETA to
+            STDERR after each page if STDERR is a TTY (replaces page_progress echoes).
+
+            >>> assets = apiobj.get(progress_bar=True)
+
+            Send a progress event dict to a callable after each page and when the fetch
+            finishes. Events are also logged at debug level with the event dict in
+            ``extra={"fetch_progress": event}``.
+
+            >>> assets = apiobj.get(progress_cb=print)
+
             Supply a set of custom callbacks to process each row before all builtin callbacks
             are run. Custom callbacks receive two arguments: ``self`` (the current callback object)
             and ``rows`` (the current rows being processed). Custom callbacks must return a list of
@@ -139,6 +160,25 @@ class Base:
             ...
             >>> assets = apiobj.get(custom_cbs=[custom_cb1])
 
+            Join each row to the assets of another asset type, see
+            :meth:`axonius_api_client.connect.Connect.join_assets` to build the join.
+
+            >>> join = client.join_assets(left="users", right="devices", left_key="username")
+            >>> join.build_index(side="left")
+            >>> assets = client.devices.get(join=join)
+
+            Run the callbacks for the rows of each page in 4 worker processes, 200 rows at a
+            time. The next page is fetched once all rows of the current page are processed.
+            If ``custom_cbs`` or ``join`` are supplied, all callbacks are run in-process.
+
+            >>> assets = apiobj.get(transform_workers=4, transform_chunk_size=200)
+
+            Accumulate the time taken by each callback, export write, and page fetch and
+            echo a summary table when the fetch finishes. The profile is kept on the
+            callbacks object in ``apiobj.LAST_CALLBACKS.profile``.
+
+            >>> assets = apiobj.get(debug_profile=True)
+
         See Also:
             * :meth:`args_map_custom` for callback specific arguments to format and export data.
 
@@ -186,11 +226,17 @@ class Base:
             "report_adapters_missing": False,
             "report_software_whitelist": [],
             "page_progress": 10000,
+            "progress_bar": False,
+            "progress_cb": None,
             "do_echo": False,
             "custom_cbs": [],
+            "join": None,
             "debug_timing": False,
+            "debug_profile": False,
             "explode_entities": False,
             "include_dates": False,
+            "transform_workers": 0,
+            "transform_chunk_size": TRANSFORM_CHUNK_SIZE,
         }
 
     def get_arg_value(self, arg: str) -> Union[str, list, bool, int]:
@@ -235,8 +281,8 @@ class Base:
         self.STORE: dict = store or {}
         self.CURRENT_ROWS: List[dict] = []
         self.GETARGS: dict = getargs or {}
-        self.TAG_ROWS_ADD: List[dict] = []
-        self.TAG_ROWS_REMOVE: List[dict] = []
+        self.TAG_IDS_ADD: Dict[str, None] = {}
+        self.TAG_IDS_REMOVE: Dict[str, None] = {}
         self.CUSTOM_CB_EXC: List[dict] = []
         self._init()
 
@@ -247,6 +293,8 @@ class Base:
     def start(self, **kwargs):
         """Start this callbacks object."""
         self.echo(msg=f"Starting {self}")
+        self._fetch_progress = FetchProgress()
+        self.resume_start()
         excludes = listify(self.get_arg_value("field_excludes"))
         explode_entities = self.get_arg_value("explode_entities")
         include_details = self.STORE.get("include_details", False)
@@ -273,6 +321,97 @@ class Base:
         store = crjoin(join_kv(obj=self.STORE))
         self.echo(msg=f"Get Arguments: {store}")
 
+    @property
+    def resume_data(self) -> dict:
+        """Get the data saved by :meth:`get_checkpoint` when resuming an export."""
+        return self.STORE.get("resume") or {}
+
+    def resume_start(self):
+        """Restore the data saved by :meth:`get_checkpoint` when resuming an export."""
+        data = self.resume_data
+        if not data:
+            return
+
+        if not self.RESUME_SUPPORTED:
+            self.echo(msg=f"{self} does not support resuming exports", error=ApiError)
+
+        self.TAG_IDS_ADD.update({x: None for x in data.get("tag_ids_add") or []})
+        self.TAG_IDS_REMOVE.update({x: None for x in data.get("tag_ids_remove") or []})
+        self.echo(msg=f"Resuming export after {self.STATE.get('rows_processed_total')} rows")
+
+    def get_checkpoint(self) -> dict:
+        """Get the data needed to resume this callbacks object after the last written row."""
+        return {
+            "tag_ids_add": list(self.TAG_IDS_ADD),
+            "tag_ids_remove": list(self.TAG_IDS_REMOVE),
+        }
+
+    def process_page(self, rows: List[dict]):
+        """Process a page of rows that was just fetched, before any rows are processed.
+
+        Args:
+            rows: source rows of the page
+        """
+        if self.profile:
+            self.profile.add(step="fetch", seconds=self.STATE.get("fetch_seconds_this_page", 0))
+
+        self.transform_submit(rows=rows)
+        self.echo_fetch_progress()
+
+    @property
+    def profile(self) -> Optional[CallbacksProfile]:
+        """Get the timing profile for this fetch if debug_profile is enabled."""
+        if not hasattr(self, "_profile"):
+            self._profile = CallbacksProfile() if self.get_arg_value("debug_profile") else None
+        return self._profile
+
+    def profile_step(self, step: str) -> contextlib.AbstractContextManager:
+        """Time a step in :attr:`profile` if debug_profile is enabled.
+
+        Args:
+            step: name of step
+        """
+        if self.profile:
+            return self.profile.step(step=step)
+        return contextlib.nullcontext()
+
+    def echo_profile(self):
+        """Echo the summary table of :attr:`profile` if debug_profile is enabled."""
+        if self.profile:
+            self.echo(msg=f"Profile of {self}:\n{self.profile}")
+
+    @property
+    def fetch_progress(self) -> FetchProgress:
+        """Get the throughput and ETA tracker for this fetch."""
+        if not hasattr(self, "_fetch_progress"):
+            self._fetch_progress = FetchProgress()
+        return self._fetch_progress
+
+    @property
+    def progress_bar(self) -> bool:
+        """Check if the progress bar should be rendered to STDERR."""
+        return bool(self.get_arg_value("progress_bar")) and is_tty(sys.stderr)
+
+    def echo_fetch_progress(self, done: bool = False):
+        """Send the throughput and ETA of this fetch to the log, progress_cb and progress bar.
+
+        Args:
+            done: fetch has finished
+        """
+        event = self.fetch_progress.update(state=self.STATE, done=done)
+        line = self.fetch_progress.render(event=event)
+        self.LOG.debug(f"FETCH PROGRESS: {line}", extra={"fetch_progress": event})
+
+        progress_cb = self.get_arg_value("progress_cb")
+        if callable(progress_cb):
+            progress_cb(event)
+
+        if self.progress_bar:
+            sys.stderr.write(f"\r{line}")
+            if done:
+                sys.stderr.write("\n")
+            sys.stderr.flush()
+
     def echo_columns(self, **kwargs):
         """Echo the columns of the fields selected."""
         if getattr(self, "ECHO_DONE", False):
@@ -293,13 +432,15 @@ class Base:
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
+        self.transform_close()
+        self.echo_fetch_progress(done=True)
         self.do_tagging()
         self.echo(msg=f"Stopping {self}")
 
     def echo_page_progress(self):
         """Echo progress per N rows using an echo method."""
         page_progress = self.get_arg_value("page_progress")
-        if not page_progress or not isinstance(page_progress, int):
+        if not page_progress or not isinstance(page_progress, int) or self.progress_bar:
             return
 
         proc = self.STATE.get("rows_processed_total", 0) or 0
@@ -360,6 +501,7 @@ class Base:
             self.add_report_adapters_missing,
             self.add_report_software_whitelist,
             self.add_include_dates,
+            self.do_join,
             self.do_excludes,
             self.do_add_null_values,
             self.do_explode_entities,
@@ -377,20 +519,17 @@ class Base:
         Args:
             rows: rows to process
         """
+        transformed = self.transform_pop(rows=rows)
+        if transformed is not None:
+            return transformed
+
         debug_timing = self.get_arg_value("debug_timing")
 
         if debug_timing:  # pragma: no cover
             p_start = dt_now()
 
         for cb in self.callbacks:
-            if debug_timing:  # pragma: no cover
-                cb_start = dt_now()
-
-            rows = cb(rows=rows)
-            # print(f"{cb} {json_dump(rows)}")
-            if debug_timing:  # pragma: no cover
-                cb_delta = dt_now() - cb_start
-                self.LOG.debug(f"CALLBACK {cb} took {cb_delta} for {len(rows)} rows")
+            rows = self.do_callback(cb=cb, rows=rows)
 
         if debug_timing:  # pragma: no cover
             p_delta = dt_now() - p_start
@@ -398,6 +537,115 @@ class Base:
 
         return rows
 
+    def do_row_iter(self, rows: Union[List[dict], dict]) -> Generator[dict, None, None]:
+        """Execute the callbacks for current row, yielding one output row at a time.
+
+        Notes:
+            Callbacks before :meth:`do_explode_field` are run on the source rows as a whole,
+            then each exploded row is run through the remaining callbacks and yielded on its
+            own. Exporters that write rows as they are processed only ever hold one
+            exploded row in memory instead of every exploded copy of the source row.
+
+        Args:
+            rows: rows to process
+        """
+        transformed = self.transform_pop(rows=rows)
+        if transformed is not None:
+            yield from transformed
+            return
+
+        callbacks = self.callbacks
+        if self.do_explode_field not in callbacks:  # pragma: no cover
+            yield from self.do_row(rows=rows)
+            return
+
+        split = callbacks.index(self.do_explode_field)
+        rows = listify(rows)
+
+        callbacks_before, callbacks_after = callbacks[:split], callbacks[split:][1:]
+        for cb in callbacks_before:
+            rows = self.do_callback(cb=cb, rows=rows)
+
+        exploded = self.iter_explode_field(rows=rows)
+        if self.profile:
+            exploded = self.profile.step_iter(step=self.do_explode_field.__name__, items=exploded)
+
+        for new_row in exploded:
+            new_rows = [new_row]
+            for cb in callbacks_after:
+                new_rows = self.do_callback(cb=cb, rows=new_rows)
+            yield from new_rows
+            del new_rows, new_row
+
+    @property
+    def transform_pool(self) -> Optional[TransformPool]:
+        """Get the process pool used to run the callbacks if transform_workers is enabled."""
+        if not hasattr(self, "_transform_pool"):
+            workers = coerce_int(self.get_arg_value("transform_workers"), min_value=0)
+            chunk_size = coerce_int(self.get_arg_value("transform_chunk_size"), min_value=1)
+            self._transform_pool = None
+            in_process = [x for x in ["custom_cbs", "join"] if self.get_arg_value(x)]
+            if workers and in_process:
+                self.echo(
+                    msg=f"Running callbacks in-process instead of {workers} worker processes "
+                    f"because {' and '.join(in_process)} are supplied",
+                    debug=True,
+                )
+            elif workers and self.TRANSFORM_WORKERS_SUPPORTED:
+                self._transform_pool = TransformPool(
+                    callbacks=self, workers=workers, chunk_size=chunk_size
+                )
+        return self._transform_pool
+
+    def transform_submit(self, rows: Union[List[dict], dict]):
+        """Queue a page of rows to be transformed by :attr:`transform_pool`.
+
+        Args:
+            rows: source rows of the page that was just fetched
+        """
+        if self.transform_pool:
+            self.transform_pool.submit(rows=rows)
+
+    def transform_pop(self, rows: Union[List[dict], dict]) -> Optional[List[dict]]:
+        """Get the transformed rows for the current rows from :attr:`transform_pool`.
+
+        Args:
+            rows: source rows being processed
+        """
+        if self.transform_pool:
+            with self.profile_step(step="transform_workers"):
+                return self.transform_pool.pop(rows=rows)
+        return None
+
+    def transform_close(self):
+        """Stop the worker processes of :attr:`transform_pool`."""
+        if self.transform_pool:
+            self.transform_pool.close()
+
+    def do_callback(self, cb: callable, rows: Union[List[dict], dict]) -> List[dict]:
+        """Execute a single callback for current rows.
+
+        Args:
+            cb: callback to execute
+            rows: rows to process
+        """
+        debug_timing = self.get_arg_value("debug_timing")
+
+        if debug_timing:  # pragma: no cover
+            cb_start = dt_now()
+
+        if self.profile:
+            with self.profile.step(step=cb.__name__):
+                rows = cb(rows=rows)
+        else:
+            rows = cb(rows=rows)
+
+        if debug_timing:  # pragma: no cover
+            cb_delta = dt_now() - cb_start
+            self.LOG.debug(f"CALLBACK {cb} took {cb_delta} for {len(rows)} rows")
+
+        return rows
+
     def do_custom_cbs(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Execute any custom callbacks for current row.
 
@@ -417,6 +665,18 @@ class Base:
                 self.echo(msg=msg, error="exception", abort=False)
         return rows
 
+    def do_join(self, rows: Union[List[dict], dict]) -> List[dict]:
+        """Join rows to the index of another asset type.
+
+        Args:
+            rows: rows to process
+        """
+        rows = listify(rows)
+        join = self.get_arg_value("join")
+        if not join:
+            return rows
+        return join.join_rows(rows=rows)
+
     def do_add_null_values(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Null out missing fields.
 
@@ -742,6 +1002,14 @@ class Base:
     def do_explode_field(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Explode a field into multiple rows.
 
+        Args:
+            rows: rows being processed
+        """
+        return list(self.iter_explode_field(rows=rows))
+
+    def iter_explode_field(self, rows: Union[List[dict], dict]) -> Generator[dict, None, None]:
+        """Explode a field into multiple rows, yielding one row at a time.
+
         Args:
             rows: rows being processed
         """
@@ -749,16 +1017,19 @@ class Base:
         explode = self.get_arg_value("field_explode")
 
         if not explode or self.is_excluded(schema=self.schema_to_explode):
-            return rows
+            yield from rows
+            return
 
-        new_rows = []
         for row in rows:
-            new_rows += self._do_explode_field(row=row)
-        return new_rows
+            yield from self._do_explode_field(row=row)
 
-    def _do_explode_field(self, row: dict) -> List[dict]:
+    def _do_explode_field(self, row: dict) -> Generator[dict, None, None]:
         """Explode a field into multiple rows.
 
+        Notes:
+            The exploded field is popped from the source row once, and each exploded row is
+            built as a shallow copy of the source row only when it is requested.
+
         Args:
             row: row being processed
         """
@@ -769,22 +1040,22 @@ class Base:
 
         if len(listify(row.get(field, []))) <= 1:  # pragma: no cover
             self._do_flatten_fields(row=row, schema=schema)
-            return [row]
+            yield row
+            return
 
         items = listify(row.pop(field, []))
-        new_rows_map = {}
+        sub_schemas = list(self.get_sub_schemas(schema=schema)) if schema["is_complex"] else []
 
-        for idx, item in enumerate(items):
-            new_rows_map[idx] = dict(row)
+        for item in items:
+            new_row = dict(row)
 
             if schema["is_complex"]:
-                for sub_schema in self.get_sub_schemas(schema=schema):
-                    value = item.pop(sub_schema["name"], null_value)
-                    new_rows_map[idx][sub_schema["name_qual"]] = value
+                for sub_schema in sub_schemas:
+                    new_row[sub_schema["name_qual"]] = item.pop(sub_schema["name"], null_value)
             else:
-                new_rows_map[idx][schema["name_qual"]] = item
+                new_row[field] = item
 
-        return [new_rows_map[idx] for idx in new_rows_map]
+            yield new_row
 
     def do_tagging(self):
         """Add or remove tags to assets."""
@@ -794,18 +1065,38 @@ class Base:
     def do_tag_add(self):
         """Add tags to assets."""
         tags_add = listify(self.get_arg_value("tags_add"))
-        rows_add = self.TAG_ROWS_ADD
-        if tags_add and rows_add:
-            self.echo(msg=f"Adding tags {tags_add} to {len(rows_add)} assets")
-            self.APIOBJ.labels.add(rows=rows_add, labels=tags_add)
+        ids_add = list(self.TAG_IDS_ADD)
+        if tags_add and ids_add:
+            self.echo(msg=f"Adding tags {tags_add} to {len(ids_add)} assets")
+            self.APIOBJ.labels.add(rows=ids_add, labels=tags_add, progress=self.echo_tag_progress)
 
     def do_tag_remove(self):
         """Remove tags from assets."""
         tags_remove = listify(self.get_arg_value("tags_remove"))
-        rows_remove = self.TAG_ROWS_REMOVE
-        if tags_remove and rows_remove:
-            self.echo(msg=f"Removing tags {tags_remove} from {len(rows_remove)} assets")
-            self.APIOBJ.labels.remove(rows=rows_remove, labels=tags_remove)
+        ids_remove = list(self.TAG_IDS_REMOVE)
+        if tags_remove and ids_remove:
+            self.echo(msg=f"Removing tags {tags_remove} from {len(ids_remove)} assets")
+            self.APIOBJ.labels.remove(
+                rows=ids_remove, labels=tags_remove, progress=self.echo_tag_progress
+            )
+
+    def echo_tag_progress(self, event: dict):
+        """Echo progress of adding or removing tags.
+
+        Args:
+            event: progress event from :meth:`axonius_api_client.api.assets.labels.Labels.bulk`
+        """
+        chunks_done = event["chunks_done"]
+        chunks_total = event["chunks_total"]
+        if event["error"] is not None:
+            msg = f"Tags {event['method']} chunk #{event['chunk']} failed: {event['error']}"
+            self.echo(msg=msg, warning=True)
+        elif chunks_done == chunks_total or chunks_done % 100 == 0:
+            msg = (
+                f"Tags {event['method']} progress: {chunks_done} / {chunks_total} chunks, "
+                f"{event['processed_total']} assets processed"
+            )
+            self.echo(msg=msg)
 
     def process_tags_to_add(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Add assets to tracker for adding tags.
@@ -819,10 +1110,7 @@ class Base:
             return rows
 
         for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
-
-            if tag_row not in self.TAG_ROWS_ADD:
-                self.TAG_ROWS_ADD.append(tag_row)
+            self.TAG_IDS_ADD[row["internal_axon_id"]] = None
         return rows
 
     def process_tags_to_remove(self, rows: Union[List[dict], dict]) -> List[dict]:
@@ -837,12 +1125,18 @@ class Base:
             return rows
 
         for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
+            self.TAG_IDS_REMOVE[row["internal_axon_id"]] = None
+        return rows
 
-            if tag_row not in self.TAG_ROWS_REMOVE:
-                self.TAG_ROWS_REMOVE.append(tag_row)
+    @property
+    def TAG_ROWS_ADD(self) -> List[dict]:
+        """Get the assets tracked for adding tags to in :meth:`do_tagging`."""
+        return [{"internal_axon_id": x} for x in self.TAG_IDS_ADD]
 
-        return rows
+    @property
+    def TAG_ROWS_REMOVE(self) -> List[dict]:
+        """Get the assets tracked for removing tags from in :meth:`do_tagging`."""
+        return [{"internal_axon_id": x} for x in self.TAG_IDS_REMOVE]
 
     def add_report_software_whitelist(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Process report: Software whitelist.
@@ -851,9 +1145,7 @@ class Base:
             rows: rows to process
         """
         rows = listify(rows)
-        whitelists = listify(self.get_arg_value("report_software_whitelist"))
-
-        if not whitelists:
+        if not self.software_whitelist:
             return rows
 
         for row in rows:
@@ -866,24 +1158,31 @@ class Base:
         Args:
             row: row being processed
         """
-        whitelists = listify(self.get_arg_value("report_software_whitelist"))
-
-        sw_field = "specific_data.data.installed_software"
-
-        if sw_field not in self.fields_selected:
-            msg = f"Must include field (column) {sw_field!r}"
-            self.echo(msg=msg, error=ApiError, level="error")
-
-        sws = listify(row.get(sw_field, []))
+        matcher = self.software_whitelist
+        sws = listify(row.get(self.SOFTWARE_FIELD, []))
         names = [x.get("name") for x in sws if x.get("name") and isinstance(x.get("name"), str)]
-
-        extras = [n for n in names if any([re.search(x, n, re.I)] for x in whitelists)]
-        missing = [x for x in whitelists if any([re.search(x, n, re.I) for n in names])]
+        extras, missing = matcher.report(values=names)
 
         schemas = SCHEMAS_CUSTOM["report_software_whitelist"]
-        row[schemas["software_missing"]["name_qual"]] = sorted(list(set(missing)))
-        row[schemas["software_whitelist"]["name_qual"]] = whitelists
-        row[schemas["software_extra"]["name_qual"]] = sorted(list(set(extras)))
+        row[schemas["software_missing"]["name_qual"]] = missing
+        row[schemas["software_whitelist"]["name_qual"]] = matcher.patterns
+        row[schemas["software_extra"]["name_qual"]] = extras
+
+    @property
+    def software_whitelist(self) -> Optional[PatternMatcher]:
+        """Get the compiled matcher for report_software_whitelist."""
+        if not hasattr(self, "_software_whitelist"):
+            whitelists = listify(self.get_arg_value("report_software_whitelist"))
+            if not whitelists:
+                return None
+
+            if self.SOFTWARE_FIELD not in self.fields_selected:
+                msg = f"Must include field (column) {self.SOFTWARE_FIELD!r}"
+                self.echo(msg=msg, error=ApiError, level="error")
+
+            self._software_whitelist = PatternMatcher(patterns=whitelists)
+            self.echo(msg=f"Compiled software whitelist: {self._software_whitelist}", debug=True)
+        return self._software_whitelist
 
     def add_include_dates(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Process report: Add dates (history and current)
@@ -1048,6 +1347,8 @@ class Base:
             schemas += list(SCHEMAS_CUSTOM["report_software_whitelist"].values())
         if self.get_arg_value("include_dates"):
             schemas += list(SCHEMAS_CUSTOM["include_dates"].values())
+        if self.get_arg_value("join"):
+            schemas += self.get_arg_value("join").schemas
         return schemas
 
     @property
@@ -1214,6 +1515,15 @@ class Base:
     CB_NAME: str = "base"
     """name for this callback"""
 
+    SOFTWARE_FIELD: str = "specific_data.data.installed_software"
+    """field used by report_software_whitelist"""
+
+    TRANSFORM_WORKERS_SUPPORTED: bool = True
+    """callbacks can be run in worker processes if transform_workers is enabled"""
+
+    RESUME_SUPPORTED: bool = False
+    """exports can be checkpointed and resumed with get_generator resume"""
+
     FIND_KEYS: List[str] = ["name", "name_qual", "column_title", "name_base"]
     """field schema keys to use when finding a fields schema"""
 
@@ -1235,11 +1545,11 @@ class Base:
     GETARGS: dict = None
     """original kwargs supplied to get assets method."""
 
-    TAG_ROWS_ADD: List[dict] = None
-    """tracker of assets to add tags to in :meth:`do_tagging`."""
+    TAG_IDS_ADD: Dict[str, None] = None
+    """tracker of asset IDs (ordered and unique) to add tags to in :meth:`do_tagging`."""
 
-    TAG_ROWS_REMOVE: List[dict] = None
-    """tracker of assets to remove tags from in :meth:`do_tagging`."""
+    TAG_IDS_REMOVE: Dict[str, None] = None
+    """tracker of asset IDs (ordered and unique) to remove tags from in :meth:`do_tagging`."""
 
     CUSTOM_CB_EXC: List[dict] = None
     """tracker of custom callbacks that have been executed by :meth:`do_custom_cbs`"""
@@ -1292,6 +1602,36 @@ class ExportMixins(Base):
             self.arg_export_path, self.arg_export_file, mapping=self.export_templates
         )
 
+    def get_checkpoint(self) -> dict:
+        """Get the data needed to resume this callbacks object after the last written row."""
+        data = super(ExportMixins, self).get_checkpoint()
+        fd = getattr(self, "_fd", None)
+        file_path = getattr(self, "_file_path", None)
+        if fd is not None and file_path is not None:
+            fd.flush()
+            data["file_path"] = str(file_path)
+            data["file_position"] = fd.tell()
+        return data
+
+    def open_fd_resume(self) -> IO:
+        """Open the file descriptor of an export being resumed at the last written row."""
+        position = self.resume_data.get("file_position")
+        if not self._file_path.is_file() or self._file_path.stat().st_size < (position or 0):
+            msg = (
+                f"Unable to resume export, file {str(self._file_path)!r} is missing or "
+                f"smaller than the last checkpoint position {position}"
+            )
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self._file_mode: str = f"Resumed existing file at position {position}"
+        self._fd_info: str = f"file {str(self._file_path)!r} ({self._file_mode})"
+        self.echo(msg=f"Exporting to {self._fd_info}")
+
+        self._fd: IO = self._file_path.open(mode="r+", encoding="utf-8")
+        self._fd.seek(position)
+        self._fd.truncate()
+        return self._fd
+
     def open_fd_path(self) -> IO:
         """Open a file descriptor for a path."""
         export_fd_close = self.arg_export_fd_close
@@ -1304,6 +1644,9 @@ class ExportMixins(Base):
 
         check_path_is_not_dir(path=self._file_path)
 
+        if self.resume_data:
+            return self.open_fd_resume()
+
         if self._file_path.exists():
             if export_backup:
                 self._file_path_backup: pathlib.Path = path_backup_file(path=self._file_path)
@@ -1411,13 +1754,27 @@ ARG_DESCRIPTIONS: dict = {
     "report_adapters_missing": "Add Missing Adapters calculation",
     "report_software_whitelist": "Missing Software to calculate",
     "page_progress": "Echo page progress every N assets",
+    "progress_bar": "Render a progress bar with throughput and ETA to a TTY",
+    "progress_cb": "Callable to send progress events to after each page",
     "do_echo": "Echo messages to console",
     "custom_cbs": "Custom callbacks to perform on assets",
+    "join": "Index of another asset type to join rows to",
     "json_flat": "For JSON Export: Use JSONL format",
     "csv_key_miss": "For CSV Export: Value to use when keys are missing",
     "csv_key_extras": "For CSV Export: What to do with extra CSV columns",
     "csv_dialect": "For CSV Export: CSV Dialect to use",
     "csv_quoting": "For CSV Export: CSV quoting style",
+    "sqlite_table": "For SQLite Export: Name of root table (default: asset type)",
+    "dataframe_category_ratio": "For DataFrame Export: Most unique values per row for "
+    "categorical strings",
+    "agg_group_by": "For Aggregate Export: Fields to group by",
+    "agg_count_distinct": "For Aggregate Export: Fields to count distinct values of per group",
+    "agg_min_max": "For Aggregate Export: Date fields to get min and max of per group",
+    "agg_top": "For Aggregate Export: Only export the N groups with the highest counts",
+    "agg_format": "For Aggregate Export: Output format (table, json, csv)",
+    "profile_top": "For Profile Export: Number of most common values to report per field",
+    "profile_precision": "For Profile Export: Precision of approximate distinct counts (4-16)",
+    "profile_format": "For Profile Export: Output format (table, json, csv)",
     "export_file": "File to export data to",
     "export_path": "Directory to export data to",
     "export_overwrite": "Overwrite export_file if it exists",
@@ -1431,7 +1788,10 @@ ARG_DESCRIPTIONS: dict = {
     "xlsx_column_length": "For XLSX export: Length to use for every column",
     "xlsx_cell_format": "For XLSX Export: Formatting to apply to every cell",
     "debug_timing": "Enable logging of time taken for each callback",
+    "debug_profile": "Report total and max time taken for each callback, write, and fetch",
     "explode_entities": "Split rows into one row for each asset entity",
     "include_dates": "Include history date and current date as a columns in the output",
+    "transform_workers": "Worker processes to run callbacks in (0 = in-process)",
+    "transform_chunk_size": "Rows to send to a worker process at a time",
 }
 """Descriptions of all arguments for all callbacks"""
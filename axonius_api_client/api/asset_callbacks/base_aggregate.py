@@ -0,0 +1,454 @@
+# -*- coding: utf-8 -*-
+"""Aggregate export callbacks."""
+import csv
+import itertools
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import tabulate
+
+from ...constants.api import AGG_DISTINCT_EXACT, AGG_PRECISION, TABLE_FORMAT
+from ...exceptions import ApiError
+from ...tools import dt_parse, listify
+from .base import ExportMixins
+from .sketches import HyperLogLog
+
+AGG_FORMATS: List[str] = ["table", "json", "csv"]
+"""valid output formats for aggregate exports"""
+
+
+def resolve_field(apiobj, value: str) -> Tuple[str, str]:
+    """Get the fully qualified name of a field or complex sub-field and its root field.
+
+    Args:
+        apiobj (:obj:`axonius_api_client.api.assets.asset_mixin.AssetMixin`): asset object
+            to get the field schemas from
+        value: field to find in format of ``adapter_name:field_name``, sub-fields of complex
+            fields as ``adapter_name:field_name.sub_field_name``
+
+    Returns:
+        tuple of the fully qualified name of value and of the root field that holds it
+    """
+    try:
+        schema = apiobj.fields.get_field_name(value=value, key=None, selectable_only=False)
+    except ApiError:
+        if "." not in value:
+            raise
+        parent, sub_name = value.rsplit(".", 1)
+        root, _ = resolve_field(apiobj=apiobj, value=parent)
+        return f"{root}.{sub_name}", root
+
+    name = schema["name_qual"]
+    parent = schema.get("parent") or "root"
+    return name, name if parent == "root" else parent
+
+
+def write_rows(
+    fd, rows: List[dict], fmt: str, table_format: str, columns: Optional[List[str]] = None
+):
+    """Write rows of results to a file descriptor as a table, JSON, or CSV.
+
+    Args:
+        fd: file descriptor to write to
+        rows: rows to write
+        fmt: one of :data:`AGG_FORMATS`
+        table_format: tabulate format to use if fmt is table
+        columns: columns of the CSV header if there are no rows
+    """
+    if fmt == "json":
+        fd.write(json.dumps(rows, indent=2, default=str))
+    elif fmt == "csv":
+        writer = csv.DictWriter(fd, fieldnames=list(rows[0]) if rows else listify(columns))
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        table = tabulate.tabulate(
+            tabular_data=rows, tablefmt=table_format, showindex=False, headers="keys"
+        )
+        fd.write(table)
+        fd.write("\n")
+
+
+class Aggregator:
+    """Streaming group-by of asset rows with counts, distinct counts, and min/max of dates.
+
+    Examples:
+        Count rows by OS type and get the distinct host names and last seen range of each
+
+        >>> agg = Aggregator(
+        ...     group_by=["specific_data.data.os.type"],
+        ...     count_distinct=["specific_data.data.hostname"],
+        ...     min_max=["specific_data.data.last_seen"],
+        ... )
+        >>> for row in apiobj.get_generator(fields=["os.type", "hostname", "last_seen"]):
+        ...     agg.add(row=row)
+        >>> agg.get_results()
+        [{'specific_data.data.os.type': 'Windows', 'count': 4012, ...}, ...]
+
+    Notes:
+        Rows are folded into their groups as they are added and are not kept, so memory is
+        proportional to the number of groups instead of the number of rows. Distinct values
+        are counted exactly until a group has more than :data:`AGG_DISTINCT_EXACT` of them
+        for a field, then the count is estimated by a :obj:`HyperLogLog` of
+        ``2 ** precision`` bytes, so the memory of each group stays constant.
+
+        top keeps the groups with the highest counts across all groups, it does not keep the
+        top values within each group.
+
+        Each value of a list field, and each value of a sub-field across the items of a
+        complex field (like ``specific_data.data.network_interfaces.mac``), is its own group,
+        so a row can be counted in more than one group. Grouping by more than one field
+        counts a row in every combination of the values of the fields. Rows with no value
+        for a field are grouped under None.
+    """
+
+    def __init__(
+        self,
+        group_by: Union[str, List[str]],
+        count_distinct: Optional[Union[str, List[str]]] = None,
+        min_max: Optional[Union[str, List[str]]] = None,
+        top: int = 0,
+        precision: int = AGG_PRECISION,
+    ):
+        """Streaming group-by of asset rows.
+
+        Args:
+            group_by: fields of rows to group by
+            count_distinct: fields to count the distinct values of in each group
+            min_max: date fields to get the earliest and latest values of in each group
+            top: only return the N groups with the highest counts, 0 for all groups
+            precision: precision of the :obj:`HyperLogLog` used for large distinct counts
+        """
+        self.group_by: List[str] = listify(group_by)
+        self.count_distinct: List[str] = listify(count_distinct)
+        self.min_max: List[str] = listify(min_max)
+        self.top: int = max(0, top or 0)
+        self.precision: int = precision
+        if not self.group_by:
+            raise ApiError("Must supply at least one field to group by")
+
+        self.groups: Dict[tuple, dict] = {}
+        self.rows: int = 0
+
+    def add(self, row: dict):
+        """Fold a row into the groups it belongs to.
+
+        Args:
+            row: row to add
+        """
+        self.rows += 1
+        values = [self.get_values(row=row, field=x) or [None] for x in self.group_by]
+        distinct = {x: self.get_values(row=row, field=x) for x in self.count_distinct}
+        dates = {x: self.get_dates(row=row, field=x) for x in self.min_max}
+
+        for key in set(itertools.product(*values)):
+            group = self.groups.get(key)
+            if group is None:
+                group = self.groups[key] = {
+                    "count": 0,
+                    "distinct": {x: set() for x in self.count_distinct},
+                    "min": {},
+                    "max": {},
+                }
+            group["count"] += 1
+
+            for field, items in distinct.items():
+                counter = group["distinct"][field]
+                for item in items:
+                    counter.add(item)
+                if isinstance(counter, set) and len(counter) > AGG_DISTINCT_EXACT:
+                    group["distinct"][field] = self._get_sketch(values=counter)
+
+            for field, items in dates.items():
+                if items:
+                    low, high = min(items), max(items)
+                    if field not in group["min"] or low < group["min"][field]:
+                        group["min"][field] = low
+                    if field not in group["max"] or high > group["max"][field]:
+                        group["max"][field] = high
+
+    def get_results(self) -> List[dict]:
+        """Get a row for each group, highest counts first."""
+        items = sorted(self.groups.items(), key=lambda x: (-x[1]["count"], str(x[0])))
+        if self.top:
+            items = items[: self.top]
+
+        results = []
+        for key, group in items:
+            result = dict(zip(self.group_by, key))
+            result["count"] = group["count"]
+            for field in self.count_distinct:
+                counter = group["distinct"][field]
+                count = len(counter) if isinstance(counter, set) else counter.count()
+                result[f"count_distinct:{field}"] = count
+            for field in self.min_max:
+                low, high = group["min"].get(field), group["max"].get(field)
+                result[f"min:{field}"] = low.isoformat() if low else None
+                result[f"max:{field}"] = high.isoformat() if high else None
+            results.append(result)
+        return results
+
+    def _get_sketch(self, values: set) -> HyperLogLog:
+        """Get a sketch of the distinct values of a group once there are too many to keep.
+
+        Args:
+            values: distinct values counted exactly so far
+        """
+        sketch = HyperLogLog(precision=self.precision)
+        for value in values:
+            sketch.add(value=value)
+        return sketch
+
+    @staticmethod
+    def get_values(row: dict, field: str) -> List[Any]:
+        """Get the unique values of a field or complex sub-field in a row.
+
+        Args:
+            row: row to get values from
+            field: fully qualified name of field or sub-field
+        """
+        values = row.get(field)
+        if field not in row:
+            parts = field.split(".")
+            for idx in range(len(parts) - 1, 0, -1):
+                parent = ".".join(parts[:idx])
+                if parent in row:
+                    values = row[parent]
+                    for part in parts[idx:]:
+                        values = [
+                            x.get(part) for x in Aggregator._flatten(values) if isinstance(x, dict)
+                        ]
+                    break
+
+        uniques = {}
+        for value in Aggregator._flatten(values):
+            if value is None or value == "":
+                continue
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, sort_keys=True, default=str)
+            uniques.setdefault(value, None)
+        return list(uniques)
+
+    @staticmethod
+    def get_dates(row: dict, field: str) -> List[datetime]:
+        """Get the values of a date field in a row that can be parsed into datetimes.
+
+        Args:
+            row: row to get values from
+            field: fully qualified name of field or sub-field
+        """
+        dates = []
+        for value in Aggregator.get_values(row=row, field=field):
+            try:
+                dates.append(dt_parse(obj=value, default_tz_utc=True))
+            except Exception:
+                continue
+        return dates
+
+    @staticmethod
+    def _flatten(values: Any) -> List[Any]:
+        """Flatten one level of lists of values.
+
+        Args:
+            values: value or list of values that may hold lists
+        """
+        flat = []
+        for value in listify(values):
+            flat.extend(value if isinstance(value, list) else [value])
+        return flat
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return (
+            f"{self.__class__.__name__}(group_by={self.group_by}, rows={self.rows}, "
+            f"groups={len(self.groups)})"
+        )
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
+
+
+class Aggregate(ExportMixins):
+    """Callbacks for grouping asset data and exporting the counts of each group.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Count the devices of each OS type and print them as a table to STDOUT. The fields
+            to aggregate must be included in ``fields``.
+
+            >>> assets = apiobj.get(
+            ...     export="aggregate",
+            ...     fields=["os.type"],
+            ...     agg_group_by=["os.type"],
+            ... )
+
+            Count the devices of each OS type and distribution, with the number of distinct
+            host names and the range of last seen dates of each, and export them to a CSV
+            file.
+
+            >>> assets = apiobj.get(
+            ...     export="aggregate",
+            ...     export_file="os.csv",
+            ...     fields=["os.type", "os.distribution", "hostname", "last_seen"],
+            ...     agg_group_by=["os.type", "os.distribution"],
+            ...     agg_count_distinct=["hostname"],
+            ...     agg_min_max=["last_seen"],
+            ...     agg_format="csv",
+            ... )
+
+            Get the 10 most common MAC address vendors as JSON, grouping by a sub-field of a
+            complex field.
+
+            >>> assets = apiobj.get(
+            ...     export="aggregate",
+            ...     fields=["network_interfaces"],
+            ...     agg_group_by=["network_interfaces.manufacturer"],
+            ...     agg_top=10,
+            ...     agg_format="json",
+            ... )
+
+            The results are also kept in the STORE of the callbacks object.
+
+            >>> apiobj.LAST_CALLBACKS.STORE["aggregate"]
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+            * :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_aggregate` to
+              aggregate without an export, adding the fields to aggregate automatically
+
+        Notes:
+            Rows are folded into their groups by :obj:`Aggregator` as they are fetched and are
+            not returned, so memory is proportional to the number of groups instead of the
+            number of rows. The groups are written once all rows have been fetched.
+
+            This callbacks object forces the following arguments to False in order to keep the
+            values of fields intact for grouping: ``field_titles``, ``field_flatten``,
+            ``field_join``, ``field_compress``
+
+            These arguments can be supplied as extra kwargs passed to
+            :meth:`axonius_api_client.api.assets.users.Users.get` or
+            :meth:`axonius_api_client.api.assets.devices.Devices.get`
+
+        """
+        args = {}
+        args.update(cls.args_map_export())
+        args.update(
+            {
+                "agg_group_by": None,
+                "agg_count_distinct": None,
+                "agg_min_max": None,
+                "agg_top": 0,
+                "agg_format": "table",
+                "table_format": TABLE_FORMAT,
+            }
+        )
+        return args
+
+    def _init(self, **kwargs):
+        """Override arguments to keep the values of fields intact."""
+        self.set_arg_value("field_titles", False)
+        self.set_arg_value("field_flatten", False)
+        self.set_arg_value("field_join", False)
+        self.set_arg_value("field_compress", False)
+
+        agg_format = self.get_arg_value("agg_format") or "table"
+        if agg_format not in AGG_FORMATS:
+            msg = f"Invalid agg_format {agg_format!r}, valids: {AGG_FORMATS}"
+            self.echo(msg=msg, error=ApiError, level="error")
+        self.set_arg_value("agg_format", agg_format)
+
+        table_format = self.get_arg_value("table_format") or TABLE_FORMAT
+        if table_format not in tabulate.tabulate_formats:
+            fmts = ", ".join(tabulate.tabulate_formats)
+            msg = f"{table_format!r} is not a valid table format, must be one of {fmts}"
+            self.echo(msg=msg, error=ApiError, level="error")
+        self.set_arg_value("table_format", table_format)
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Aggregate, self).start(**kwargs)
+        self._aggregator = Aggregator(
+            group_by=self.resolve_fields(self.get_arg_value("agg_group_by")),
+            count_distinct=self.resolve_fields(self.get_arg_value("agg_count_distinct")),
+            min_max=self.resolve_fields(self.get_arg_value("agg_min_max")),
+            top=self.get_arg_value("agg_top") or 0,
+        )
+        self.open_fd()
+
+    def resolve_fields(self, values: Optional[Union[str, List[str]]]) -> List[str]:
+        """Get the fully qualified names of fields to aggregate and check they are fetched.
+
+        Args:
+            values: fields or complex sub-fields to resolve
+        """
+        fetched = [x["name_qual"] for x in self.final_schemas]
+        names = []
+        for value in listify(values):
+            name, root = resolve_field(apiobj=self.APIOBJ, value=value)
+            if root not in fetched:
+                msg = f"Field {root!r} must be included in fields in order to aggregate {value!r}"
+                self.echo(msg=msg, error=ApiError, level="error")
+            names.append(name)
+        return names
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Aggregate, self).stop(**kwargs)
+        aggregator = getattr(self, "_aggregator", None)
+        if aggregator is None:
+            return
+
+        results = aggregator.get_results()
+        self.STORE["aggregate"] = results
+        self.echo(msg=f"Aggregated {aggregator.rows} rows into {len(aggregator.groups)} groups")
+
+        with self.profile_step(step="write"):
+            self.write_results(results=results)
+        self.close_fd()
+
+    def write_results(self, results: List[dict]):
+        """Write the groups in the format of agg_format.
+
+        Args:
+            results: rows of groups from :meth:`Aggregator.get_results`
+        """
+        columns = self._aggregator.group_by + ["count"]
+        write_rows(
+            fd=self._fd,
+            rows=results,
+            fmt=self.get_arg_value("agg_format"),
+            table_format=self.get_arg_value("table_format"),
+            columns=columns,
+        )
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Process the callbacks for current row.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+        for row in self.do_row_iter(rows=rows):
+            self._aggregator.add(row=row)
+        del rows, row
+        return []
+
+    CB_NAME: str = "aggregate"
+    """name for this callback"""
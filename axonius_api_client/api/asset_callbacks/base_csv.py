@@ -140,6 +140,19 @@ class Csv(ExportMixins):
 
         quote = getattr(csv, f"QUOTE_{quote.upper()}")
 
+        resume_fieldnames = self.resume_data.get("fieldnames")
+        if resume_fieldnames:
+            self._stream = csv.DictWriter(
+                self._fd,
+                fieldnames=resume_fieldnames,
+                quoting=quote,
+                lineterminator="\n",
+                restval=restval,
+                dialect=dialect,
+                extrasaction=extras,
+            )
+            return
+
         try:
             self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
         except Exception:  # pragma: no cover
@@ -158,6 +171,15 @@ class Csv(ExportMixins):
         self._stream.writerow(dict(zip(self.final_columns, self.final_columns)))
         self.do_export_schema()
 
+    def get_checkpoint(self) -> dict:
+        """Get the data needed to resume this callbacks object after the last written row."""
+        data = super(Csv, self).get_checkpoint()
+        stream = getattr(self, "_stream", None)
+        fieldnames = stream.fieldnames if stream else self.resume_data.get("fieldnames")
+        if fieldnames:
+            data["fieldnames"] = list(fieldnames)
+        return data
+
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         super(Csv, self).stop(**kwargs)
@@ -190,8 +212,9 @@ class Csv(ExportMixins):
 
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_pre_row(rows=rows)
-        rows = self.do_row(rows=rows)
-        self.write_rows(rows=rows)
+        rows = self.do_row_iter(rows=rows)
+        with self.profile_step(step="write"):
+            self.write_rows(rows=rows)
         del rows, row
         return row_return
 
@@ -213,3 +236,6 @@ class Csv(ExportMixins):
 
     CB_NAME: str = "csv"
     """name for this callback"""
+
+    RESUME_SUPPORTED: bool = True
+    """exports can be checkpointed and resumed with get_generator resume"""
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""DataFrame export callbacks."""
+import importlib
+from typing import Any, Dict, List, Optional, Union
+
+from ...constants.api import DATAFRAME_CATEGORY_RATIO
+from ...exceptions import ApiError
+from ...tools import listify
+from .base import Base
+
+DATETIME_TYPES: List[str] = ["string_datetime", "string_date"]
+"""field schema type_norms of datetime columns"""
+
+DTYPES: Dict[str, str] = {
+    "integer": "Int64",
+    "number": "float64",
+    "boolean": "boolean",
+}
+"""map of field schema type_norm to pandas dtype for columns of single values"""
+
+
+class ColumnBuffer:
+    """Buffer of the values of one column that is converted to a typed array each page.
+
+    Notes:
+        Values are held as python objects only until :meth:`flush` is called, then they are
+        converted to a chunk with the dtype of the field schema: datetimes with UTC timezone,
+        nullable integers, floats, nullable booleans, and categoricals for strings, so repeated
+        strings are only held once. String columns stay categorical if their unique values are
+        no more than category_ratio of their values, otherwise they are converted to objects
+        once all values are in. Lists and values that can not be converted are kept as objects.
+    """
+
+    def __init__(self, pd, schema: dict, category_ratio: float):
+        """Buffer of the values of one column.
+
+        Args:
+            pd: the pandas module
+            schema: field schema of the column
+            category_ratio: most unique values per value for strings to be categorical
+        """
+        self.pd = pd
+        self.category_ratio: float = category_ratio
+        self.kind: str = self.get_kind(schema=schema)
+        self.pending: List[Any] = []
+        self.chunks: List[Any] = []
+
+    @staticmethod
+    def get_kind(schema: dict) -> str:
+        """Get the kind of values of a column from its field schema.
+
+        Args:
+            schema: field schema of the column
+        """
+        type_norm = schema.get("type_norm") or ""
+        is_sub = (schema.get("parent") or "root") != "root"
+        if schema.get("is_list") or schema.get("is_complex") or is_sub:
+            return "object"
+        if type_norm in DATETIME_TYPES:
+            return "datetime"
+        if type_norm in DTYPES:
+            return type_norm
+        if type_norm.startswith("string"):
+            return "string"
+        return "object"
+
+    def append(self, value: Any):
+        """Add the value of a row.
+
+        Args:
+            value: value to add
+        """
+        self.pending.append(value)
+
+    def flush(self):
+        """Convert the pending values to a chunk."""
+        if not self.pending:
+            return
+
+        values, self.pending = self.pending, []
+        pd = self.pd
+        kind = self.kind
+        if any(isinstance(x, (list, dict)) for x in values):
+            kind = "object"
+
+        try:
+            if kind == "datetime":
+                series = pd.Series(values, dtype=object)
+                chunk = pd.to_datetime(series, utc=True, errors="coerce")
+                if chunk.isna().sum() > series.isna().sum():
+                    raise ValueError("Values that are not datetimes found")
+            elif kind in DTYPES:
+                chunk = pd.Series(values, dtype=DTYPES[kind])
+            elif kind == "string":
+                chunk = pd.Series(values, dtype=object).astype("category")
+            else:
+                chunk = pd.Series(values, dtype=object)
+        except (TypeError, ValueError, OverflowError):
+            chunk = pd.Series(values, dtype=object)
+
+        self.chunks.append(chunk)
+
+    def get_series(self, name: str):
+        """Flush the pending values and combine the chunks into one series.
+
+        Args:
+            name: name of the series
+        """
+        pd = self.pd
+        self.flush()
+        chunks, self.chunks = self.chunks, []
+
+        if not chunks:
+            return pd.Series([], dtype=object, name=name)
+
+        if all(isinstance(x.dtype, pd.CategoricalDtype) for x in chunks):
+            # a chunk of only nulls has no categories to infer their dtype from
+            arrays = [
+                pd.Categorical.from_codes(x.cat.codes, categories=x.cat.categories.astype(object))
+                for x in chunks
+            ]
+            values = pd.api.types.union_categoricals(arrays, ignore_order=True)
+            series = pd.Series(values, name=name)
+            if len(values.categories) > len(series) * self.category_ratio:
+                series = series.astype(object)
+            return series
+
+        dtypes = {str(x.dtype) for x in chunks}
+        if len(dtypes) > 1:
+            chunks = [x.astype(object) for x in chunks]
+        series = pd.concat(chunks, ignore_index=True)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        series.name = name
+        return series
+
+
+class DataFrame(Base):
+    """Callbacks for formatting asset data into a pandas DataFrame.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Get a DataFrame of devices.
+
+            >>> df = apiobj.get_dataframe(fields=["hostname", "os.type", "last_seen"])
+
+            Get a DataFrame using the titles of fields as column names, and only make
+            string columns categorical if they have 1 unique value for every 10 rows or less.
+
+            >>> df = apiobj.get_dataframe(field_titles=True, dataframe_category_ratio=0.1)
+
+            The DataFrame is also kept on the callbacks object.
+
+            >>> apiobj.get(export="dataframe")
+            >>> df = apiobj.LAST_CALLBACKS.dataframe
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            Requires the pandas package to be installed.
+
+            The values of each column are converted page by page into arrays with a dtype
+            from the type of its field schema, instead of keeping every row as a dict
+            until the end. Datetime fields are UTC datetimes, integer and boolean fields are
+            nullable Int64 and boolean, number fields are float64, and string fields are
+            categoricals if they have few unique values. List fields and the sub-fields of
+            flattened complex fields are columns of lists. See :obj:`ColumnBuffer`.
+
+            No rows are returned by get or get_generator with this callbacks object.
+
+            This callbacks object forces the following arguments in order to have one column
+            per field: ``field_flatten`` to True, ``field_null`` to True, ``field_join``
+            to False
+
+            These arguments can be supplied as extra kwargs passed to
+            :meth:`axonius_api_client.api.assets.users.Users.get` or
+            :meth:`axonius_api_client.api.assets.devices.Devices.get`
+
+        """
+        return {"dataframe_category_ratio": DATAFRAME_CATEGORY_RATIO}
+
+    def _init(self, **kwargs):
+        """Override arguments to have one column per field."""
+        self.set_arg_value("field_flatten", True)
+        self.set_arg_value("field_null", True)
+        self.set_arg_value("field_join", False)
+        self.dataframe: Optional[Any] = None
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(DataFrame, self).start(**kwargs)
+        try:
+            pd = importlib.import_module("pandas")
+        except ImportError:
+            msg = f"The pandas package must be installed for export {self.CB_NAME!r}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        ratio = self.get_arg_value("dataframe_category_ratio")
+        self._buffers: Dict[str, ColumnBuffer] = {
+            column: ColumnBuffer(pd=pd, schema=schema, category_ratio=ratio)
+            for column, schema in zip(self.final_columns, self.final_schemas)
+        }
+        self._pd = pd
+
+    def process_page(self, rows: List[dict]):
+        """Convert the values of the last page to typed chunks before the next page.
+
+        Args:
+            rows: source rows of the page
+        """
+        super(DataFrame, self).process_page(rows=rows)
+        with self.profile_step(step="write"):
+            for buffer in self._buffers.values():
+                buffer.flush()
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(DataFrame, self).stop(**kwargs)
+        buffers = getattr(self, "_buffers", None)
+        if buffers is None:
+            return
+
+        with self.profile_step(step="write"):
+            columns = {x: buffer.get_series(name=x) for x, buffer in buffers.items()}
+            self.dataframe = self._pd.DataFrame(columns, copy=False)
+        rows, cols = self.dataframe.shape
+        self.echo(msg=f"Built DataFrame with {rows} rows and {cols} columns")
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Process the callbacks for current row.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+        for row in self.do_row_iter(rows=rows):
+            for column, buffer in self._buffers.items():
+                buffer.append(row.get(column))
+        del rows, row
+        return []
+
+    CB_NAME: str = "dataframe"
+    """name for this callback"""
@@ -74,10 +74,17 @@ class Json(ExportMixins):
         super(Json, self).start(**kwargs)
         flat = self.get_arg_value("json_flat")
 
-        self._first_row = True
+        self._first_row = self.resume_data.get("first_row", True)
         self.open_fd()
-        begin = "" if flat else "["
-        self._fd.write(begin)
+        if not self.resume_data:
+            begin = "" if flat else "["
+            self._fd.write(begin)
+
+    def get_checkpoint(self) -> dict:
+        """Get the data needed to resume this callbacks object after the last written row."""
+        data = super(Json, self).get_checkpoint()
+        data["first_row"] = self._first_row
+        return data
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
@@ -98,8 +105,9 @@ class Json(ExportMixins):
         rows = listify(row)
         rows = self.do_pre_row(rows=rows)
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
-        rows = self.do_row(rows=rows)
-        self.write_rows(rows=rows)
+        rows = self.do_row_iter(rows=rows)
+        with self.profile_step(step="write"):
+            self.write_rows(rows=rows)
         del rows, row
         return row_return
 
@@ -140,3 +148,6 @@ class Json(ExportMixins):
 
     CB_NAME: str = "json"
     """name for this callback"""
+
+    RESUME_SUPPORTED: bool = True
+    """exports can be checkpointed and resumed with get_generator resume"""
@@ -137,8 +137,9 @@ class JsonToCsv(Csv):
             row = json.loads(line.strip())
             rows = listify(row)
             rows = self.do_pre_row(rows=rows)
-            rows = self.do_row(rows=rows)
-            self.write_rows(rows=rows)
+            rows = self.do_row_iter(rows=rows)
+            with self.profile_step(step="write"):
+                self.write_rows(rows=rows)
             del rows, row, line
 
         self.echo(msg=f"Closing and deleting temporary file {self._temp_file.name!r}")
@@ -155,12 +156,19 @@ class JsonToCsv(Csv):
 
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_pre_row(rows=rows)
-        for row in rows:
-            value = json.dumps(row)
-            self._temp_file.file.write(f"{value}\n")
-            del row, value
+        with self.profile_step(step="write_temp"):
+            for row in rows:
+                value = json.dumps(row)
+                self._temp_file.file.write(f"{value}\n")
+                del row, value
 
         return row_return
 
     CB_NAME: str = "json_to_csv"
     """name for this callback"""
+
+    TRANSFORM_WORKERS_SUPPORTED: bool = False
+    """rows are transformed from the temp file in :meth:`stop`, not as they are fetched"""
+
+    RESUME_SUPPORTED: bool = False
+    """rows are buffered in a temp file until :meth:`stop`, so there is nothing to resume"""
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""Field profile export callbacks."""
+from typing import List, Union
+
+import tabulate
+
+from ...constants.api import PROFILE_PRECISION, PROFILE_TOP, TABLE_FORMAT
+from ...exceptions import ApiError
+from ...tools import listify
+from .base import ExportMixins
+from .base_aggregate import AGG_FORMATS, Aggregator, write_rows
+from .sketches import FrequentItems, HyperLogLog
+
+PROFILE_FORMATS: List[str] = AGG_FORMATS
+"""valid output formats for profile exports"""
+
+PROFILE_CAPACITY_FACTOR: int = 10
+"""counters to keep per top value reported, more counters make the counts of top values closer"""
+
+
+class FieldProfile:
+    """Fill rate, approximate distinct count, and most common values of a field.
+
+    Notes:
+        The values of a field in a row are de-duplicated before they are added (see
+        :meth:`Aggregator.get_values`), so for list fields and sub-fields of complex fields the
+        count of a top value is the number of rows that have it and ``values`` is the number of
+        distinct values per row summed over all rows.
+    """
+
+    def __init__(self, schema: dict, top: int = PROFILE_TOP, precision: int = PROFILE_PRECISION):
+        """Profile of a field.
+
+        Args:
+            schema: field schema of the field
+            top: number of most common values to report
+            precision: precision of :obj:`HyperLogLog` for the distinct count
+        """
+        self.schema: dict = schema
+        self.name: str = schema["name_qual"]
+        self.top: int = max(0, top or 0)
+        self.rows: int = 0
+        self.filled: int = 0
+        self.values: int = 0
+        self.distinct: HyperLogLog = HyperLogLog(precision=precision)
+        self.frequent: FrequentItems = FrequentItems(capacity=self.top * PROFILE_CAPACITY_FACTOR)
+
+    def add(self, row: dict):
+        """Add the values of this field in a row.
+
+        Args:
+            row: row to add
+        """
+        self.rows += 1
+        values = Aggregator.get_values(row=row, field=self.name)
+        if not values:
+            return
+
+        self.filled += 1
+        self.values += len(values)
+        for value in values:
+            self.distinct.add(value=value)
+            if self.top:
+                self.frequent.add(value=value)
+
+    def get_result(self, fmt: str = "table") -> dict:
+        """Get the report row for this field.
+
+        Args:
+            fmt: output format, top values are a list of dicts for json or a str otherwise
+        """
+        top = self.frequent.get_top(top=self.top) if self.top else []
+        if fmt == "json":
+            top = [{"value": value, "count": count} for value, count in top]
+        else:
+            top = ", ".join(f"{value} ({count})" for value, count in top)
+
+        return {
+            "field": self.name,
+            "title": self.schema.get("column_title"),
+            "type": self.schema.get("type_norm"),
+            "rows": self.rows,
+            "filled": self.filled,
+            "fill_rate": round(self.filled / self.rows * 100, 2) if self.rows else 0.0,
+            "values": self.values,
+            "distinct": min(self.distinct.count(), self.values),
+            "top": top,
+        }
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, rows={self.rows}, "
+            f"filled={self.filled})"
+        )
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
+
+
+class Profile(ExportMixins):
+    """Callbacks for profiling the values of the fields of asset data.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Profile the default fields of devices and print the report as a table to STDOUT.
+
+            >>> assets = apiobj.get(export="profile")
+
+            Profile some fields with the 10 most common values of each, and export the report
+            to a JSON file.
+
+            >>> assets = apiobj.get(
+            ...     export="profile",
+            ...     export_file="profile.json",
+            ...     fields=["hostname", "os.type", "network_interfaces"],
+            ...     profile_top=10,
+            ...     profile_format="json",
+            ... )
+
+            The report is also kept in the STORE of the callbacks object.
+
+            >>> apiobj.LAST_CALLBACKS.STORE["profile"]
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            Each selected field, and each sub-field of selected complex fields, gets a row in
+            the report with the number of rows that have a value for it (``filled`` and
+            ``fill_rate`` as a percent), the approximate number of distinct values, and the
+            approximate counts of its most common values. See :obj:`FieldProfile`.
+
+            Rows are not kept or returned. Distinct values are counted with
+            :obj:`HyperLogLog` and common values with :obj:`FrequentItems`, so memory is
+            constant per field no matter how many rows or distinct values there are.
+            ``profile_precision`` sets the accuracy and size of the distinct counts.
+
+            This callbacks object forces the following arguments to False in order to keep the
+            values of fields intact: ``field_titles``, ``field_flatten``, ``field_join``,
+            ``field_compress``
+
+            These arguments can be supplied as extra kwargs passed to
+            :meth:`axonius_api_client.api.assets.users.Users.get` or
+            :meth:`axonius_api_client.api.assets.devices.Devices.get`
+
+        """
+        args = {}
+        args.update(cls.args_map_export())
+        args.update(
+            {
+                "profile_top": PROFILE_TOP,
+                "profile_precision": PROFILE_PRECISION,
+                "profile_format": "table",
+                "table_format": TABLE_FORMAT,
+            }
+        )
+        return args
+
+    def _init(self, **kwargs):
+        """Override arguments to keep the values of fields intact."""
+        self.set_arg_value("field_titles", False)
+        self.set_arg_value("field_flatten", False)
+        self.set_arg_value("field_join", False)
+        self.set_arg_value("field_compress", False)
+
+        profile_format = self.get_arg_value("profile_format") or "table"
+        if profile_format not in PROFILE_FORMATS:
+            msg = f"Invalid profile_format {profile_format!r}, valids: {PROFILE_FORMATS}"
+            self.echo(msg=msg, error=ApiError, level="error")
+        self.set_arg_value("profile_format", profile_format)
+
+        table_format = self.get_arg_value("table_format") or TABLE_FORMAT
+        if table_format not in tabulate.tabulate_formats:
+            fmts = ", ".join(tabulate.tabulate_formats)
+            msg = f"{table_format!r} is not a valid table format, must be one of {fmts}"
+            self.echo(msg=msg, error=ApiError, level="error")
+        self.set_arg_value("table_format", table_format)
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Profile, self).start(**kwargs)
+        top = self.get_arg_value("profile_top")
+        precision = self.get_arg_value("profile_precision") or PROFILE_PRECISION
+        try:
+            self._profiles: List[FieldProfile] = [
+                FieldProfile(schema=schema, top=top, precision=precision)
+                for schema in self.get_profile_schemas()
+            ]
+        except ApiError as exc:
+            self.echo(msg=str(exc), error=ApiError, level="error")
+        self.open_fd()
+
+    def get_profile_schemas(self) -> List[dict]:
+        """Get the schemas of the fields to profile, sub-fields in place of complex fields."""
+        schemas = []
+        for schema in self.final_schemas:
+            if schema.get("is_complex"):
+                schemas += list(self.get_sub_schemas(schema=schema))
+            else:
+                schemas.append(schema)
+        return schemas
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Profile, self).stop(**kwargs)
+        profiles = getattr(self, "_profiles", None)
+        if profiles is None:
+            return
+
+        profile_format = self.get_arg_value("profile_format")
+        results = [x.get_result(fmt=profile_format) for x in profiles]
+        self.STORE["profile"] = results
+        rows = profiles[0].rows if profiles else 0
+        self.echo(msg=f"Profiled {len(profiles)} fields of {rows} rows")
+
+        with self.profile_step(step="write"):
+            write_rows(
+                fd=self._fd,
+                rows=results,
+                fmt=profile_format,
+                table_format=self.get_arg_value("table_format"),
+                columns=["field"],
+            )
+        self.close_fd()
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Process the callbacks for current row.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+        for row in self.do_row_iter(rows=rows):
+            for field_profile in self._profiles:
+                field_profile.add(row=row)
+        del rows, row
+        return []
+
+    CB_NAME: str = "profile"
+    """name for this callback"""
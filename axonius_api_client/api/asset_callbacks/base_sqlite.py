@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""SQLite export callbacks class."""
+import json
+import re
+import sqlite3
+from typing import Dict, List, Union
+
+from ...exceptions import ApiError
+from ...tools import listify
+from .base import ExportMixins
+
+
+class Sqlite(ExportMixins):
+    """Callbacks for formatting asset data and exporting it to a SQLite database.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Export the output to a database file in the default path
+            :attr:`axonius_api_client.setup_env.DEFAULT_PATH`. ``export_file`` is required,
+            this export can not write to STDOUT or a file descriptor.
+
+            >>> assets = apiobj.get(export="sqlite", export_file="test.db")
+
+            Export the output to an absolute path file (ignoring ``export_path``) and overwrite
+            the file if it exists.
+
+            >>> assets = apiobj.get(
+            ...     export="sqlite",
+            ...     export_file="/tmp/output.db",
+            ...     export_overwrite=True,
+            ... )
+
+            Use 'assets' as the name of the root table instead of the asset type.
+
+            >>> assets = apiobj.get(export="sqlite", export_file="test.db", sqlite_table="assets")
+
+            Query the output, joining the root table to the table of a complex field.
+
+            >>> import sqlite3
+            >>> db = sqlite3.connect("test.db")
+            >>> db.execute(
+            ...     'SELECT d."specific_data.data.hostname", n.mac FROM devices d '
+            ...     "JOIN devices_network_interfaces n USING (internal_axon_id)"
+            ... ).fetchall()
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            The root table has a column for each simple field, and each complex field gets
+            its own table named ``{sqlite_table}_{field name}`` with one row per item of the
+            complex field, keyed by ``internal_axon_id`` and ``item_index``. Column types come
+            from the ``type_norm`` of the field schemas, and multi-value fields are stored as
+            JSON. Each page of rows is inserted in a single transaction and indexes on
+            ``internal_axon_id`` are created when the export finishes.
+
+            If ``export_schema`` is True, a ``_schema`` table is created that maps each
+            table and column to its field name, title, and type.
+
+            This callbacks object forces the following arguments to False in order to keep
+            complex fields intact for their tables: ``field_flatten``, ``field_join``
+
+            These arguments can be supplied as extra kwargs passed to
+            :meth:`axonius_api_client.api.assets.users.Users.get` or
+            :meth:`axonius_api_client.api.assets.devices.Devices.get`
+
+        """
+        args = {}
+        args.update(cls.args_map_export())
+        args.update({"sqlite_table": None})
+        return args
+
+    def _init(self, **kwargs):
+        """Override arguments to keep complex fields intact."""
+        self.set_arg_value("field_flatten", False)
+        self.set_arg_value("field_join", False)
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Sqlite, self).start(**kwargs)
+        self.do_start(**kwargs)
+
+    def do_start(self, **kwargs):
+        """Create the database and the tables for the selected fields."""
+        if not self.arg_export_file:
+            self.echo(
+                msg="Must supply export_file for this export method", error=ApiError, level="error"
+            )
+
+        self.open_fd_path()
+        self._fd.close()
+
+        self._db = sqlite3.connect(str(self._file_path))
+        self._tables: Dict[str, Dict[str, str]] = {}
+        self._children: Dict[str, dict] = {}
+        self._pending: Dict[str, List[dict]] = {}
+        self._schema_rows: List[tuple] = []
+
+        self._root = self.get_arg_value("sqlite_table") or self.APIOBJ.ASSET_TYPE
+        self._axid_column = "internal_axon_id"
+        root_columns = {}
+
+        for column, schema in zip(self.final_columns, self.final_schemas):
+            if schema["name_qual"] == "internal_axon_id":
+                self._axid_column = column
+
+            if schema["is_complex"]:
+                self._create_child(column=column, schema=schema)
+            else:
+                root_columns[column] = self.get_column_type(schema=schema)
+                self._schema_rows.append((self._root, column, schema))
+
+        root_columns.setdefault(self._axid_column, "TEXT")
+        self._create_table(table=self._root, columns=root_columns)
+
+    def _create_child(self, column: str, schema: dict):
+        """Create the table for a complex field.
+
+        Args:
+            column: column name of the complex field in rows
+            schema: schema of the complex field
+        """
+        table = f"{self._root}_{schema['name']}"
+        if table in self._tables:
+            table = f"{self._root}_{re.sub(r'[^a-zA-Z0-9]+', '_', schema['name_qual'])}"
+
+        columns = {"internal_axon_id": "TEXT", "item_index": "INTEGER"}
+        for sub_schema in self.get_sub_schemas(schema=schema):
+            columns[sub_schema["name"]] = self.get_column_type(schema=sub_schema)
+            self._schema_rows.append((table, sub_schema["name"], sub_schema))
+
+        self._children[column] = {"table": table, "schema": schema}
+        self._create_table(table=table, columns=columns)
+
+    def _create_table(self, table: str, columns: Dict[str, str]):
+        """Create a table.
+
+        Args:
+            table: name of table
+            columns: map of column name to column type
+        """
+        cols = ", ".join([f"{self.quote(k)} {v}" for k, v in columns.items()])
+        self._db.execute(f"CREATE TABLE {self.quote(table)} ({cols})")
+        self._tables[table] = dict(columns)
+        self._pending[table] = []
+
+    def _add_columns(self, table: str, row: dict):
+        """Add columns to a table for any keys in a row that the table does not have.
+
+        Args:
+            table: name of table
+            row: row to be inserted into table
+        """
+        columns = self._tables[table]
+        for key in row:
+            if key not in columns:
+                self._db.execute(f"ALTER TABLE {self.quote(table)} ADD COLUMN {self.quote(key)}")
+                columns[key] = ""
+
+    def process_page(self, rows: List[dict]):
+        """Insert the rows of the previous page before processing a new page.
+
+        Args:
+            rows: source rows of the page
+        """
+        self.do_commit()
+        super(Sqlite, self).process_page(rows=rows)
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Process the callbacks for current row.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row_iter(rows=rows)
+        with self.profile_step(step="write"):
+            self.write_rows(rows=rows)
+        del rows, row
+        return row_return
+
+    def write_rows(self, rows: Union[List[dict], dict]):
+        """Queue rows to be inserted into the root table and the tables of complex fields.
+
+        Args:
+            rows: rows to process
+        """
+        for row in listify(rows):
+            axid = row.get(self._axid_column)
+
+            for column, child in self._children.items():
+                items = listify(row.pop(column, None))
+                table = child["table"]
+                for idx, item in enumerate(items):
+                    item = item if isinstance(item, dict) else {"value": item}
+                    item = {k: self.to_value(v) for k, v in item.items()}
+                    item.update({"internal_axon_id": axid, "item_index": idx})
+                    self._pending[table].append(item)
+
+            self._pending[self._root].append({k: self.to_value(v) for k, v in row.items()})
+
+    def do_commit(self):
+        """Insert the queued rows of each table in a single transaction."""
+        if not any(self._pending.values()):
+            return
+
+        with self._db:
+            for table, rows in self._pending.items():
+                if not rows:
+                    continue
+                for row in rows:
+                    self._add_columns(table=table, row=row)
+
+                columns = list(self._tables[table])
+                cols = ", ".join([self.quote(x) for x in columns])
+                marks = ", ".join(["?"] * len(columns))
+                self._db.executemany(
+                    f"INSERT INTO {self.quote(table)} ({cols}) VALUES ({marks})",
+                    [tuple(row.get(x) for x in columns) for row in rows],
+                )
+                self._pending[table] = []
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Sqlite, self).stop(**kwargs)
+        self.do_stop(**kwargs)
+
+    def do_stop(self, **kwargs):
+        """Insert any queued rows, create indexes, and close the database."""
+        self.do_commit()
+        with self._db:
+            for table in self._tables:
+                column = self._axid_column if table == self._root else "internal_axon_id"
+                index = self.quote(f"idx_{table}_internal_axon_id")
+                self._db.execute(
+                    f"CREATE INDEX {index} ON {self.quote(table)} ({self.quote(column)})"
+                )
+            self.do_export_schema()
+        self._db.close()
+        self.echo(msg=f"Finished exporting to {self._fd_info}")
+
+    def do_export_schema(self):
+        """Add a table mapping each table and column to its field schema."""
+        if not self.get_arg_value("export_schema"):
+            return
+
+        keys = ["name_qual", "column_title", "type_norm"]
+        self._db.execute(
+            'CREATE TABLE "_schema" (table_name TEXT, column_name TEXT, field_name TEXT, '
+            "column_title TEXT, type_norm TEXT)"
+        )
+        self._db.executemany(
+            'INSERT INTO "_schema" VALUES (?, ?, ?, ?, ?)',
+            [(t, c, *[s.get(k) for k in keys]) for t, c, s in self._schema_rows],
+        )
+
+    def get_column_type(self, schema: dict) -> str:
+        """Get the SQLite column type for a field schema.
+
+        Args:
+            schema: field schema
+        """
+        type_norm = schema.get("type_norm") or ""
+        if type_norm.startswith("array"):
+            return "TEXT"
+        return self.SQLITE_TYPES.get(type_norm, "TEXT")
+
+    @staticmethod
+    def to_value(value):
+        """Convert a value to a type that SQLite can store.
+
+        Args:
+            value: value to convert
+        """
+        if isinstance(value, (list, dict)):
+            return json.dumps(value)
+        return value
+
+    @staticmethod
+    def quote(value: str) -> str:
+        """Quote a table or column name.
+
+        Args:
+            value: name to quote
+        """
+        value = str(value).replace('"', '""')
+        return f'"{value}"'
+
+    CB_NAME: str = "sqlite"
+    """name for this callback"""
+
+    SQLITE_TYPES: Dict[str, str] = {
+        "integer": "INTEGER",
+        "number": "REAL",
+        "boolean": "INTEGER",
+    }
+    """map of field schema type_norm to SQLite column type, anything else is TEXT"""
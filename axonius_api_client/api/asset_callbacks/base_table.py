@@ -132,15 +132,16 @@ class Table(ExportMixins):
         tablefmt = self.get_arg_value("table_format") or TABLE_FORMAT
         rows = getattr(self, "_rows", [])
 
-        table = tabulate.tabulate(
-            tabular_data=rows,
-            tablefmt=tablefmt,
-            showindex=False,
-            headers="keys",
-        )
-
-        self._fd.write(table)
-        self._fd.write("\n")
+        with self.profile_step(step="write"):
+            table = tabulate.tabulate(
+                tabular_data=rows,
+                tablefmt=tablefmt,
+                showindex=False,
+                headers="keys",
+            )
+
+            self._fd.write(table)
+            self._fd.write("\n")
         self.close_fd()
 
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
@@ -154,16 +154,17 @@ class Xlsx(ExportMixins):
         rows = self.do_pre_row(rows=rows)
 
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
-        rows = self.do_row(rows=rows)
+        rows = self.do_row_iter(rows=rows)
 
-        for row in listify(rows):
-            for idx, column_name in enumerate(self.final_columns):
-                self._worksheet.write(
-                    self._rowtracker, idx, row.get(column_name), self._cell_format
-                )
+        with self.profile_step(step="write"):
+            for row in listify(rows):
+                for idx, column_name in enumerate(self.final_columns):
+                    self._worksheet.write(
+                        self._rowtracker, idx, row.get(column_name), self._cell_format
+                    )
 
-            self._rowtracker += 1
-            del row
+                self._rowtracker += 1
+                del row
 
         del rows
 
@@ -103,7 +103,8 @@ class Xml(ExportMixins):
 
         asset_type = self.APIOBJ.__class__.__name__.lower()
         xml_obj = {"assets": {asset_type: rows}}
-        self._xmltodict.unparse(xml_obj, output=self._fd, pretty=True)
+        with self.profile_step(step="write"):
+            self._xmltodict.unparse(xml_obj, output=self._fd, pretty=True)
         self.close_fd()
 
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Timing profile for callbacks."""
+import contextlib
+import time
+from typing import Any, Dict, Generator, Iterable, List
+
+import tabulate
+
+
+class CallbacksProfile:
+    """Accumulate the count, total, and max seconds taken by each step of a fetch.
+
+    Notes:
+        Steps can be nested, and the time a step spends in nested steps is not counted
+        against it. An exporter writing rows from :meth:`Base.do_row_iter` runs callbacks
+        while it writes, so its write step only counts the time spent writing.
+    """
+
+    def __init__(self):
+        """Callbacks timing profile."""
+        self.steps: Dict[str, List[float]] = {}
+        self._nested: List[float] = []
+
+    def start(self) -> float:
+        """Start timing a step."""
+        self._nested.append(0.0)
+        return time.perf_counter()
+
+    def stop(self, step: str, started: float):
+        """Stop timing a step and add the time it took, minus any nested steps.
+
+        Args:
+            step: name of step
+            started: return from :meth:`start`
+        """
+        took = time.perf_counter() - started
+        nested = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += took
+        self.add(step=step, seconds=took - nested)
+
+    @contextlib.contextmanager
+    def step(self, step: str) -> Generator[None, None, None]:
+        """Time a step.
+
+        Args:
+            step: name of step
+        """
+        started = self.start()
+        try:
+            yield
+        finally:
+            self.stop(step=step, started=started)
+
+    def step_iter(self, step: str, items: Iterable) -> Generator[Any, None, None]:
+        """Time each item pulled from an iterable.
+
+        Args:
+            step: name of step
+            items: iterable to time
+        """
+        items = iter(items)
+        while True:
+            started = self.start()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            finally:
+                self.stop(step=step, started=started)
+            yield item
+
+    def add(self, step: str, seconds: float):
+        """Add the time a step took.
+
+        Args:
+            step: name of step
+            seconds: seconds the step took
+        """
+        item = self.steps.get(step)
+        if item is None:
+            self.steps[step] = [1, seconds, seconds]
+        else:
+            item[0] += 1
+            item[1] += seconds
+            if seconds > item[2]:
+                item[2] = seconds
+
+    @property
+    def total_seconds(self) -> float:
+        """Get the total seconds taken by all steps."""
+        return sum(x[1] for x in self.steps.values())
+
+    def report(self) -> List[dict]:
+        """Get the timing of each step, slowest total first."""
+        whole = self.total_seconds
+        rows = []
+        for step, (count, total, most) in self.steps.items():
+            rows.append(
+                {
+                    "step": step,
+                    "count": count,
+                    "total_seconds": total,
+                    "max_seconds": most,
+                    "avg_seconds": total / count if count else 0.0,
+                    "percent": 100 * total / whole if whole else 0.0,
+                }
+            )
+        return sorted(rows, key=lambda x: x["total_seconds"], reverse=True)
+
+    def __str__(self) -> str:
+        """Show the timing of each step as a table."""
+        return tabulate.tabulate(
+            tabular_data=self.report(),
+            headers="keys",
+            tablefmt="simple",
+            floatfmt=".4f",
+            showindex=False,
+        )
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return f"{self.__class__.__name__}(steps={len(self.steps)})"
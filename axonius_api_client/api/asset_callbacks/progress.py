@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Throughput and ETA tracking for asset fetches."""
+import collections
+import datetime
+import time
+from typing import Optional
+
+from ...constants.api import PROGRESS_WINDOW
+from ...tools import calc_percent
+
+
+class FetchProgress:
+    """Track throughput and ETA of an asset fetch from the paging state of get_generator.
+
+    Notes:
+        Rates are calculated over a moving window of the last N pages, so a fetch that
+        stalls shows its rate dropping instead of being averaged away by the pages that
+        came before it. Time that is not spent waiting on the API for pages is counted
+        as process time (running callbacks, writing exports, and consuming rows).
+    """
+
+    def __init__(self, window: int = PROGRESS_WINDOW):
+        """Throughput and ETA tracker.
+
+        Args:
+            window: number of pages to calculate rows/sec and bytes/sec over
+        """
+        self.window: int = max(1, window or 1)
+        self.samples: collections.deque = collections.deque(maxlen=self.window + 1)
+        self.start_time: float = time.monotonic()
+        self.samples.append((self.start_time, 0, 0))
+        self.event: dict = {}
+
+    def update(self, state: dict, done: bool = False) -> dict:
+        """Add a sample from the paging state and build a progress event.
+
+        Args:
+            state: paging state from get_generator
+            done: fetch has finished
+        """
+        now = time.monotonic()
+        rows_fetched = state.get("rows_fetched_total", 0) or 0
+        bytes_fetched = state.get("bytes_fetched_total", 0) or 0
+        rows_total = state.get("rows_to_fetch_total", 0) or 0
+        max_rows = state.get("max_rows", 0) or 0
+
+        if max_rows and (not rows_total or max_rows < rows_total):
+            rows_total = max_rows
+
+        if not done:
+            self.samples.append((now, rows_fetched, bytes_fetched))
+
+        first_time, first_rows, first_bytes = self.samples[0]
+        last_time, last_rows, last_bytes = self.samples[-1]
+        window_seconds = last_time - first_time
+
+        rows_per_sec = (last_rows - first_rows) / window_seconds if window_seconds else 0.0
+        bytes_per_sec = (last_bytes - first_bytes) / window_seconds if window_seconds else 0.0
+
+        rows_left = max(0, rows_total - rows_fetched)
+        eta_seconds = rows_left / rows_per_sec if rows_per_sec and not done else 0.0
+
+        seconds_elapsed = now - self.start_time
+        seconds_fetch = state.get("fetch_seconds_total", 0) or 0
+        seconds_process = max(0.0, seconds_elapsed - seconds_fetch)
+
+        self.event = {
+            "done": done,
+            "page_number": state.get("page_number", 0) or 0,
+            "pages_total": state.get("pages_to_fetch_total", 0) or 0,
+            "rows_fetched": rows_fetched,
+            "rows_processed": state.get("rows_processed_total", 0) or 0,
+            "rows_total": rows_total,
+            "rows_left": rows_left,
+            "percent": calc_percent(part=rows_fetched, whole=rows_total),
+            "rows_per_sec": rows_per_sec,
+            "bytes_fetched": bytes_fetched,
+            "bytes_per_sec": bytes_per_sec,
+            "seconds_elapsed": seconds_elapsed,
+            "seconds_fetch": seconds_fetch,
+            "seconds_process": seconds_process,
+            "eta_seconds": eta_seconds,
+        }
+        return self.event
+
+    @staticmethod
+    def render(event: dict, width: int = 30) -> str:
+        """Render a progress event as a single line progress bar.
+
+        Args:
+            event: event from :meth:`update`
+            width: number of characters to use for the bar itself
+        """
+        percent = min(100.0, max(0.0, event["percent"]))
+        filled = int(width * percent / 100)
+        bar = f"[{'#' * filled}{'-' * (width - filled)}]"
+
+        elapsed = event["seconds_elapsed"] or 0
+        fetch_pct = calc_percent(part=event["seconds_fetch"], whole=elapsed) if elapsed else 0
+        process_pct = 100 - fetch_pct if elapsed else 0
+
+        rows = f"{event['rows_fetched']}/{event['rows_total']} rows"
+        rate = f"{event['rows_per_sec']:.1f} rows/s"
+        mbps = f"{event['bytes_per_sec'] / 1024 / 1024:.2f} MB/s"
+        split = f"fetch {fetch_pct:.0f}% / process {process_pct:.0f}%"
+
+        if event["done"]:
+            eta = f"took {format_seconds(elapsed)}"
+        else:
+            eta = f"ETA {format_seconds(event['eta_seconds'])}"
+
+        return f"{bar} {percent:6.2f}% {rows} | {rate} | {mbps} | {split} | {eta}"
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return f"{self.__class__.__name__}(window={self.window})"
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
+
+
+def format_seconds(value: Optional[float]) -> str:
+    """Format seconds as H:MM:SS.
+
+    Args:
+        value: seconds to format
+    """
+    return str(datetime.timedelta(seconds=int(value or 0)))
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""Process pool transform stage for callbacks."""
+import collections
+import concurrent.futures
+import logging
+import pickle
+from typing import List, Optional, Union
+
+from ...exceptions import ApiError
+from ...tools import listify
+
+WORKER_CALLBACKS = None
+"""callbacks object rebuilt once in each worker process by :func:`worker_init`"""
+
+PLAN_CACHE: List[str] = [
+    "_fields_selected",
+    "_schemas_selected",
+    "_excluded_schemas",
+    "_final_schemas",
+    "_schema_to_explode",
+    "_field_replacements",
+    "_adapter_map",
+    "_software_whitelist",
+]
+"""resolved attributes of a callbacks object that are shipped to each worker process"""
+
+PLAN_SKIP_ARGS: List[str] = [
+    "export_fd",
+    "transform_workers",
+    "progress_cb",
+    "debug_profile",
+]
+"""GETARGS that are never shipped to worker processes"""
+
+
+def get_plan(callbacks) -> bytes:
+    """Resolve the schemas of a callbacks object and pickle them for worker processes.
+
+    Args:
+        callbacks (:obj:`axonius_api_client.api.asset_callbacks.base.Base`): callbacks object
+            to build plan from
+    """
+    callbacks.schemas_selected
+    callbacks.excluded_schemas
+    callbacks.final_schemas
+    callbacks.schema_to_explode
+    callbacks.field_replacements
+
+    if callbacks.get_arg_value("report_adapters_missing"):
+        callbacks.adapter_map
+
+    if callbacks.get_arg_value("report_software_whitelist"):
+        callbacks.software_whitelist
+
+    getargs = {k: v for k, v in callbacks.GETARGS.items() if k not in PLAN_SKIP_ARGS}
+    getargs["do_echo"] = False
+
+    plan = {
+        "cls": callbacks.__class__,
+        "log": callbacks.LOG.name,
+        "getargs": getargs,
+        "store": callbacks.STORE,
+        "cache": {k: getattr(callbacks, k) for k in PLAN_CACHE if hasattr(callbacks, k)},
+    }
+    return pickle.dumps(plan)
+
+
+def worker_init(plan: bytes):
+    """Rebuild the callbacks object from a plan in a worker process.
+
+    Args:
+        plan: pickled plan from :func:`get_plan`
+    """
+    global WORKER_CALLBACKS
+
+    plan = pickle.loads(plan)
+    cls = plan["cls"]
+
+    callbacks = cls.__new__(cls)
+    callbacks.LOG = logging.getLogger(plan["log"])
+    callbacks.STATE = {}
+    callbacks.STORE = plan["store"]
+    callbacks.CURRENT_ROWS = []
+    callbacks.GETARGS = plan["getargs"]
+    callbacks.TAG_IDS_ADD = {}
+    callbacks.TAG_IDS_REMOVE = {}
+    callbacks.CUSTOM_CB_EXC = []
+
+    for key, value in plan["cache"].items():
+        setattr(callbacks, key, value)
+
+    WORKER_CALLBACKS = callbacks
+
+
+def worker_run(rows: List[dict]) -> List[dict]:
+    """Run the callbacks for a chunk of rows in a worker process.
+
+    Args:
+        rows: source rows to process
+
+    Returns:
+        one result per source row, in the same order as rows
+    """
+    callbacks = WORKER_CALLBACKS
+    results = []
+
+    for row in rows:
+        callbacks.TAG_IDS_ADD = {}
+        callbacks.TAG_IDS_REMOVE = {}
+        callbacks.CUSTOM_CB_EXC = []
+        callbacks.CURRENT_ROWS = [row]
+
+        new_rows = list(callbacks.do_row_iter(rows=[row]))
+
+        custom_cb_exc = []
+        for item in callbacks.CUSTOM_CB_EXC:
+            try:
+                pickle.dumps(item["exc"])
+            except Exception:
+                item["exc"] = ApiError(item["msg"])
+            custom_cb_exc.append(item)
+
+        results.append(
+            {
+                "id": row.get("internal_axon_id"),
+                "rows": new_rows,
+                "tag_ids_add": list(callbacks.TAG_IDS_ADD),
+                "tag_ids_remove": list(callbacks.TAG_IDS_REMOVE),
+                "custom_cb_exc": custom_cb_exc,
+            }
+        )
+    return results
+
+
+class TransformPool:
+    """Run the callbacks for pages of rows across worker processes.
+
+    Notes:
+        Each page is split into chunks of rows that are transformed in parallel by the worker
+        processes as soon as the page is fetched. The next page is not fetched until every row
+        of the current page has been handed back, so the workers speed up the callbacks of a
+        page but do not overlap them with fetching the next page. Results are handed back in
+        the same order the rows were submitted, and :meth:`pop` checks that the result is for
+        the row being processed. The worker processes are started on the first call to
+        :meth:`pop`, after the callbacks object has resolved its selected fields from the
+        first row.
+
+        Callbacks objects in worker processes have no API object (``APIOBJ`` is None) and any
+        state they change is not sent back other than tags to add or remove and errors from
+        custom callbacks, so :attr:`axonius_api_client.api.asset_callbacks.base.Base.
+        transform_pool` runs the callbacks in-process if ``custom_cbs`` or ``join`` are set.
+    """
+
+    def __init__(self, callbacks, workers: int, chunk_size: int):
+        """Process pool transform stage.
+
+        Args:
+            callbacks (:obj:`axonius_api_client.api.asset_callbacks.base.Base`): callbacks
+                object that owns this pool
+            workers: number of worker processes
+            chunk_size: number of rows to send to a worker at a time
+        """
+        self.callbacks = callbacks
+        self.workers: int = workers
+        self.chunk_size: int = max(1, chunk_size or 1)
+        self.executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self.disabled: bool = False
+        self.waiting: List[dict] = []
+        self.futures: collections.deque = collections.deque()
+        self.results: collections.deque = collections.deque()
+
+    def submit(self, rows: List[dict]):
+        """Queue a page of rows to be transformed.
+
+        Args:
+            rows: source rows to process
+        """
+        if self.disabled:
+            return
+
+        rows = listify(rows)
+        if self.executor is None:
+            self.waiting += rows
+        else:
+            self._submit(rows=rows)
+
+    def _submit(self, rows: List[dict]):
+        for idx in range(0, len(rows), self.chunk_size):
+            chunk = rows[slice(idx, idx + self.chunk_size)]
+            self.futures.append(self.executor.submit(worker_run, chunk))
+
+    def start(self) -> bool:
+        """Start the worker processes and submit any rows queued before they were started."""
+        try:
+            plan = get_plan(callbacks=self.callbacks)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            self.callbacks.echo(
+                msg=f"Unable to ship callbacks to worker processes, running in-process: {exc}",
+                warning=True,
+            )
+            self.disabled = True
+            self.waiting = []
+            return False
+
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, initializer=worker_init, initargs=(plan,)
+        )
+        self.callbacks.echo(msg=f"Started {self}")
+
+        waiting, self.waiting = self.waiting, []
+        self._submit(rows=waiting)
+        return True
+
+    def pop(self, rows: Union[List[dict], dict]) -> Optional[List[dict]]:
+        """Get the transformed rows for source rows, or None if nothing is queued.
+
+        Args:
+            rows: source rows being processed, which must be the next rows submitted
+
+        Raises:
+            :exc:`ApiError`: if the next result queued is not for rows
+        """
+        if self.disabled:
+            return None
+
+        if self.executor is None and (not self.waiting or not self.start()):
+            return None
+
+        if not self.results and not self.futures:
+            return None
+
+        transformed = []
+        for row in listify(rows):
+            if not self.results and self.futures:
+                self.results.extend(self.futures.popleft().result())
+
+            result = self.results.popleft() if self.results else {"id": None}
+            row_id = row.get("internal_axon_id") if isinstance(row, dict) else None
+            if "rows" not in result or result["id"] != row_id:
+                raise ApiError(
+                    f"Transformed row for internal_axon_id {result['id']!r} does not match row "
+                    f"being processed {row_id!r}, rows must be processed in the order they were "
+                    "submitted by process_page"
+                )
+
+            self.callbacks.TAG_IDS_ADD.update(dict.fromkeys(result["tag_ids_add"]))
+            self.callbacks.TAG_IDS_REMOVE.update(dict.fromkeys(result["tag_ids_remove"]))
+
+            for item in result["custom_cb_exc"]:
+                self.callbacks.CUSTOM_CB_EXC.append(item)
+                self.callbacks.echo(msg=item["msg"], error="exception", abort=False)
+
+            transformed += result["rows"]
+        return transformed
+
+    def close(self):
+        """Discard any rows that were not consumed and stop the worker processes."""
+        for future in self.futures:
+            future.cancel()
+
+        self.futures.clear()
+        self.results.clear()
+        self.waiting = []
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return f"{self.__class__.__name__}(workers={self.workers}, chunk_size={self.chunk_size})"
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
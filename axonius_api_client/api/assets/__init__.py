@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 """APIs for working with assets, saved queries, fields, and tags."""
 from .asset_mixin import AssetMixin
+from .by_ids import AssetsByIds
+from .checkpoint import ExportCheckpoint
 from .devices import Devices
+from .fetch_plan import FetchPlan
 from .fields import Fields
+from .history_diff import HistoryDiff
+from .join import AssetJoin
 from .labels import Labels
+from .memory import MemoryBudget
+from .mirror import AssetMirror
+from .multi import MultiAssetFetch
 from .runner import Runner
 from .saved_query import SavedQuery
 from .users import Users
@@ -18,4 +26,12 @@ __all__ = (
     "Labels",
     "Vulnerabilities",
     "Runner",
+    "FetchPlan",
+    "ExportCheckpoint",
+    "AssetMirror",
+    "MultiAssetFetch",
+    "HistoryDiff",
+    "MemoryBudget",
+    "AssetJoin",
+    "AssetsByIds",
 )
@@ -1,23 +1,43 @@
 # -*- coding: utf-8 -*-
 """API model mixin for device and user assets."""
+import collections
+import concurrent.futures
+import dataclasses
 import datetime
 import pathlib
+import threading
 import time
 import types
 import typing as t
 
 import cachetools
 
-from ...constants.api import DEFAULT_CALLBACKS_CLS, MAX_PAGE_SIZE, PAGE_SIZE
+from ...constants.api import (
+    COUNT_WORKERS,
+    DEFAULT_CALLBACKS_CLS,
+    MAX_PAGE_SIZE,
+    PAGE_SIZE,
+    PAGE_TARGET_BYTES,
+    PAGE_TARGET_SECONDS,
+    QUERY_CHUNK_LENGTH,
+    QUERY_CHUNK_WORKERS,
+)
 from ...constants.fields import AXID
 from ...exceptions import ApiError, NotFoundError, ResponseNotOk, StopFetch
 from ...parsers.grabber import Grabber
 from ...tools import PathLike, dt_now, dt_now_file, get_subcls, json_dump, listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
+from ..asset_callbacks.base_aggregate import Aggregator, resolve_field
 from ..asset_callbacks.tools import get_callbacks_cls
 from ..mixins import ModelMixins
 from ..wizards import Wizard, WizardCsv, WizardText
+from .by_ids import AssetsByIds
+from .checkpoint import ExportCheckpoint
+from .fetch_plan import FetchPlan
+from .history_diff import HistoryDiff
+from .memory import MemoryBudget
+from .mirror import AssetMirror
 from .runner import ENFORCEMENT, Runner
 
 GEN_TYPE = t.Union[t.Generator[dict, None, None], t.List[dict]]
@@ -916,17 +936,12 @@ class AssetMixin(ModelMixins):
             date=history_date, days_ago=history_days_ago, exact=history_exact
         )
 
-        value = None
-
-        while value is None:
-            value = self._count(
-                filter=query,
-                history_date=history_date,
-                use_cache_entry=use_cache_entry,
-            ).value
-            use_cache_entry = True
-
-        return value
+        return self._count_value(
+            query=query,
+            history_date=history_date,
+            use_cache_entry=use_cache_entry,
+            saved_query_id=saved_query_id,
+        )
 
     def count_by_saved_query(self, name: str, **kwargs) -> int:
         """Get the count of assets for a query defined in a saved query.
@@ -949,6 +964,174 @@ class AssetMixin(ModelMixins):
         kwargs["saved_query_id"] = sq["id"]
         return self.count(**kwargs)
 
+    def count_many(
+        self,
+        queries: t.Optional[t.Union[t.List[str], t.Dict[str, str]]] = None,
+        saved_queries: t.Optional[t.List[str]] = None,
+        wiz_entries: t.Optional[t.Dict[str, t.Union[t.List[dict], t.List[str], dict, str]]] = None,
+        history_date: t.Optional[t.Union[str, datetime.timedelta, datetime.datetime]] = None,
+        history_days_ago: t.Optional[int] = None,
+        history_exact: bool = False,
+        use_cache_entry: bool = False,
+        max_workers: int = COUNT_WORKERS,
+        cache_ttl: int = 0,
+    ) -> t.Dict[str, dict]:
+        """Get the counts of assets for many queries at once.
+
+        Examples:
+            Get the counts of a few queries, keyed by the queries themselves
+
+            >>> counts = apiobj.count_many(queries=['hostname == "a"', 'hostname == "b"'])
+            >>> counts['hostname == "a"']["count"]
+            1
+
+            Get the counts of queries and saved queries under names of your own choosing,
+            caching each count for 60 seconds
+
+            >>> counts = apiobj.count_many(
+            ...     queries={"windows": '(specific_data.data.os.type == "Windows")'},
+            ...     saved_queries=["Managed Devices", "5f76721ce4557d5cba93f59e"],
+            ...     wiz_entries={"linux": "simple os.type equals Linux"},
+            ...     cache_ttl=60,
+            ... )
+            >>> {k: v["count"] for k, v in counts.items()}
+
+        Notes:
+            The history date is resolved once and the saved queries are looked up from a
+            single cached fetch of all saved queries, then up to max_workers counts are
+            requested at once. A query that can not be counted does not stop the others,
+            its ``error`` is set instead.
+
+            Each value of the returned dict has the keys ``count``, ``query``,
+            ``saved_query_id``, ``seconds`` (latency of the count request), ``cached``, and
+            ``error``.
+
+        Args:
+            queries: list of queries keyed by the queries themselves, or dict of names to
+                queries
+            saved_queries: names or UUIDs of saved queries, keyed by the supplied values
+            wiz_entries: dict of names to wizard expressions to create queries from
+            history_date: return asset counts for a given historical date
+            history_days_ago: return asset counts for a historical date N days ago
+            history_exact: the history date supplied must exist
+            use_cache_entry: allow the server to use cached counts
+            max_workers: number of count requests to have in flight at once
+            cache_ttl: seconds to keep counts in a cache on this object for later calls,
+                0 to not use the cache
+        """
+        history_date = self.get_history_date(
+            date=history_date, days_ago=history_days_ago, exact=history_exact
+        )
+
+        results = {}
+
+        def add(key, query=None, saved_query_id=None, error=None):
+            results[key] = {
+                "count": None,
+                "query": query,
+                "saved_query_id": saved_query_id,
+                "seconds": 0,
+                "cached": False,
+                "error": error,
+            }
+
+        queries = queries or {}
+        if not isinstance(queries, dict):
+            queries = {x: x for x in listify(queries)}
+
+        for key, query in queries.items():
+            add(key=key, query=query)
+
+        for key in listify(saved_queries):
+            try:
+                sq = self.saved_query.get_by_multi(sq=key, as_dataclass=True, cache=True)
+                add(key=key, query=sq.query, saved_query_id=sq.id)
+            except Exception as exc:
+                add(key=key, error=f"{type(exc).__name__}: {exc}")
+
+        for key, entries in (wiz_entries or {}).items():
+            try:
+                add(key=key, query=self.get_wiz_entries(wiz_entries=entries)["query"])
+            except Exception as exc:
+                add(key=key, error=f"{type(exc).__name__}: {exc}")
+
+        cache = self._get_count_cache(ttl=cache_ttl)
+        todo = {}
+        for key, result in results.items():
+            if result["error"]:
+                continue
+            cache_key = (result["query"], history_date)
+            if cache is not None and cache_key in cache:
+                result.update({"count": cache[cache_key], "cached": True})
+            else:
+                todo[key] = cache_key
+
+        def count_one(query):
+            start = time.monotonic()
+            try:
+                value = self._count_value(
+                    query=query, history_date=history_date, use_cache_entry=use_cache_entry
+                )
+                return {"count": value, "seconds": time.monotonic() - start}
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                return {"error": error, "seconds": time.monotonic() - start}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                pool.submit(count_one, query=results[key]["query"]): key for key in todo
+            }
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                results[key].update(future.result())
+                if results[key]["error"]:
+                    self.LOG.warning(f"Failed to get count for {key!r}: {results[key]['error']}")
+                elif cache is not None:
+                    cache[todo[key]] = results[key]["count"]
+
+        return results
+
+    def _get_count_cache(self, ttl: int = 0) -> t.Optional[cachetools.TTLCache]:
+        """Get the cache of counts used by :meth:`count_many` for a TTL.
+
+        Args:
+            ttl: seconds to keep counts in the cache, 0 to not use a cache
+        """
+        if not ttl:
+            return None
+
+        if ttl not in self.COUNT_CACHES:
+            self.COUNT_CACHES[ttl] = cachetools.TTLCache(maxsize=1024, ttl=ttl)
+        return self.COUNT_CACHES[ttl]
+
+    def _count_value(
+        self,
+        query: t.Optional[str] = None,
+        history_date: t.Optional[str] = None,
+        use_cache_entry: bool = False,
+        saved_query_id: t.Optional[str] = None,
+    ) -> int:
+        """Get the count of assets from a query, waiting for the count to be ready.
+
+        Args:
+            query: if supplied, only return the count of assets that match the query
+            history_date: resolved history date to get the count for
+            use_cache_entry: allow the server to use a cached count
+            saved_query_id: ID of the saved query to get the count of
+        """
+        value = None
+
+        while value is None:
+            value = self._count(
+                filter=query,
+                history_date=history_date,
+                use_cache_entry=use_cache_entry,
+                saved_query_id=saved_query_id,
+            ).value
+            use_cache_entry = True
+
+        return value
+
     def get(self, generator: bool = False, **kwargs) -> GEN_TYPE:
         r"""Get assets from a query.
 
@@ -1063,6 +1246,247 @@ class AssetMixin(ModelMixins):
             return self.history_dates_obj().get_date(date=date, days_ago=days_ago, exact=exact)
         return None
 
+    def get_fetch_plan(
+        self,
+        query: t.Optional[str] = None,
+        fields: t.Optional[t.Union[t.List[str], str]] = None,
+        fields_manual: t.Optional[t.Union[t.List[str], str]] = None,
+        fields_regex: t.Optional[t.Union[t.List[str], str]] = None,
+        fields_regex_root_only: bool = True,
+        fields_fuzzy: t.Optional[t.Union[t.List[str], str]] = None,
+        fields_default: bool = True,
+        fields_root: t.Optional[str] = None,
+        fields_error: bool = True,
+        sort_field: t.Optional[str] = None,
+        sort_descending: bool = False,
+        history_date: t.Optional[t.Union[str, datetime.timedelta, datetime.datetime]] = None,
+        history_days_ago: t.Optional[int] = None,
+        history_exact: bool = False,
+        wiz_entries: t.Optional[t.Union[t.List[dict], t.List[str], dict, str]] = None,
+        saved_query_id: t.Optional[str] = None,
+        expressions: t.Optional[t.List[dict]] = None,
+        count: bool = False,
+        **kwargs,
+    ) -> FetchPlan:
+        """Resolve the preflight of a query once, to reuse it for any number of fetches.
+
+        Examples:
+            Compile a plan, save it, and use it for a fetch
+
+            >>> plan = apiobj.get_fetch_plan(query='hostname == "test"', fields=["os.type"])
+            >>> plan.save("test.json")
+            >>> assets = apiobj.get(fetch_plan=plan)
+
+            Load the plan in another process and fetch the same query again
+
+            >>> from axonius_api_client.api.assets.fetch_plan import FetchPlan
+            >>> assets = apiobj.get(fetch_plan=FetchPlan.load("test.json"))
+
+        Args:
+            query: if supplied, only get the assets that match the query
+            fields: fields to return for each asset (will be validated)
+            fields_manual: fields to return for each asset (will NOT be validated)
+            fields_regex: regex of fields to return for each asset
+            fields_regex_root_only: only match fields_regex values against root fields
+            fields_fuzzy: string to fuzzy match of fields to return for each asset
+            fields_default: include the default fields in :attr:`fields_default`
+            fields_root: include all fields of an adapter that are not complex sub-fields
+            fields_error: throw validation errors on supplied fields
+            sort_field: sort the returned assets on a given field
+            sort_descending: reverse the sort of the returned assets
+            history_date: return assets for a given historical date
+            history_days_ago: return assets for a history date N days ago
+            history_exact: Use the closest match for history_date and history_days_ago
+            wiz_entries: wizard expressions to create query from
+            saved_query_id: ID of the saved query that query came from
+            expressions: query wizard expressions of query
+            count: fetch the count of the query at the start of each fetch that uses
+                the plan, instead of taking the total from the page metadata
+            **kwargs: ignored, so the same kwargs as :meth:`get` can be supplied
+        """
+        return FetchPlan.compile(
+            apiobj=self,
+            query=query,
+            fields_parsed=self.fields.validate(
+                fields=fields,
+                fields_manual=fields_manual,
+                fields_regex=fields_regex,
+                fields_regex_root_only=fields_regex_root_only,
+                fields_default=fields_default,
+                fields_root=fields_root,
+                fields_fuzzy=fields_fuzzy,
+                fields_error=fields_error,
+            ),
+            sort_field_parsed=self.get_sort_field(field=sort_field, descending=sort_descending),
+            history_date_parsed=self.get_history_date(
+                date=history_date, days_ago=history_days_ago, exact=history_exact
+            ),
+            wiz_parsed=self.get_wiz_entries(wiz_entries=wiz_entries),
+            expressions=expressions,
+            saved_query_id=saved_query_id,
+            count=count,
+        )
+
+    def get_mirror(self, path: PathLike, **kwargs) -> AssetMirror:
+        """Open a local mirror of the assets returned by a query, kept current by delta syncs.
+
+        Examples:
+            Sync a mirror of the devices matching a query, then export it to CSV
+
+            >>> mirror = apiobj.get_mirror(path="devices.db", query='hostname == "test"')
+            >>> stats = mirror.sync()
+            >>> assets = mirror.get(export="csv", export_file="devices.csv")
+
+        Args:
+            path: path to the SQLite database of the mirror
+            **kwargs: passed to :obj:`axonius_api_client.api.assets.mirror.AssetMirror`
+        """
+        return AssetMirror(apiobj=self, path=path, **kwargs)
+
+    def get_history_diff(
+        self,
+        dates: t.Optional[t.List[t.Optional[t.Union[str, datetime.datetime]]]] = None,
+        date_start: t.Optional[t.Union[str, datetime.datetime]] = None,
+        date_end: t.Optional[t.Union[str, datetime.datetime]] = None,
+        history_exact: bool = False,
+        generator: bool = False,
+        **kwargs,
+    ) -> GEN_TYPE:
+        """Get the assets that were added, removed, or changed between history dates.
+
+        Examples:
+            Get the changes to the hostnames of devices between two dates
+
+            >>> changes = apiobj.get_history_diff(
+            ...     dates=["2023-01-01", "2023-01-02"], fields="hostname", fields_default=False
+            ... )
+            >>> changes[0]
+            {'change': 'changed', 'id': '...', 'date_old': '2023-01-01T...', 'fields': [...]}
+
+            Get the changes between every history date in January and the current data
+
+            >>> changes = apiobj.get_history_diff(
+            ...     date_start="2023-01-01", date_end="2023-01-31", dates=[None], generator=True
+            ... )
+
+        Args:
+            dates: history dates to diff, None for the current data
+            date_start: diff every history date from this date, before any dates
+            date_end: diff every history date up to this date
+            history_exact: the history dates supplied in dates must exist
+            generator: return an iterator for changes that will yield them as they are found
+            **kwargs: passed to :obj:`axonius_api_client.api.assets.history_diff.HistoryDiff`
+        """
+        resolved = []
+        if date_start or date_end:
+            history = self.history_dates_obj()
+            resolved += history.get_dates_between(start=date_start, end=date_end)
+
+        for date in listify(dates):
+            if date is not None:
+                date = self.get_history_date(date=date, exact=history_exact)
+            resolved.append(date)
+
+        diff = HistoryDiff(apiobj=self, dates=resolved, **kwargs)
+        gen = diff.get_generator()
+        return gen if generator else list(gen)
+
+    def get_aggregate(
+        self,
+        group_by: t.Union[str, t.List[str]],
+        count_distinct: t.Optional[t.Union[str, t.List[str]]] = None,
+        min_max: t.Optional[t.Union[str, t.List[str]]] = None,
+        top: int = 0,
+        **kwargs,
+    ) -> t.List[dict]:
+        """Get the counts of assets grouped by the values of fields, without keeping the rows.
+
+        Examples:
+            Count the devices of each OS type
+
+            >>> apiobj.get_aggregate(group_by="os.type")
+            [{'specific_data.data.os.type': 'Windows', 'count': 4012}, ...]
+
+            Get the 5 most common MAC address vendors of Windows devices, with the number
+            of distinct host names and the range of last seen dates of each
+
+            >>> apiobj.get_aggregate(
+            ...     group_by="network_interfaces.manufacturer",
+            ...     count_distinct="hostname",
+            ...     min_max="last_seen",
+            ...     top=5,
+            ...     query='(specific_data.data.os.type == "Windows")',
+            ... )
+
+        Args:
+            group_by: fields or complex sub-fields to group by
+            count_distinct: fields or complex sub-fields to count the distinct values of in
+                each group
+            min_max: date fields to get the earliest and latest values of in each group
+            top: only return the N groups with the highest counts across all groups, 0 for
+                all groups
+            **kwargs: passed to :meth:`get_generator`
+
+        Notes:
+            The root fields of the fields to aggregate are added to ``fields``, and
+            ``fields_default`` is False unless supplied, so only the fields needed are
+            fetched. See :obj:`axonius_api_client.api.asset_callbacks.base_aggregate.Aggregator`
+            for how the values of list and complex fields are grouped.
+        """
+        names = {}
+        for key, values in [
+            ("group_by", group_by),
+            ("count_distinct", count_distinct),
+            ("min_max", min_max),
+        ]:
+            names[key] = []
+            for value in listify(values):
+                name, root = resolve_field(apiobj=self, value=value)
+                names[key].append(name)
+                kwargs["fields"] = listify(kwargs.get("fields")) + [root]
+
+        kwargs.setdefault("fields_default", False)
+        kwargs["export"] = DEFAULT_CALLBACKS_CLS
+        for key in ["field_titles", "field_flatten", "field_join", "field_compress"]:
+            kwargs[key] = False
+
+        aggregator = Aggregator(top=top, **names)
+        for row in self.get_generator(**kwargs):
+            aggregator.add(row=row)
+        self.LOG.info(f"Aggregated {aggregator.rows} rows into {len(aggregator.groups)} groups")
+        return aggregator.get_results()
+
+    def get_dataframe(self, **kwargs):
+        """Get assets as a pandas DataFrame built column by column as pages are fetched.
+
+        Examples:
+            Get a DataFrame of the host names, OS types, and last seen dates of devices
+
+            >>> df = apiobj.get_dataframe(
+            ...     fields=["hostname", "os.type", "last_seen"], fields_default=False
+            ... )
+            >>> df.dtypes
+            internal_axon_id                           object
+            specific_data.data.os.type               category
+            specific_data.data.last_seen  datetime64[ns, UTC]
+            ...
+
+        Args:
+            **kwargs: passed to :meth:`get_generator`
+
+        Returns:
+            pandas.DataFrame: one row per asset and one column per field
+
+        Notes:
+            Requires the pandas package to be installed. See
+            :obj:`axonius_api_client.api.asset_callbacks.base_dataframe.DataFrame` for how
+            the columns are built and their dtypes.
+        """
+        kwargs["export"] = "dataframe"
+        for _ in self.get_generator(**kwargs):
+            pass
+        return self.LAST_CALLBACKS.dataframe
+
     def get_generator(
         self,
         query: t.Optional[str] = None,
@@ -1080,6 +1504,9 @@ class AssetMixin(ModelMixins):
         page_size: int = MAX_PAGE_SIZE,
         page_start: int = 0,
         page_sleep: int = 0,
+        page_size_adaptive: bool = False,
+        page_target_seconds: float = PAGE_TARGET_SECONDS,
+        page_target_bytes: int = PAGE_TARGET_BYTES,
         export: str = DEFAULT_CALLBACKS_CLS,
         include_notes: bool = False,
         include_details: bool = False,
@@ -1092,6 +1519,10 @@ class AssetMixin(ModelMixins):
         saved_query_id: t.Optional[str] = None,
         expressions: t.Optional[t.List[dict]] = None,
         http_args: t.Optional[dict] = None,
+        fetch_plan: t.Optional[FetchPlan] = None,
+        resume: bool = False,
+        checkpoint_pages: int = 0,
+        memory_budget: t.Optional[t.Union[int, str, MemoryBudget]] = None,
         **kwargs,
     ) -> t.Generator[dict, None, None]:
         """Get assets from a query.
@@ -1112,6 +1543,10 @@ class AssetMixin(ModelMixins):
             page_size: fetch N rows per page
             page_start: start at page N
             page_sleep: sleep for N seconds between each page fetch
+            page_size_adaptive: adjust the page size between pages, starting at page_size,
+                so each page takes about page_target_seconds to fetch
+            page_target_seconds: seconds each page should take when page_size_adaptive
+            page_target_bytes: bytes each page should be at most when page_size_adaptive
             export: export assets using a callback method
             include_notes: include any defined notes for each adapter
             include_details: include details fields showing the adapter source of agg values
@@ -1121,11 +1556,48 @@ class AssetMixin(ModelMixins):
             history_days_ago: return assets for a history date N days ago
             history_exact: Use the closest match for history_date and history_days_ago
             wiz_entries: wizard expressions to create query from
+            fetch_plan: use the preflight resolved by :meth:`get_fetch_plan` instead of
+                resolving query, wiz_entries, fields, sort_field, and history_date
+            resume: resume the export to export_file from its last checkpoint if one exists,
+                and save checkpoints every checkpoint_pages pages
+            checkpoint_pages: save a checkpoint of the export to export_file every N pages,
+                defaults to :data:`axonius_api_client.constants.api.CHECKPOINT_PAGES`
+                if resume is True
+            memory_budget: most bytes of pages to hold in memory, as an int, a size like
+                512MB, or a :obj:`axonius_api_client.api.assets.memory.MemoryBudget` shared
+                with other fetches, pages are made smaller to fit and fetching pauses while
+                pages held by other fetches that share the budget would go over it, which
+                only happens for fetches consumed in other threads
             **kwargs: passed thru to the asset callback defined in ``export``
         """
-        wiz_parsed: t.Optional[dict] = kwargs.get(
-            "_wiz_parsed", self.get_wiz_entries(wiz_entries=wiz_entries)
-        )
+        budget: t.Optional[MemoryBudget] = MemoryBudget.load(value=memory_budget)
+        checkpoint: t.Optional[ExportCheckpoint] = None
+        resume_data: t.Optional[dict] = None
+        if resume or checkpoint_pages:
+            callbacks_cls = get_callbacks_cls(export=export)
+            if not callbacks_cls.RESUME_SUPPORTED:
+                raise ApiError(f"Export {export!r} does not support checkpoints and resume")
+
+            checkpoint = ExportCheckpoint.from_getargs(
+                getargs=kwargs, every_pages=checkpoint_pages, log=self.LOG
+            )
+            if resume and checkpoint.load():
+                resume_data = checkpoint.data
+                fetch_plan = checkpoint.get_plan()
+                kwargs["_file_date"] = resume_data["file_date"]
+
+        if fetch_plan is not None:
+            plan_kwargs = fetch_plan.get_kwargs(apiobj=self)
+            query = plan_kwargs.pop("query")
+            expressions = plan_kwargs.pop("expressions")
+            saved_query_id = plan_kwargs.pop("saved_query_id")
+            for key, value in plan_kwargs.items():
+                kwargs.setdefault(key, value)
+
+        if "_wiz_parsed" in kwargs:
+            wiz_parsed: t.Optional[dict] = kwargs["_wiz_parsed"]
+        else:
+            wiz_parsed: t.Optional[dict] = self.get_wiz_entries(wiz_entries=wiz_entries)
 
         if isinstance(wiz_parsed, dict):
             if wiz_parsed.get("query"):
@@ -1133,9 +1605,10 @@ class AssetMixin(ModelMixins):
             if wiz_parsed.get("expressions"):
                 expressions = wiz_parsed["expressions"]
 
-        fields_parsed: t.List[str] = kwargs.get(
-            "_fields_parsed",
-            self.fields.validate(
+        if "_fields_parsed" in kwargs:
+            fields_parsed: t.List[str] = kwargs["_fields_parsed"]
+        else:
+            fields_parsed: t.List[str] = self.fields.validate(
                 fields=fields,
                 fields_manual=fields_manual,
                 fields_regex=fields_regex,
@@ -1144,23 +1617,29 @@ class AssetMixin(ModelMixins):
                 fields_root=fields_root,
                 fields_fuzzy=fields_fuzzy,
                 fields_error=fields_error,
-            ),
-        )
+            )
 
-        sort_field_parsed: t.Optional[str] = kwargs.get(
-            "_sort_field_parsed", self.get_sort_field(field=sort_field, descending=sort_descending)
-        )
+        if "_sort_field_parsed" in kwargs:
+            sort_field_parsed: t.Optional[str] = kwargs["_sort_field_parsed"]
+        else:
+            sort_field_parsed: t.Optional[str] = self.get_sort_field(
+                field=sort_field, descending=sort_descending
+            )
 
-        history_date_parsed: t.Optional[str] = kwargs.get(
-            "_history_date_parsed",
-            self.get_history_date(
+        if "_history_date_parsed" in kwargs:
+            history_date_parsed: t.Optional[str] = kwargs["_history_date_parsed"]
+        else:
+            history_date_parsed: t.Optional[str] = self.get_history_date(
                 date=history_date, days_ago=history_days_ago, exact=history_exact
-            ),
-        )
+            )
 
-        initial_count: int = kwargs.get(
-            "_initial_count", self.count(query=query, history_date=history_date)
-        )
+        # _initial_count=None skips the count and uses the total from the page metadata
+        if "_initial_count" in kwargs:
+            initial_count: t.Optional[int] = kwargs["_initial_count"]
+        else:
+            initial_count: t.Optional[int] = self._count_value(
+                query=query, history_date=history_date_parsed, saved_query_id=saved_query_id
+            )
 
         file_date: str = kwargs.get("_file_date", dt_now_file())
         export_templates: dict = {
@@ -1191,11 +1670,15 @@ class AssetMixin(ModelMixins):
             "max_rows": max_rows,
             "max_pages": max_pages,
             "page_size": page_size,
+            "page_size_adaptive": page_size_adaptive,
+            "page_target_seconds": page_target_seconds,
+            "page_target_bytes": page_target_bytes,
             "page_sleep": page_sleep,
             "page_start": page_start,
             "row_start": row_start,
             "initial_count": initial_count,
             "export_templates": export_templates,
+            "resume": resume_data["callbacks"] if resume_data else None,
         }
 
         state = json_api.assets.AssetsPage.create_state(
@@ -1205,8 +1688,25 @@ class AssetMixin(ModelMixins):
             page_size=page_size,
             page_start=page_start,
             row_start=row_start,
-            initial_count=initial_count,
+            initial_count=initial_count or 0,
+            page_size_adaptive=page_size_adaptive,
+            page_target_seconds=page_target_seconds,
+            page_target_bytes=page_target_bytes,
         )
+        if resume_data:
+            state = checkpoint.restore_state(state=state)
+
+        if checkpoint and fetch_plan is None:
+            fetch_plan = FetchPlan.compile(
+                apiobj=self,
+                query=query,
+                fields_parsed=fields_parsed,
+                sort_field_parsed=sort_field_parsed,
+                history_date_parsed=history_date_parsed,
+                expressions=expressions,
+                saved_query_id=saved_query_id,
+                count=initial_count is not None,
+            )
 
         callbacks_cls = get_callbacks_cls(export=export)
         callbacks = callbacks_cls(apiobj=self, getargs=kwargs, state=state, store=store)
@@ -1217,47 +1717,392 @@ class AssetMixin(ModelMixins):
         self.LOG.info(f"STARTING FETCH store={json_dump(store)}")
         self.LOG.debug(f"STARTING FETCH state={json_dump(state)}")
 
+        resuming: bool = bool(resume_data)
         while not state["stop_fetch"]:
             try:
-                start_dt = dt_now()
+                owner = threading.get_ident()
+                page_bytes = (
+                    budget.acquire(
+                        nbytes=self._estimate_page_bytes(state=state, budget=budget), owner=owner
+                    )
+                    if budget
+                    else 0
+                )
+
+                try:
+                    start_dt = dt_now()
+                    page_args: dict = dict(
+                        include_details=store["include_details"],
+                        include_notes=store["include_notes"],
+                        sort=store["sort_field_parsed"],
+                        history_date=store["history_date_parsed"],
+                        filter=store["query"],
+                        fields=store["fields_parsed"],
+                        cursor_id=state["page_cursor"],
+                        offset=state["rows_offset"],
+                        limit=state["page_size"],
+                        saved_query_id=saved_query_id,
+                        expressions=expressions,
+                        always_cached_query=False,
+                        use_cache_entry=False,
+                        get_metadata=True,
+                        use_cursor=True,
+                        http_args=http_args,
+                    )
+
+                    if resuming:
+                        resuming = False
+                        page = self._get_resume_page(page_args=page_args, state=state)
+                    else:
+                        page = self._get(**page_args)
+
+                    state = page.process_page(state=state, start_dt=start_dt, apiobj=self)
+                    if budget:
+                        page_bytes = budget.adjust(
+                            acquired=page_bytes,
+                            nbytes=budget.estimate(state["bytes_fetched_this_page"]),
+                            owner=owner,
+                        )
+
+                    callbacks.process_page(rows=page.assets)
+
+                    for row in page.assets:
+                        state = page.start_row(state=state, apiobj=self, row=row)
+                        yield from listify(obj=callbacks.process_row(row=row))
+                        state = page.process_row(state=state, apiobj=self, row=row)
+
+                    state = page.process_loop(state=state, apiobj=self)
+                finally:
+                    if budget:
+                        budget.release(nbytes=page_bytes, owner=owner)
+
+                if budget and page.assets:
+                    state["page_size"] = budget.fit_page_size(
+                        page_size=state["page_size"],
+                        bytes_per_row=state["bytes_fetched_this_page"] / len(page.assets),
+                    )
+
+                if checkpoint and checkpoint.is_due(state=state):
+                    checkpoint.save(
+                        state=state, plan=fetch_plan, file_date=file_date, callbacks=callbacks
+                    )
+
+                time.sleep(state["page_sleep"])
+            except StopFetch as exc:
+                self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+                break
+
+        if budget:
+            store["memory_budget"] = budget.get_stats()
+
+        self.LOG.info(f"FINISHED FETCH store={json_dump(store)}")
+        self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
+
+        callbacks.stop()
+        callbacks.echo_profile()
+
+        if checkpoint:
+            checkpoint.remove()
+
+    def _get_generator_chunked(
+        self,
+        queries: t.List[str],
+        max_workers: int = QUERY_CHUNK_WORKERS,
+        ids: t.Optional[t.List[str]] = None,
+        export: str = DEFAULT_CALLBACKS_CLS,
+        include_notes: bool = False,
+        include_details: bool = False,
+        page_size: int = MAX_PAGE_SIZE,
+        max_rows: t.Optional[int] = None,
+        max_pages: t.Optional[int] = None,
+        page_sleep: int = 0,
+        http_args: t.Optional[dict] = None,
+        fetch_plan: t.Optional[FetchPlan] = None,
+        memory_budget: t.Optional[t.Union[int, str, MemoryBudget]] = None,
+        result: t.Optional[AssetsByIds] = None,
+        **kwargs,
+    ) -> t.Generator[dict, None, None]:
+        """Get assets for many queries concurrently, processed by one callbacks object.
+
+        Notes:
+            The preflight of the fields, sort field, and history date is resolved once into
+            a :obj:`axonius_api_client.api.assets.fetch_plan.FetchPlan` and used for every
+            query. At most max_workers queries are fetched at a time, and the rows of each
+            query are processed in the order of queries. Rows of assets that were already
+            processed for an earlier query are skipped. If a query or wizard entries are
+            supplied in kwargs or fetch_plan, each query is combined with it using 'and'.
+
+            Each query counts as a page for max_pages and page_sleep. Once max_rows rows
+            have been processed or max_pages queries have been processed, the queries still
+            in flight are cancelled. ``ids_missing`` is only set if every query was fetched.
+
+            If memory_budget is supplied, the pages of each query count against it until
+            the rows of the query have been processed. One query is fetched first, then more
+            queries are only started while the average bytes of the queries so far would fit
+            in the budget for every query in flight.
+
+        Args:
+            queries: queries to get assets for
+            max_workers: number of queries to have in flight at once
+            ids: internal_axon_ids that are expected, the ones not found are stored in
+                ``ids_missing`` of result and in the STORE of the callbacks object
+            export: export assets using a callback method
+            include_notes: include any defined notes for each adapter
+            include_details: include details fields showing the adapter source of agg values
+            page_size: fetch N rows per page of each query
+            max_rows: only return N rows
+            max_pages: only return the rows of N queries
+            page_sleep: sleep for N seconds between processing each query
+            http_args: passed to :meth:`_get`
+            fetch_plan: use the preflight resolved by :meth:`get_fetch_plan`
+            memory_budget: most bytes of pages to hold in memory, as an int, a size like
+                512MB, or a :obj:`axonius_api_client.api.assets.memory.MemoryBudget`
+            result: object to store ``ids_missing`` in once all rows have been processed
+            **kwargs: passed to :meth:`get_fetch_plan` and to the callbacks object defined
+                in ``export``
+        """
+        budget: t.Optional[MemoryBudget] = MemoryBudget.load(value=memory_budget)
+        plan = fetch_plan or self.get_fetch_plan(**kwargs)
+        plan.check(apiobj=self)
+        if plan.query:
+            queries = [f"({x}) and ({plan.query})" for x in queries]
+
+        file_date: str = kwargs.get("_file_date", dt_now_file())
+        store: dict = {
+            "export": export,
+            "query": f"{len(queries)} chunked queries",
+            "fields_parsed": plan.fields_parsed,
+            "sort_field_parsed": plan.sort_field_parsed,
+            "history_date_parsed": plan.history_date_parsed,
+            "include_details": include_details,
+            "include_notes": include_notes,
+            "max_rows": max_rows,
+            "max_pages": max_pages,
+            "page_size": page_size,
+            "page_sleep": page_sleep,
+            "max_workers": max_workers,
+            "initial_count": len(ids) if ids is not None else None,
+            "export_templates": {
+                "{DATE}": file_date,
+                "{HISTORY_DATE}": plan.history_date_parsed or file_date,
+            },
+        }
+        state = json_api.assets.AssetsPage.create_state(
+            max_pages=max_pages,
+            max_rows=max_rows,
+            page_sleep=page_sleep,
+            page_size=page_size,
+            initial_count=store["initial_count"] or 0,
+        )
+        state["pages_to_fetch_total"] = len(queries)
+        state["rows_to_fetch_total"] = store["initial_count"] or 0
+
+        callbacks_cls = get_callbacks_cls(export=export)
+        callbacks = callbacks_cls(apiobj=self, getargs=kwargs, state=state, store=store)
+
+        self.LAST_CALLBACKS = callbacks
+        callbacks.start()
+
+        self.LOG.info(f"STARTING CHUNKED FETCH store={json_dump(store)}")
+        seen: t.Set[str] = set()
+        owner = threading.get_ident()
+        chunks = iter(queries)
+        pending = collections.deque()
+        chunk_bytes: t.List[int] = []
+        held: int = 0
+
+        def fits():
+            if not pending or not budget:
+                return True
+            if not chunk_bytes:
+                return False
+            average = sum(chunk_bytes) / len(chunk_bytes)
+            return budget.buffered_bytes + average * (len(pending) + 1) <= budget.max_bytes
+
+        def submit(pool):
+            while len(pending) < max(1, max_workers) and fits():
+
+                query = next(chunks, None)
+                if query is None:
+                    break
+
+                chunk_plan = dataclasses.replace(
+                    plan, query=query, expressions=None, saved_query_id=None
+                )
+                future = pool.submit(
+                    self._get_query_rows,
+                    fetch_plan=chunk_plan,
+                    page_size=state["page_size"],
+                    include_notes=include_notes,
+                    include_details=include_details,
+                    http_args=http_args,
+                    memory_budget=budget,
+                    memory_owner=owner,
+                )
+                pending.append(future)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            submit(pool=pool)
+
+            try:
+                while pending:
+                    rows, fetch_seconds, fetch_bytes, held = pending.popleft().result()
+                    chunk_bytes.append(held)
+                    submit(pool=pool)
+
+                    rows = [x for x in rows if x[AXID.name] not in seen]
+                    seen.update([x[AXID.name] for x in rows])
+
+                    state["page_number"] += 1
+                    state["pages_to_fetch_left"] = len(queries) - state["page_number"]
+                    state["rows_fetched_this_page"] = len(rows)
+                    state["rows_fetched_total"] += len(rows)
+                    state["fetch_seconds_this_page"] = fetch_seconds
+                    state["fetch_seconds_total"] += fetch_seconds
+                    state["bytes_fetched_this_page"] = fetch_bytes
+                    state["bytes_fetched_total"] += fetch_bytes
+                    if ids is None:
+                        state["rows_to_fetch_total"] = state["rows_fetched_total"]
+
+                    page = json_api.assets.AssetsPage(assets=rows)
+                    callbacks.process_page(rows=rows)
+
+                    for row in rows:
+                        state = page.start_row(state=state, apiobj=self, row=row)
+                        yield from listify(obj=callbacks.process_row(row=row))
+                        state = page.process_row(state=state, apiobj=self, row=row)
+
+                    if budget:
+                        budget.release(nbytes=held, owner=owner)
+                    held = 0
+
+                    if pending:
+                        state = page.process_loop(state=state, apiobj=self)
+                        time.sleep(state["page_sleep"])
+            except StopFetch as exc:
+                self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+            finally:
+                if budget:
+                    budget.release(nbytes=held, owner=owner)
+                for future in pending:
+                    if not future.cancel() and budget and not future.exception():
+                        budget.release(nbytes=future.result()[3], owner=owner)
+
+        if budget:
+            store["memory_budget"] = budget.get_stats()
+
+        if ids is not None and state["page_number"] == len(queries):
+            missing = [x for x in ids if x not in seen]
+            store["ids_missing"] = missing
+            if result is not None:
+                result.ids_missing = missing
+            if missing:
+                self.LOG.warning(f"Failed to find {len(missing)} of {len(ids)} asset IDs")
+
+        self.LOG.info(f"FINISHED CHUNKED FETCH store={json_dump(store)}")
+        callbacks.stop()
+        callbacks.echo_profile()
+
+    def _get_query_rows(
+        self,
+        fetch_plan: FetchPlan,
+        page_size: int = MAX_PAGE_SIZE,
+        include_notes: bool = False,
+        include_details: bool = False,
+        http_args: t.Optional[dict] = None,
+        memory_budget: t.Optional[MemoryBudget] = None,
+        memory_owner: t.Hashable = None,
+    ) -> t.Tuple[t.List[dict], float, int, int]:
+        """Get all of the rows of a fetch plan without a callbacks object.
+
+        Args:
+            fetch_plan: query and fields to fetch
+            page_size: fetch N rows per page
+            include_notes: include any defined notes for each adapter
+            include_details: include details fields showing the adapter source of agg values
+            http_args: passed to :meth:`_get`
+            memory_budget: budget to add the estimated bytes of each page to
+            memory_owner: thread that will consume the rows, to hold the bytes of each page
 
+        Returns:
+            the rows, the seconds taken to fetch them, the bytes received, and the bytes
+            added to memory_budget
+        """
+        state = json_api.assets.AssetsPage.create_state(page_size=page_size)
+        rows = []
+        held = 0
+        while not state["stop_fetch"]:
+            try:
+                start_dt = dt_now()
                 page = self._get(
-                    include_details=store["include_details"],
-                    include_notes=store["include_notes"],
-                    sort=store["sort_field_parsed"],
-                    history_date=store["history_date_parsed"],
-                    filter=store["query"],
-                    fields=store["fields_parsed"],
+                    include_details=include_details,
+                    include_notes=include_notes,
+                    sort=fetch_plan.sort_field_parsed,
+                    history_date=fetch_plan.history_date_parsed,
+                    filter=fetch_plan.query,
+                    fields=fetch_plan.fields_parsed,
                     cursor_id=state["page_cursor"],
                     offset=state["rows_offset"],
                     limit=state["page_size"],
-                    saved_query_id=saved_query_id,
-                    expressions=expressions,
                     always_cached_query=False,
                     use_cache_entry=False,
                     get_metadata=True,
                     use_cursor=True,
                     http_args=http_args,
                 )
-
                 state = page.process_page(state=state, start_dt=start_dt, apiobj=self)
-
-                for row in page.assets:
-                    state = page.start_row(state=state, apiobj=self, row=row)
-                    yield from listify(obj=callbacks.process_row(row=row))
-                    state = page.process_row(state=state, apiobj=self, row=row)
-
+                rows += page.assets
+                if memory_budget:
+                    page_bytes = memory_budget.estimate(state["bytes_fetched_this_page"])
+                    held += memory_budget.acquire(
+                        nbytes=page_bytes, block=False, owner=memory_owner
+                    )
+                if not state["rows_to_fetch_left"]:
+                    break
                 state = page.process_loop(state=state, apiobj=self)
-
-                time.sleep(state["page_sleep"])
-            except StopFetch as exc:
-                self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+            except StopFetch:
                 break
+        return rows, state["fetch_seconds_total"], state["bytes_fetched_total"], held
 
-        self.LOG.info(f"FINISHED FETCH store={json_dump(store)}")
-        self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
+    def _get_resume_page(self, page_args: dict, state: dict) -> json_api.assets.AssetsPage:
+        """Get the first page of a resumed fetch, falling back to the offset if needed.
 
-        callbacks.stop()
+        Notes:
+            The cursor saved in a checkpoint expires on the server after a while. If the
+            cursor is rejected, or returns no rows while the checkpoint says there are rows
+            left, the page is fetched again without the cursor using the saved offset.
+
+        Args:
+            page_args: arguments for :meth:`_get`
+            state: paging state restored from a checkpoint
+        """
+        if page_args["cursor_id"]:
+            try:
+                page = self._get(**page_args)
+            except ResponseNotOk as exc:
+                self.LOG.warning(f"Unable to resume from cursor {page_args['cursor_id']}: {exc}")
+            else:
+                if page.assets or not state["rows_to_fetch_left"]:
+                    return page
+                self.LOG.warning(f"Cursor {page_args['cursor_id']} returned no rows")
+
+        self.LOG.info(f"Resuming fetch from offset {page_args['offset']}")
+        page_args["cursor_id"] = state["page_cursor"] = None
+        return self._get(**page_args)
+
+    @staticmethod
+    def _estimate_page_bytes(state: dict, budget: MemoryBudget) -> int:
+        """Estimate the bytes the next page will take in memory before it is fetched.
+
+        Args:
+            state: paging state, using the bytes per row of the last page and the page size
+            budget: budget to estimate the bytes for
+        """
+        rows = state["rows_fetched_this_page"]
+        if not rows:
+            return 0
+        bytes_per_row = state["bytes_fetched_this_page"] / rows
+        return budget.estimate(response_bytes=int(bytes_per_row * state["page_size"]))
 
     def get_by_saved_query(self, name: str, **kwargs) -> GEN_TYPE:
         """Get assets that would be returned by a saved query.
@@ -1310,6 +2155,90 @@ class AssetMixin(ModelMixins):
                 raise NotFoundError(msg)
             raise  # pragma: no cover
 
+    def get_by_ids(
+        self,
+        ids: t.Union[t.List[str], str],
+        chunk_length: int = QUERY_CHUNK_LENGTH,
+        max_workers: int = QUERY_CHUNK_WORKERS,
+        generator: bool = False,
+        **kwargs,
+    ) -> AssetsByIds:
+        """Get assets for a large number of internal_axon_ids using chunked concurrent queries.
+
+        Examples:
+            Get the hostname and OS of 50,000 assets from another system
+
+            >>> result = apiobj.get_by_ids(ids=ids, fields=["hostname", "os.type"])
+            >>> assets = result.assets
+
+            Export them to CSV and check which IDs were not found
+
+            >>> result = apiobj.get_by_ids(ids=ids, export="csv", export_file="found.csv")
+            >>> missing = result.ids_missing
+
+        Notes:
+            The IDs are deduplicated and split into ``internal_axon_id in [...]`` queries of
+            at most chunk_length characters each. Up to max_workers of the queries are
+            fetched at once, and the rows of each query are processed by one callbacks
+            object in the order of the IDs. Rows are sorted within each query only.
+
+            A query or wizard entries supplied in kwargs are combined with each of the
+            queries using 'and'.
+
+            max_rows and max_pages supplied in kwargs apply across all of the queries, with
+            each query counting as a page.
+
+            IDs that were not found are logged and stored in ``ids_missing`` of the returned
+            object once all rows have been processed. With generator=True, iterate over the
+            object or its assets before checking ``ids_missing``.
+
+        Args:
+            ids: internal_axon_ids of assets to get
+            chunk_length: most characters of IDs to put in each query
+            max_workers: number of queries to have in flight at once
+            generator: return assets as an iterator that will yield rows as they are fetched
+            **kwargs: passed to :meth:`get_fetch_plan` and to the callbacks object defined
+                in ``export``
+        """
+        ids = list(dict.fromkeys([x.strip() for x in listify(ids) if x.strip()]))
+        queries = [
+            self._build_query(inner=x)
+            for x in self._chunk_values(field=AXID.name, values=ids, chunk_length=chunk_length)
+        ]
+        result = AssetsByIds(ids=ids)
+        gen = self._get_generator_chunked(
+            queries=queries, max_workers=max_workers, ids=ids, result=result, **kwargs
+        )
+        result.assets = gen if generator else list(gen)
+        return result
+
+    @staticmethod
+    def _chunk_values(
+        field: str, values: t.List[str], chunk_length: int = QUERY_CHUNK_LENGTH
+    ) -> t.List[str]:
+        """Split values into ``field in [...]`` queries of at most chunk_length characters.
+
+        Args:
+            field: name of field to query against
+            values: values that must match field
+            chunk_length: most characters of values to put in each query, 0 to not split
+        """
+        chunks = []
+        chunk = []
+        length = 0
+        for value in values:
+            value = f"'{value.strip()}'"
+            if chunk and chunk_length and length + len(value) + 2 > chunk_length:
+                chunks.append(chunk)
+                chunk = []
+                length = 0
+            chunk.append(value)
+            length += len(value) + 2
+
+        if chunk:
+            chunks.append(chunk)
+        return [f"{field} in [{', '.join(x)}]" for x in chunks]
+
     @property
     def fields_default(self) -> t.List[dict]:
         """Fields to use by default for getting assets."""
@@ -1337,6 +2266,8 @@ class AssetMixin(ModelMixins):
         pre: str = "",
         post: str = "",
         field_manual: bool = False,
+        chunk_length: int = QUERY_CHUNK_LENGTH,
+        max_workers: int = QUERY_CHUNK_WORKERS,
         **kwargs,
     ) -> GEN_TYPE:  # pragma: no cover
         """Build a query to get assets where field in values.
@@ -1345,6 +2276,17 @@ class AssetMixin(ModelMixins):
             It is better to use :attr:`wizard`, :attr:`wizard_text`, or :attr:`wizard_csv`
             to build queries!
 
+            If the values are longer than chunk_length characters, they are split into
+            chunks and each chunk is fetched as its own query, with up to max_workers of the
+            queries in flight at once. The rows of all queries are processed by one callbacks
+            object, assets matched by more than one chunk are only processed once, and rows
+            are sorted within each chunk only. Values are never split if not_flag is True,
+            since a chunk of a 'not in' query would match the values of the other chunks.
+
+            A query supplied as query, wiz_entries, or the query of fetch_plan is combined
+            with the query of the values using 'and', whether or not the values are split,
+            so the same assets are returned no matter how many values there are.
+
         Args:
             values: list of values that must match field
             field: name of field to query against
@@ -1352,24 +2294,45 @@ class AssetMixin(ModelMixins):
             pre: query to add to the beginning of the query
             post: query to add to the end of the query
             field_manual: consider supplied field as a fully qualified field name
+            chunk_length: most characters of values to put in each query
+            max_workers: number of chunked queries to have in flight at once
             **kwargs: passed to :meth:`get`
         """
         field = self.fields.get_field_name(value=field, field_manual=field_manual)
+        chunk_length = 0 if not_flag else chunk_length
+        inners = self._chunk_values(field=field, values=listify(values), chunk_length=chunk_length)
+        queries = [
+            self._build_query(inner=x, pre=pre, post=post, not_flag=not_flag)
+            for x in inners or [f"{field} in []"]
+        ]
+
+        query = kwargs.pop("query", None)
+        wiz_parsed = self.get_wiz_entries(wiz_entries=kwargs.pop("wiz_entries", None))
+        if isinstance(wiz_parsed, dict) and wiz_parsed.get("query"):
+            query = wiz_parsed["query"]
+
+        fetch_plan: t.Optional[FetchPlan] = kwargs.get("fetch_plan")
+        if fetch_plan:
+            query = fetch_plan.query
+        if query:
+            queries = [f"({x}) and ({query})" for x in queries]
+
+        if len(queries) == 1:
+            if fetch_plan:
+                kwargs["fetch_plan"] = dataclasses.replace(
+                    fetch_plan, query=queries[0], expressions=None, saved_query_id=None
+                )
+            else:
+                kwargs["query"] = queries[0]
+            return self.get(**kwargs)
 
-        match = listify(values)
-        match = [f"'{x.strip()}'" for x in match]
-        match = ", ".join(match)
-
-        inner = f"{field} in [{match}]"
-
-        kwargs["query"] = self._build_query(
-            inner=inner,
-            pre=pre,
-            post=post,
-            not_flag=not_flag,
-        )
-
-        return self.get(**kwargs)
+        if fetch_plan:
+            kwargs["fetch_plan"] = dataclasses.replace(
+                fetch_plan, query=None, expressions=None, saved_query_id=None
+            )
+        generator = kwargs.pop("generator", False)
+        gen = self._get_generator_chunked(queries=queries, max_workers=max_workers, **kwargs)
+        return gen if generator else list(gen)
 
     def get_by_value_regex(
         self,
@@ -1534,6 +2497,9 @@ class AssetMixin(ModelMixins):
         self.LAST_CALLBACKS: Base = None
         """Callbacks object used for last :meth:`get` request."""
 
+        self.COUNT_CACHES: t.Dict[int, cachetools.TTLCache] = {}
+        """Caches of counts used by :meth:`count_many`, keyed by TTL."""
+
         super(AssetMixin, self)._init(**kwargs)
 
     def _get(
@@ -1640,6 +2606,7 @@ class AssetMixin(ModelMixins):
         request_obj = api_endpoint.load_request(
             use_cache_entry=use_cache_entry,
             filter=filter,
+            history=history_date,
             saved_query_id=saved_query_id,
         )
         return api_endpoint.perform_request(
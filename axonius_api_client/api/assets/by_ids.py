@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Assets fetched for a list of internal_axon_ids."""
+import dataclasses
+import typing as t
+
+from ...data import BaseData
+
+
+@dataclasses.dataclass
+class AssetsByIds(BaseData):
+    """Assets fetched for a list of internal_axon_ids and the IDs that were not found.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices
+
+        Get the assets and check which IDs were not found
+
+        >>> result = apiobj.get_by_ids(ids=ids, fields=["hostname"])
+        >>> for asset in result:
+        ...     print(asset["internal_axon_id"])
+        >>> print(result.ids_missing)
+
+    Notes:
+        If assets is a generator, ids_missing is None until all of the rows have been
+        processed.
+    """
+
+    ids: t.List[str]
+    """deduplicated internal_axon_ids that were requested"""
+
+    assets: t.Union[t.Generator[dict, None, None], t.List[dict]] = dataclasses.field(
+        default_factory=list, repr=False
+    )
+    """assets that were found, a list or a generator that yields them as they are fetched"""
+
+    ids_missing: t.Optional[t.List[str]] = None
+    """internal_axon_ids that were not found, None until all rows have been processed"""
+
+    def __iter__(self) -> t.Iterator[dict]:
+        """Iterate over the assets that were found."""
+        return iter(self.assets)
+
+    def __str__(self) -> str:
+        """Pass."""
+        missing = None if self.ids_missing is None else len(self.ids_missing)
+        return f"{self.__class__.__name__}(ids={len(self.ids)}, ids_missing={missing})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""On-disk checkpoints for resumable asset exports."""
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import typing as t
+
+from ... import DEFAULT_PATH
+from ...constants.api import CHECKPOINT_PAGES
+from ...exceptions import ApiError
+from ...tools import dt_now, get_path, get_paths_format
+from ...version import __version__ as VERSION
+from .fetch_plan import FetchPlan
+
+CHECKPOINT_SUFFIX: str = ".checkpoint.json"
+"""suffix added to the name of an export file to get the name of its checkpoint file"""
+
+CHECKPOINT_STATE_KEYS: t.List[str] = [
+    "bytes_fetched_total",
+    "fetch_seconds_total",
+    "page_cursor",
+    "page_loop",
+    "page_number",
+    "page_size",
+    "page_seconds_per_row",
+    "page_bytes_per_row",
+    "rows_fetched_total",
+    "rows_offset",
+    "rows_processed_total",
+    "rows_to_fetch_total",
+    "rows_to_fetch_left",
+]
+"""keys of the paging state of get_generator that are saved in a checkpoint"""
+
+
+class ExportCheckpoint:
+    """On-disk checkpoint of an asset export to a file, used to resume an export that died.
+
+    Notes:
+        A checkpoint is saved after every N pages once all of the rows of the page have been
+        written. It holds the paging state, the resolved fetch parameters as a
+        :obj:`axonius_api_client.api.assets.fetch_plan.FetchPlan`, and the position of the
+        export file after the last written row. Resuming truncates the export file to that
+        position and fetches from the saved cursor, falling back to the saved offset if the
+        cursor can no longer be used.
+
+        The checkpoint file is next to the export file, named after export_file with any
+        templates like ``{DATE}`` left unformatted so that the same arguments find the same
+        checkpoint, and is removed once the export finishes.
+    """
+
+    def __init__(self, path: pathlib.Path, every_pages: int = CHECKPOINT_PAGES, log=None):
+        """On-disk checkpoint of an asset export.
+
+        Args:
+            path: path to checkpoint file
+            every_pages: save a checkpoint after every N pages
+            log: logger to use
+        """
+        self.path: pathlib.Path = path
+        self.every_pages: int = max(1, every_pages or CHECKPOINT_PAGES)
+        self.log: logging.Logger = log or logging.getLogger(__name__)
+        self.data: t.Optional[dict] = None
+
+    @classmethod
+    def from_getargs(cls, getargs: dict, **kwargs) -> "ExportCheckpoint":
+        """Create a checkpoint for the export file in the arguments for a callbacks object.
+
+        Args:
+            getargs: arguments for a callbacks object
+            **kwargs: passed to :meth:`__init__`
+
+        Raises:
+            :exc:`ApiError`: if getargs does not export to a file
+        """
+        export_file = getargs.get("export_file")
+        if not isinstance(export_file, (str, pathlib.Path)) or not export_file:
+            raise ApiError("Checkpoints and resume require exporting to a file with export_file")
+
+        export_path = get_path(obj=getargs.get("export_path") or DEFAULT_PATH)
+        path = get_paths_format(export_path, export_file)
+        path = path.parent / f"{path.name}{CHECKPOINT_SUFFIX}"
+        return cls(path=path, **kwargs)
+
+    def load(self) -> t.Optional[dict]:
+        """Load the checkpoint file if it exists."""
+        if not self.path.is_file():
+            self.log.info(f"No checkpoint found at {str(self.path)!r}, starting from the beginning")
+            return None
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            raise ApiError(f"Unable to load checkpoint {str(self.path)!r}: {exc}")
+
+        if data.get("client_version") != VERSION:
+            self.log.warning(
+                f"Checkpoint {str(self.path)!r} was saved by API client version "
+                f"{data.get('client_version')!r}, current version is {VERSION!r}"
+            )
+
+        self.data = data
+        self.log.info(
+            f"Loaded checkpoint {str(self.path)!r} saved at {data.get('saved')} with "
+            f"{data['state'].get('rows_processed_total')} rows processed"
+        )
+        return data
+
+    def get_plan(self) -> FetchPlan:
+        """Get the fetch plan from the loaded checkpoint."""
+        return FetchPlan.from_dict(data=self.data["plan"])
+
+    def restore_state(self, state: dict) -> dict:
+        """Update a new paging state with the paging state from the loaded checkpoint.
+
+        Args:
+            state: paging state from get_generator
+        """
+        state.update({k: v for k, v in self.data["state"].items() if k in CHECKPOINT_STATE_KEYS})
+        return state
+
+    def is_due(self, state: dict) -> bool:
+        """Check if a checkpoint should be saved after the page that was just processed.
+
+        Args:
+            state: paging state from get_generator
+        """
+        return (state["page_loop"] - 1) % self.every_pages == 0
+
+    def save(self, state: dict, plan: FetchPlan, file_date: str, callbacks):
+        """Save a checkpoint of the pages that have been written so far.
+
+        Args:
+            state: paging state from get_generator
+            plan: resolved fetch parameters
+            file_date: date used for {DATE} in export_file
+            callbacks (:obj:`axonius_api_client.api.asset_callbacks.base.ExportMixins`):
+                callbacks object writing the export
+        """
+        data = {
+            "client_version": VERSION,
+            "saved": dt_now().isoformat(),
+            "plan": plan.to_dict(),
+            "file_date": file_date,
+            "state": {k: state.get(k) for k in CHECKPOINT_STATE_KEYS},
+            "callbacks": callbacks.get_checkpoint(),
+        }
+
+        temp = None
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", dir=self.path.parent, suffix=".tmp", delete=False
+            ) as fh:
+                temp = pathlib.Path(fh.name)
+                json.dump(data, fh)
+            os.replace(temp, self.path)
+        except Exception:
+            if temp and temp.exists():
+                temp.unlink()
+            raise
+
+        self.data = data
+        self.log.debug(
+            f"Saved checkpoint {str(self.path)!r} at page {state.get('page_number')} with "
+            f"{state.get('rows_processed_total')} rows processed"
+        )
+
+    def remove(self):
+        """Remove the checkpoint file after the export has finished."""
+        if self.path.is_file():
+            self.path.unlink()
+            self.log.debug(f"Removed checkpoint {str(self.path)!r}")
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return f"{self.__class__.__name__}(path={str(self.path)!r}, every_pages={self.every_pages})"
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Compiled, reusable preflight of an asset query."""
+import dataclasses
+import typing as t
+
+from ...data import BaseData
+from ...exceptions import ApiError
+from ...tools import PathLike, dt_now, path_read, path_write
+from ...version import __version__ as VERSION
+
+
+@dataclasses.dataclass
+class FetchPlan(BaseData):
+    """Preflight of an asset query resolved once, to be reused by any number of fetches.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices
+
+        Compile a plan and save it to disk
+
+        >>> plan = apiobj.get_fetch_plan(query='hostname == regex("test", "i")', fields=["os"])
+        >>> plan.save("plans/test_hosts.json")
+
+        Load the plan and use it for every fetch after that
+
+        >>> plan = FetchPlan.load("plans/test_hosts.json")
+        >>> assets = apiobj.get(fetch_plan=plan)
+
+    Notes:
+        Compiling a plan parses the wizard entries, validates the fields, resolves the sort
+        field, and resolves the history date, which calls the history dates endpoint. A fetch
+        that uses the plan skips all of that, and skips the count of the query unless
+        :attr:`count` is True, in which case the count is fetched at the start of each fetch
+        since it changes between fetches. When the count is skipped, the total number of
+        rows is taken from the metadata of each page.
+
+        History dates are resolved when the plan is compiled, so a plan compiled with
+        ``history_days_ago`` keeps fetching the same date.
+    """
+
+    asset_type: str
+    """asset type the plan was compiled for"""
+
+    url: str
+    """URL of the instance the plan was compiled for"""
+
+    query: t.Optional[str] = None
+    """query to fetch, with any wizard entries applied"""
+
+    expressions: t.Optional[t.List[dict]] = None
+    """query wizard expressions of query, with any wizard entries applied"""
+
+    saved_query_id: t.Optional[str] = None
+    """ID of the saved query that query came from"""
+
+    fields_parsed: t.List[str] = dataclasses.field(default_factory=list)
+    """validated fields to fetch"""
+
+    sort_field_parsed: t.Optional[str] = None
+    """resolved field to sort on"""
+
+    history_date_parsed: t.Optional[str] = None
+    """resolved history date to fetch"""
+
+    count: bool = False
+    """fetch the count of query at the start of each fetch instead of using page metadata"""
+
+    created: str = ""
+    """date the plan was compiled"""
+
+    client_version: str = VERSION
+    """version of the API client the plan was compiled with"""
+
+    @classmethod
+    def compile(
+        cls,
+        apiobj,
+        query: t.Optional[str] = None,
+        fields_parsed: t.Optional[t.List[str]] = None,
+        sort_field_parsed: t.Optional[str] = None,
+        history_date_parsed: t.Optional[str] = None,
+        wiz_parsed: t.Optional[dict] = None,
+        expressions: t.Optional[t.List[dict]] = None,
+        saved_query_id: t.Optional[str] = None,
+        count: bool = False,
+    ) -> "FetchPlan":
+        """Create a plan from preflight values already resolved by an asset object.
+
+        Args:
+            apiobj (:obj:`axonius_api_client.api.assets.asset_mixin.AssetMixin`): asset
+                object the values were resolved by
+            query: query to fetch
+            fields_parsed: validated fields to fetch
+            sort_field_parsed: resolved field to sort on
+            history_date_parsed: resolved history date to fetch
+            wiz_parsed: parsed wizard entries to apply to query and expressions
+            expressions: query wizard expressions of query
+            saved_query_id: ID of the saved query that query came from
+            count: fetch the count of query at the start of each fetch
+        """
+        if isinstance(wiz_parsed, dict):
+            if wiz_parsed.get("query"):
+                query = wiz_parsed["query"]
+            if wiz_parsed.get("expressions"):
+                expressions = wiz_parsed["expressions"]
+
+        return cls(
+            asset_type=apiobj.ASSET_TYPE,
+            url=apiobj.http.url,
+            query=query,
+            expressions=expressions,
+            saved_query_id=saved_query_id,
+            fields_parsed=list(fields_parsed or []),
+            sort_field_parsed=sort_field_parsed,
+            history_date_parsed=history_date_parsed,
+            count=count,
+            created=dt_now().isoformat(),
+        )
+
+    def check(self, apiobj):
+        """Check that this plan was compiled for the asset type and instance of an asset object.
+
+        Args:
+            apiobj (:obj:`axonius_api_client.api.assets.asset_mixin.AssetMixin`): asset
+                object to check
+
+        Raises:
+            :exc:`ApiError`: if the asset type or the URL of the instance does not match
+        """
+        if self.asset_type != apiobj.ASSET_TYPE:
+            raise ApiError(
+                f"Fetch plan compiled for asset type {self.asset_type!r} can not be used "
+                f"for asset type {apiobj.ASSET_TYPE!r}"
+            )
+
+        if self.url != apiobj.http.url:
+            raise ApiError(
+                f"Fetch plan compiled for instance {self.url!r} can not be used "
+                f"for instance {apiobj.http.url!r}"
+            )
+
+    def get_kwargs(self, apiobj) -> dict:
+        """Get the kwargs that pass this plan to the preflight hooks of get_generator.
+
+        Args:
+            apiobj (:obj:`axonius_api_client.api.assets.asset_mixin.AssetMixin`): asset
+                object that will fetch using this plan
+        """
+        self.check(apiobj=apiobj)
+        kwargs = {
+            "query": self.query,
+            "expressions": self.expressions,
+            "saved_query_id": self.saved_query_id,
+            "_wiz_parsed": None,
+            "_fields_parsed": list(self.fields_parsed),
+            "_sort_field_parsed": self.sort_field_parsed,
+            "_history_date_parsed": self.history_date_parsed,
+        }
+        if not self.count:
+            kwargs["_initial_count"] = None
+        return kwargs
+
+    def save(self, path: PathLike, **kwargs) -> t.Tuple[t.Any, t.Any]:
+        """Save this plan to a JSON file.
+
+        Args:
+            path: path to save plan to
+            **kwargs: passed to :func:`axonius_api_client.tools.path_write`
+        """
+        kwargs.setdefault("overwrite", True)
+        return path_write(obj=path, data=self.to_dict(), is_json=True, **kwargs)
+
+    @classmethod
+    def load(cls, path: PathLike) -> "FetchPlan":
+        """Load a plan from a JSON file.
+
+        Args:
+            path: path to load plan from
+        """
+        _, data = path_read(obj=path, is_json=True)
+        return cls.from_dict(data=data)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FetchPlan":
+        """Create a plan from the output of :meth:`to_dict`.
+
+        Args:
+            data: plan as a dict
+
+        Raises:
+            :exc:`ApiError`: if data is not a dict or is missing required keys
+        """
+        if not isinstance(data, dict):
+            raise ApiError(f"Fetch plan must be a dict, not {type(data)}")
+
+        names = [x.name for x in cls.get_fields()]
+        missing = [x for x in ["asset_type", "url"] if x not in data]
+        if missing:
+            raise ApiError(f"Fetch plan is missing required keys: {missing}")
+
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        items = [
+            f"asset_type={self.asset_type!r}",
+            f"query={self.query!r}",
+            f"fields={len(self.fields_parsed)}",
+            f"count={self.count}",
+            f"created={self.created!r}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
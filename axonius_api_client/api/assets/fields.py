@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 """API for working with fields for assets."""
+import gzip
+import hashlib
+import json
+import os
+import pathlib
 import re
-from typing import List, Optional, Tuple, Union
+import tempfile
+import time
+from typing import Dict, List, Optional, Pattern, Set, Tuple, Union
 
-from cachetools import TTLCache, cached
+from cachetools import LRUCache, TTLCache, cached
+from cachetools.keys import hashkey
 from fuzzyfinder import fuzzyfinder
 
 from ...constants.fields import (
@@ -15,12 +23,187 @@ from ...constants.fields import (
     PRETTY_SCHEMA_TMPL,
 )
 from ...exceptions import ApiError, NotFoundError
-from ...parsers.fields import parse_fields, schema_custom
+from ...parsers.fields import intern_schemas, parse_fields, schema_custom
+from ...setup_env import get_env_fields_cache
 from ...tools import listify, split_str, strip_right
+from ...version import __version__ as VERSION
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ChildMixins
 
+CACHE_GET: TTLCache = TTLCache(maxsize=1024, ttl=300)
+"""In-memory cache of parsed field schemas for :meth:`Fields.get`."""
+
+CACHE_PARSE: LRUCache = LRUCache(maxsize=4096)
+"""In-memory cache of the parsed field schemas of each adapter keyed by a hash of their raw
+fields, shared by all asset types so only adapters whose raw fields changed are parsed again."""
+
+
+@cached(cache=LRUCache(maxsize=256))
+def compile_search(value: str) -> Pattern:
+    """Compile a case insensitive regex for searching field schemas.
+
+    Args:
+        value: regex to compile
+    """
+    return re.compile(value.lower().strip(), re.I)
+
+
+@cached(cache=LRUCache(maxsize=256))
+def compile_fuzzy(value: str) -> Pattern:
+    """Compile the same case insensitive subsequence regex that fuzzyfinder builds.
+
+    Args:
+        value: string to fuzzy match
+    """
+    pattern = ".*?".join(map(re.escape, value))
+    return re.compile(f"(?=({pattern}))", re.I)
+
+
+def get_trigrams(value: str) -> Set[str]:
+    """Get the set of 3 character substrings of a value.
+
+    Args:
+        value: string to split into trigrams
+    """
+    return {value[slice(idx, idx + 3)] for idx in range(len(value) - 2)}
+
+
+class SchemasIndex:
+    """Lowercase hash indexes of a list of field schemas.
+
+    Notes:
+        Each key maps a lowercased value to the position and schema of the first schema
+        with that value, once for all schemas and once for selectable schemas only. A lookup
+        across several keys returns the match with the lowest position, which is the same
+        schema that scanning the list in order and checking each key would find first.
+    """
+
+    KEYS: List[str] = ["name", "name_qual", "name_base", "title", "column_name"]
+    """field schema keys to index"""
+
+    def __init__(self, schemas: List[dict]):
+        """Lowercase hash indexes of field schemas.
+
+        Args:
+            schemas: field schemas to index
+        """
+        self.schemas: List[dict] = schemas
+        self.size: int = len(schemas)
+        self.indexes: Dict[bool, Dict[str, Dict[str, Tuple[int, dict]]]] = {
+            True: {x: {} for x in self.KEYS},
+            False: {x: {} for x in self.KEYS},
+        }
+
+        for pos, schema in enumerate(schemas):
+            selectable = schema.get("selectable", True)
+            for key in self.KEYS:
+                value = schema.get(key)
+                if not isinstance(value, str):
+                    continue
+
+                value = value.lower()
+                self.indexes[False][key].setdefault(value, (pos, schema))
+                if selectable:
+                    self.indexes[True][key].setdefault(value, (pos, schema))
+
+        self.searches: Dict[str, Tuple[List[str], Dict[str, Set[int]], Dict[str, Set[int]]]] = {}
+
+    def can_find(self, keys: List[str]) -> bool:
+        """Check if all keys are indexed.
+
+        Args:
+            keys: field schema keys to check
+        """
+        return all(x in self.KEYS for x in keys)
+
+    def find(self, value: str, keys: List[str], selectable_only: bool = True) -> Optional[dict]:
+        """Find the first field schema where any of keys equals value.
+
+        Args:
+            value: lowercased value to find
+            keys: field schema keys to check
+            selectable_only: only find selectable field schemas
+        """
+        indexes = self.indexes[bool(selectable_only)]
+        found = [indexes[key].get(value) for key in keys]
+        found = [x for x in found if x]
+        return min(found, key=lambda x: x[0])[1] if found else None
+
+    def get_search(self, key: str) -> Tuple[List[str], Dict[str, Set[int]], Dict[str, Set[int]]]:
+        """Get the values of a key with a trigram index and a character index of them.
+
+        Notes:
+            Built the first time a key is searched. Both indexes map lowercased trigrams or
+            characters to the positions of the schemas that contain them, and are only used
+            to narrow down candidates that are then checked against the original values.
+
+        Args:
+            key: field schema key to get search indexes for
+        """
+        search = self.searches.get(key)
+        if search is None:
+            values = []
+            trigrams = {}
+            chars = {}
+            for pos, schema in enumerate(self.schemas):
+                value = schema.get(key)
+                value = value if isinstance(value, str) else ""
+                values.append(value)
+
+                lower = value.lower()
+                for trigram in get_trigrams(lower):
+                    trigrams.setdefault(trigram, set()).add(pos)
+                for char in set(lower):
+                    chars.setdefault(char, set()).add(pos)
+            search = self.searches[key] = (values, trigrams, chars)
+        return search
+
+    def search_contains(self, value: str, keys: List[str]) -> List[int]:
+        """Find the positions of field schemas where any of keys contains value.
+
+        Args:
+            value: lowercased value to find
+            keys: field schema keys to check
+        """
+        found = set()
+        trigrams = get_trigrams(value)
+        for key in keys:
+            values, index, _ = self.get_search(key=key)
+            if trigrams:
+                candidates = set.intersection(*[index.get(x, set()) for x in trigrams])
+            else:
+                candidates = range(self.size)
+            found.update(x for x in candidates if value in values[x])
+        return sorted(found)
+
+    def search_fuzzy(self, value: str, keys: List[str]) -> List[int]:
+        """Find the positions of field schemas where any of keys fuzzy matches value.
+
+        Args:
+            value: value to fuzzy match
+            keys: field schema keys to check
+        """
+        found = set()
+        pattern = compile_fuzzy(value)
+        chars = set(value.lower())
+        for key in keys:
+            values, _, index = self.get_search(key=key)
+            if chars:
+                candidates = set.intersection(*[index.get(x, set()) for x in chars])
+            else:
+                candidates = range(self.size)
+            found.update(x for x in candidates if pattern.search(values[x]))
+        return sorted(found)
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return f"{self.__class__.__name__}(size={self.size})"
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
+
 
 class Fields(ChildMixins):
     """API for working with fields for the parent asset type.
@@ -34,13 +217,36 @@ class Fields(ChildMixins):
         * Get schemas of all adapters and their fields: :meth:`get`
         * Validate field names supplied: :meth:`validate`
 
+        Field schemas are kept in memory for 5 minutes. Set the OS env var
+        ``AX_FIELDS_CACHE=yes`` to also keep them on disk between processes, stored
+        under ``AX_FIELDS_CACHE_PATH`` and keyed by instance URL and asset type. The
+        on-disk cache is only used if the version and build date of the instance
+        match the ones it was stored with, and it is refetched once it is older
+        than ``AX_FIELDS_CACHE_TTL`` seconds.
+
     See Also:
         * Device assets :obj:`axonius_api_client.api.assets.devices.Devices`
         * User assets :obj:`axonius_api_client.api.assets.users.Users`
     """
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=300))
-    def get(self) -> dict:
+    def _init(self, parent):
+        """Post init method for subclasses to use for extra setup.
+
+        Args:
+            parent: parent API model of this child
+        """
+        cache = get_env_fields_cache()
+
+        self.CACHE_ENABLED: bool = cache["enabled"]
+        """use the on-disk cache of field schemas"""
+
+        self.CACHE_PATH: pathlib.Path = cache["path"]
+        """directory to store the on-disk cache of field schemas in"""
+
+        self.CACHE_TTL: int = cache["ttl"]
+        """seconds the on-disk cache of field schemas is valid for"""
+
+    def get(self, refresh: bool = False) -> dict:
         """Get the schema of all adapters and their fields.
 
         Examples:
@@ -61,8 +267,171 @@ class Fields(ChildMixins):
             ...     title = schema['title']
             ...     print(f"title {title!r}, qualified name {name!r}, base name {name!r}")
 
+            Ignore the in-memory and on-disk caches and get the fields from the instance
+
+            >>> fields = apiobj.fields.get(refresh=True)
+
+        Args:
+            refresh: ignore the in-memory and on-disk caches of field schemas
         """
-        return parse_fields(raw=self._get().document_meta)
+        key = hashkey(self)
+        schemas = None if refresh else CACHE_GET.get(key)
+        if schemas is None:
+            schemas = CACHE_GET[key] = self._get_parsed(refresh=refresh)
+        return schemas
+
+    @property
+    def cache_file(self) -> pathlib.Path:
+        """Get the path of the on-disk cache of field schemas for this instance and asset type."""
+        digest = hashlib.sha256(self.http.url.encode("utf-8")).hexdigest()[:16]
+        name = f"{digest}_{self.parent.ASSET_TYPE}.json.gz"
+        return pathlib.Path(self.CACHE_PATH) / name
+
+    @property
+    def cache_build(self) -> dict:
+        """Get the version and build date of the instance to key the on-disk cache with."""
+        from ..system import Meta
+
+        if not hasattr(self, "_meta"):
+            self._meta = Meta(auth=self.auth)
+
+        about = self._meta.about(error=False)
+        version = about.get("Version", "") or about.get("Installed Version", "")
+        build_date = about.get("Build Date", "")
+        return {"version": version, "build_date": build_date} if version or build_date else {}
+
+    def _get_parsed(self, refresh: bool = False) -> dict:
+        """Get the parsed field schemas from the on-disk cache or from the instance.
+
+        Args:
+            refresh: ignore the on-disk cache of field schemas
+        """
+        if not self.CACHE_ENABLED:
+            return self._parse()
+
+        build = self.cache_build
+        schemas = None if refresh else self._load_cache(build=build)
+        if schemas is None:
+            hashes = {}
+            schemas = self._parse(hashes=hashes)
+            self._save_cache(schemas=schemas, build=build, hashes=hashes)
+        return schemas
+
+    def _parse(self, hashes: Optional[Dict[str, str]] = None) -> dict:
+        """Get the field schemas from the instance and parse the adapters that changed.
+
+        Args:
+            hashes: dict to fill with the hash of the raw fields of each adapter
+        """
+        hashes = {} if hashes is None else hashes
+        raw = self._get().document_meta
+        known = set(CACHE_PARSE)
+        schemas = parse_fields(raw=raw, cache=CACHE_PARSE, hashes=hashes)
+        parsed = len([x for x in hashes.values() if x not in known])
+        self.LOG.debug(f"Parsed field schemas for {parsed} of {len(hashes)} adapters")
+        return schemas
+
+    def _load_cache(self, build: dict) -> Optional[dict]:
+        """Load the on-disk cache of field schemas if it is still valid.
+
+        Args:
+            build: current version and build date of the instance
+        """
+        path = self.cache_file
+        if not build or not path.is_file():
+            return None
+
+        try:
+            with gzip.open(path, mode="rt", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except Exception as exc:
+            self.LOG.warning(f"Unable to load field schema cache {str(path)!r}: {exc}")
+            return None
+
+        current = {
+            "url": self.http.url,
+            "asset_type": self.parent.ASSET_TYPE,
+            "build": build,
+            "client_version": VERSION,
+        }
+        stored = {k: data.get(k) for k in current}
+        if stored["client_version"] != VERSION:
+            self.LOG.debug(f"Field schema cache {str(path)!r} is stale: {stored} != {current}")
+            return None
+
+        # adapters that did not change since the cache was saved are not parsed again,
+        # even if the cache has expired or the instance has been upgraded since
+        schemas = self._seed_parse_cache(schemas=data["schemas"], hashes=data.get("hashes"))
+
+        age = time.time() - path.stat().st_mtime
+        if age > self.CACHE_TTL:
+            self.LOG.debug(f"Field schema cache {str(path)!r} expired after {age:.0f} seconds")
+            return None
+
+        if stored != current:
+            self.LOG.debug(f"Field schema cache {str(path)!r} is stale: {stored} != {current}")
+            return None
+
+        self.LOG.debug(f"Loaded field schema cache {str(path)!r}")
+        return schemas
+
+    @staticmethod
+    def _seed_parse_cache(schemas: dict, hashes: Optional[Dict[str, str]] = None) -> dict:
+        """Add the parsed field schemas of each adapter from the on-disk cache to CACHE_PARSE.
+
+        Args:
+            schemas: parsed field schemas from the on-disk cache
+            hashes: hash of the raw fields of each adapter from the on-disk cache
+
+        Returns:
+            schemas with the schemas of each adapter replaced by the ones in CACHE_PARSE
+        """
+        seeded = {}
+        for adapter, adapter_schemas in schemas.items():
+            digest = (hashes or {}).get(adapter)
+            if digest:
+                if digest not in CACHE_PARSE:
+                    CACHE_PARSE[digest] = intern_schemas(schemas=adapter_schemas)
+                adapter_schemas = CACHE_PARSE[digest]
+            seeded[adapter] = adapter_schemas
+        return seeded
+
+    def _save_cache(self, schemas: dict, build: dict, hashes: Optional[Dict[str, str]] = None):
+        """Save the on-disk cache of field schemas.
+
+        Args:
+            schemas: parsed field schemas
+            build: current version and build date of the instance
+            hashes: hash of the raw fields of each adapter
+        """
+        if not build:
+            return
+
+        path = self.cache_file
+        data = {
+            "url": self.http.url,
+            "asset_type": self.parent.ASSET_TYPE,
+            "build": build,
+            "client_version": VERSION,
+            "hashes": hashes or {},
+            "schemas": schemas,
+        }
+
+        temp = None
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as fh:
+                temp = pathlib.Path(fh.name)
+                with gzip.open(fh, mode="wt", encoding="utf-8") as gz:
+                    json.dump(data, gz, separators=(",", ":"))
+            os.replace(temp, path)
+        except Exception as exc:
+            self.LOG.warning(f"Unable to save field schema cache {str(path)!r}: {exc}")
+            if temp and temp.exists():
+                temp.unlink()
+            return
+
+        self.LOG.debug(f"Saved field schema cache {str(path)!r}")
 
     def validate(
         self,
@@ -188,7 +557,7 @@ class Fields(ChildMixins):
         adapter = self.get_adapter_name(value=adapter)
         schemas = fields[adapter]
         if fields_custom and adapter in fields_custom:
-            schemas += fields_custom[adapter]
+            schemas = schemas + fields_custom[adapter]
         schema = self.get_field_schema(
             value=afield, schemas=schemas, selectable_only=selectable_only
         )
@@ -251,6 +620,7 @@ class Fields(ChildMixins):
         fields = self.get()
 
         matches = []
+        seen = set()
 
         for adapter_re, fields_re in splits:
             adapters = self.get_adapter_names(value=adapter_re)
@@ -262,8 +632,10 @@ class Fields(ChildMixins):
                     if root_only:
                         fschemas = [x for x in fschemas if x["is_root"]]
 
-                    names = [x[key] for x in fschemas]
-                    matches += [x for x in names if x not in matches]
+                    for name in [x[key] for x in fschemas]:
+                        if name not in seen:
+                            seen.add(name)
+                            matches.append(name)
         return matches
 
     def get_field_names_eq(
@@ -303,6 +675,7 @@ class Fields(ChildMixins):
         fields = self.get()
 
         matches = []
+        seen = set()
 
         for adapter_name, names in splits:
             adapter = self.get_adapter_name(value=adapter_name)
@@ -316,7 +689,11 @@ class Fields(ChildMixins):
                 )
 
                 match = schema[key] if key else schema
-                if match not in matches:
+                if isinstance(match, str):
+                    if match not in seen:
+                        seen.add(match)
+                        matches.append(match)
+                elif match not in matches:
                     matches.append(match)
 
         return matches
@@ -344,13 +721,26 @@ class Fields(ChildMixins):
         fields = self.get()
 
         matches = []
+        seen = set()
 
         for adapter_name, names in splits:
             adapter = self.get_adapter_name(value=adapter_name)
             for name in names:
                 schemas = fields[adapter]
-                amatches = self.fuzzy_filter(search=name, schemas=schemas, key=key, root_only=True)
-                matches += [x for x in amatches if x not in matches]
+                amatches = self.fuzzy_filter(
+                    search=name,
+                    schemas=schemas,
+                    key=key,
+                    root_only=True,
+                    index=self.get_index(schemas=schemas),
+                )
+                for match in amatches:
+                    if isinstance(match, str):
+                        if match not in seen:
+                            seen.add(match)
+                            matches.append(match)
+                    elif match not in matches:
+                        matches.append(match)
 
         return matches
 
@@ -398,6 +788,7 @@ class Fields(ChildMixins):
         root_only: bool = False,
         key: str = "name_qual",
         fuzzy_keys: List[str] = FUZZY_SCHEMAS_KEYS,
+        index: Optional[SchemasIndex] = None,
         **kwargs,
     ) -> List[dict]:
         """Perform a fuzzy search against a set of field schemas.
@@ -408,6 +799,8 @@ class Fields(ChildMixins):
             root_only: only search against schemas of root fields
             key: return the schema key value instead of the field schemas
             fuzzy_keys: list of keys to check search against in each field schema
+            index: index from :meth:`get_index` of schemas or of a list that contains
+                schemas, used to find candidates instead of checking every schema
         """
 
         def do_skip(schema):
@@ -416,25 +809,48 @@ class Fields(ChildMixins):
             not_select = not schema.get("selectable", True)
             is_root = root_only and not schema["is_root"]
 
-            if any([schema in matches, is_details, is_all, not_select, is_root]):
+            if any([is_details, is_all, not_select, is_root]):
                 return True
 
             return False
 
+        if index is not None:
+            allowed = None if schemas is index.schemas else {id(x) for x in schemas}
+
+            def get_matches(positions):
+                found = [index.schemas[x] for x in positions]
+                if allowed is not None:
+                    found = [x for x in found if id(x) in allowed]
+                return [x for x in found if not do_skip(x)]
+
+            # try to do string matches first
+            value = search.strip().lower()
+            matches = get_matches(index.search_contains(value=value, keys=fuzzy_keys))
+
+            # if no string matches, try to find matches with fuzzyfinder's regex
+            if not matches:
+                matches = get_matches(index.search_fuzzy(value=search, keys=fuzzy_keys))
+
+            return [x[key] for x in matches] if key else matches
+
         matches = []
 
         # try to do string matches first
         for schema in schemas:
-            if not do_skip(schema) and any(
-                [search.strip().lower() in x for x in [schema[x] for x in fuzzy_keys]]
+            if (
+                schema not in matches
+                and not do_skip(schema)
+                and any([search.strip().lower() in x for x in [schema[x] for x in fuzzy_keys]])
             ):
                 matches.append(schema)
 
         # if no string matches, try to find matches with fuzzyfinder
         if not matches:
             for schema in schemas:
-                if not do_skip(schema) and list(
-                    fuzzyfinder(search, [schema[x] for x in fuzzy_keys])
+                if (
+                    schema not in matches
+                    and not do_skip(schema)
+                    and list(fuzzyfinder(search, [schema[x] for x in fuzzy_keys]))
                 ):
                     matches.append(schema)
 
@@ -500,18 +916,12 @@ class Fields(ChildMixins):
             schemas: list of field schemas to search through
             keys: list of keys to check regex value against
         """
-        search = re.compile(value.lower().strip(), re.I)
-
-        matches = []
-
-        for schema in schemas:
-            if not schema.get("selectable"):
-                continue
-
-            for key in keys:
-                if search.search(schema[key]) and schema not in matches:
-                    matches.append(schema)
-        return matches
+        search = compile_search(value)
+        return [
+            schema
+            for schema in schemas
+            if schema.get("selectable") and any(search.search(schema[key]) for key in keys)
+        ]
 
     def get_field_schema(
         self,
@@ -535,14 +945,22 @@ class Fields(ChildMixins):
             :exc:`NotFoundError`: when no field name equals supplied value
         """
         search = value.lower().strip()
+        index = self.get_index(schemas=schemas)
+        indexed = bool(index and index.can_find(keys=keys))
+
+        if indexed:
+            schema = index.find(value=search, keys=keys, selectable_only=selectable_only)
+            if schema:
+                return schema
 
         if selectable_only:
             schemas = [x for x in schemas if x.get("selectable", True)]
 
-        for schema in schemas:
-            for key in keys:
-                if search.lower().strip() == schema[key].lower():
-                    return schema
+        if not indexed:
+            for schema in schemas:
+                for key in keys:
+                    if search == schema[key].lower():
+                        return schema
 
         if not fields_error:
             self.LOG.warning(f"No schema found for field {search!r}, creating custom schema")
@@ -552,6 +970,7 @@ class Fields(ChildMixins):
         kwargs["search"] = value
         kwargs["schemas"] = schemas
         kwargs["key"] = ""
+        kwargs.setdefault("index", index)
         fuzzy = self.fuzzy_filter(**kwargs)
 
         err = "No fuzzy matches, all valid fields:"
@@ -564,6 +983,42 @@ class Fields(ChildMixins):
         errs = [pre, err, "", *self._prettify_schemas(schemas=fuzzy or schemas)]
         raise NotFoundError("\n".join(errs))
 
+    def get_index(self, schemas: Optional[List[dict]] = None) -> Optional[SchemasIndex]:
+        """Get the hash index of the field schemas of an adapter from :meth:`get`.
+
+        Notes:
+            Indexes are built the first time they are needed and rebuilt whenever
+            :meth:`get` loads the field schemas again.
+
+        Args:
+            schemas: field schemas of an adapter from :meth:`get`, or None to get the index
+                across all adapters
+
+        Returns:
+            None if schemas is not the list of field schemas of an adapter from :meth:`get`
+        """
+        fields = self.get()
+        if getattr(self, "_indexes_fields", None) is not fields:
+            self._indexes_fields: dict = fields
+            self._indexes_ids: Dict[int, str] = {id(v): k for k, v in fields.items()}
+            self._indexes: Dict[Optional[str], SchemasIndex] = {}
+
+        if schemas is None:
+            adapter = None
+            size = sum(len(x) for x in fields.values())
+        else:
+            adapter = self._indexes_ids.get(id(schemas))
+            if adapter is None:
+                return None
+            size = len(schemas)
+
+        index = self._indexes.get(adapter)
+        if index is None or index.size != size:
+            if schemas is None:
+                schemas = [x for y in fields.values() for x in y]
+            index = self._indexes[adapter] = SchemasIndex(schemas=schemas)
+        return index
+
     def split_searches(self, value: Union[List[str], str]) -> List[Tuple[str, List[str]]]:
         """Split a list of strings into adapter:field(s) format.
 
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""Diffs of the assets returned by a query between history dates."""
+import collections
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import logging
+import typing as t
+
+from ...constants.api import (
+    DEFAULT_CALLBACKS_CLS,
+    HISTORY_DIFF_BATCH_SIZE,
+    HISTORY_DIFF_WORKERS,
+)
+from ...constants.fields import AXID
+from ...exceptions import ApiError
+from ...tools import json_dump, listify
+from .fetch_plan import FetchPlan
+
+ADDED: str = "added"
+"""change of an asset that is only in the newer date"""
+
+REMOVED: str = "removed"
+"""change of an asset that is only in the older date"""
+
+CHANGED: str = "changed"
+"""change of an asset that is in both dates with different values"""
+
+
+class HistoryDiff:
+    """Diff of the assets returned by a query between consecutive history dates.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices
+
+        Diff the devices running Windows between a history date and the current data
+
+        >>> diff = apiobj.get_history_diff(
+        ...     dates=["2023-01-01", None],
+        ...     query='(specific_data.data.os.type == "Windows")',
+        ...     fields=["hostname", "os.distribution"],
+        ... )
+        >>> for change in diff:
+        ...     print(change["change"], change["id"], change["fields"])
+
+        Diff each day of a week against the day before it
+
+        >>> changes = apiobj.get_history_diff(date_start="2023-01-01", date_end="2023-01-08")
+
+    Notes:
+        A diff is made between each date and the date after it. Up to max_workers dates are
+        fetched at once, and each row is reduced to a hash of its values as it arrives, so
+        only the hashes of the dates are held in memory instead of the rows. Assets with
+        a hash in only one of the dates are added or removed. Assets with a different hash
+        in each date are fetched again from both dates in batches of batch_size by
+        internal_axon_id to find the fields that changed and their old and new values.
+
+        Each change is a dict with the keys ``change`` (added, removed, or changed), ``id``,
+        ``date_old``, ``date_new``, and ``fields``, a list of dicts with the keys ``field``,
+        ``old``, and ``new`` for changed assets. A date of None is the current data.
+    """
+
+    def __init__(
+        self,
+        apiobj,
+        dates: t.List[t.Optional[str]],
+        fetch_plan: t.Optional[FetchPlan] = None,
+        ignore_fields: t.Optional[t.List[str]] = None,
+        max_workers: int = HISTORY_DIFF_WORKERS,
+        batch_size: int = HISTORY_DIFF_BATCH_SIZE,
+        **kwargs,
+    ):
+        """Diff of the assets returned by a query between history dates.
+
+        Args:
+            apiobj (:obj:`axonius_api_client.api.assets.asset_mixin.AssetMixin`): asset
+                object to fetch from
+            dates: resolved history dates to diff, oldest first, None for the current data
+            fetch_plan: query and fields to diff, if not supplied one will be compiled
+                from kwargs using :meth:`AssetMixin.get_fetch_plan`
+            ignore_fields: fields of rows to leave out of the diff
+            max_workers: number of history dates to fetch at once
+            batch_size: changed assets to fetch the rows of at a time
+            **kwargs: passed to :meth:`AssetMixin.get_fetch_plan` and
+                :meth:`AssetMixin.get_generator`
+        """
+        if len(dates) < 2:
+            raise ApiError(f"At least 2 history dates are needed for a diff, got {dates}")
+
+        self.apiobj = apiobj
+        self.dates: t.List[t.Optional[str]] = list(dates)
+        self.ignore_fields: t.List[str] = listify(ignore_fields)
+        self.max_workers: int = max(1, max_workers)
+        self.batch_size: int = max(1, batch_size)
+        self.kwargs: dict = {
+            k: v for k, v in kwargs.items() if not k.startswith(("export", "history_"))
+        }
+        self.fetch_plan: FetchPlan = fetch_plan or apiobj.get_fetch_plan(**kwargs)
+        self.fetch_plan.check(apiobj=apiobj)
+        self.log: logging.Logger = apiobj.LOG.getChild(self.__class__.__name__)
+        self.stats: t.List[dict] = []
+
+    def get(self) -> t.List[dict]:
+        """Get the changes between each pair of dates."""
+        return list(self.get_generator())
+
+    def get_generator(self) -> t.Generator[dict, None, None]:
+        """Get the changes between each pair of dates as they are found."""
+        self.stats = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = collections.deque(
+                [pool.submit(self.get_fingerprints, date=x) for x in self.dates[: self.max_workers]]
+            )
+            old = None
+            for idx, date in enumerate(self.dates):
+                new = pending.popleft().result()
+                if idx + self.max_workers < len(self.dates):
+                    date_next = self.dates[idx + self.max_workers]
+                    pending.append(pool.submit(self.get_fingerprints, date=date_next))
+
+                if idx:
+                    yield from self._diff_pair(
+                        date_old=self.dates[idx - 1], date_new=date, old=old, new=new
+                    )
+                old = new
+
+    def __iter__(self) -> t.Generator[dict, None, None]:
+        """Get the changes between each pair of dates as they are found."""
+        return self.get_generator()
+
+    def get_plan(self, date: t.Optional[str]) -> FetchPlan:
+        """Get the fetch plan for a history date.
+
+        Args:
+            date: resolved history date, None for the current data
+        """
+        return dataclasses.replace(self.fetch_plan, history_date_parsed=date)
+
+    def get_fingerprints(self, date: t.Optional[str]) -> t.Dict[str, bytes]:
+        """Get the hash of each row of a date keyed by internal_axon_id.
+
+        Args:
+            date: resolved history date, None for the current data
+        """
+        self.log.info(f"Fetching fingerprints of {self.apiobj.ASSET_TYPE} for date {date}")
+        kwargs = dict(self.kwargs)
+        kwargs.update({"export": DEFAULT_CALLBACKS_CLS, "fetch_plan": self.get_plan(date=date)})
+        return {
+            row[AXID.name]: self.get_fingerprint(row=row)
+            for row in self.apiobj.get_generator(**kwargs)
+        }
+
+    def get_fingerprint(self, row: dict) -> bytes:
+        """Get the hash of the values of a row.
+
+        Args:
+            row: row to hash
+        """
+        data = {k: v for k, v in row.items() if k not in self.ignore_fields}
+        value = json.dumps(data, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(value, digest_size=16).digest()
+
+    def get_changed_fields(self, old: dict, new: dict) -> t.List[dict]:
+        """Get the fields that are different between the rows of an asset in two dates.
+
+        Args:
+            old: row from the older date
+            new: row from the newer date
+        """
+        fields = []
+        for field in sorted(set(old) | set(new)):
+            if field in self.ignore_fields:
+                continue
+            if old.get(field) != new.get(field):
+                fields.append({"field": field, "old": old.get(field), "new": new.get(field)})
+        return fields
+
+    def _diff_pair(
+        self,
+        date_old: t.Optional[str],
+        date_new: t.Optional[str],
+        old: t.Dict[str, bytes],
+        new: t.Dict[str, bytes],
+    ) -> t.Generator[dict, None, None]:
+        """Get the changes between the fingerprints of two dates.
+
+        Args:
+            date_old: older date
+            date_new: newer date
+            old: fingerprints of the older date
+            new: fingerprints of the newer date
+        """
+        stats = {"date_old": date_old, "date_new": date_new, ADDED: 0, REMOVED: 0, CHANGED: 0}
+        base = {"date_old": date_old, "date_new": date_new, "fields": []}
+
+        for axid in sorted(old.keys() - new.keys()):
+            stats[REMOVED] += 1
+            yield {"change": REMOVED, "id": axid, **base}
+
+        for axid in sorted(new.keys() - old.keys()):
+            stats[ADDED] += 1
+            yield {"change": ADDED, "id": axid, **base}
+
+        changed = sorted([x for x in old.keys() & new.keys() if old[x] != new[x]])
+        for idx in range(0, len(changed), self.batch_size):
+            batch = changed[slice(idx, idx + self.batch_size)]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+                future_old = pool.submit(self._get_rows, ids=batch, date=date_old)
+                future_new = pool.submit(self._get_rows, ids=batch, date=date_new)
+                rows_old, rows_new = future_old.result(), future_new.result()
+            for axid in batch:
+                if axid not in rows_old or axid not in rows_new:
+                    continue
+                fields = self.get_changed_fields(old=rows_old[axid], new=rows_new[axid])
+                if fields:
+                    stats[CHANGED] += 1
+                    yield {"change": CHANGED, "id": axid, **base, "fields": fields}
+
+        self.stats.append(stats)
+        self.log.info(f"Finished diff of {self.apiobj.ASSET_TYPE}: {json_dump(stats)}")
+
+    def _get_rows(self, ids: t.List[str], date: t.Optional[str]) -> t.Dict[str, dict]:
+        """Get the rows of assets in a date keyed by internal_axon_id.
+
+        Args:
+            ids: internal_axon_ids of assets
+            date: resolved history date, None for the current data
+        """
+        kwargs = dict(self.kwargs)
+        kwargs.update({"export": DEFAULT_CALLBACKS_CLS, "fetch_plan": self.get_plan(date=date)})
+        result = self.apiobj.get_by_ids(ids=ids, max_workers=1, generator=True, **kwargs)
+        return {row[AXID.name]: row for row in result.assets}
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return (
+            f"{self.__class__.__name__}(asset_type={self.apiobj.ASSET_TYPE!r}, "
+            f"dates={self.dates}, query={self.fetch_plan.query!r})"
+        )
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
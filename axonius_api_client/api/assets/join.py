@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""Streaming hash join of the assets of two asset types."""
+import concurrent.futures
+import logging
+import re
+import typing as t
+
+from ...constants.api import DEFAULT_CALLBACKS_CLS, JOIN_NORMALIZE
+from ...constants.fields import AXID
+from ...exceptions import ApiError
+from ...tools import listify
+from ..asset_callbacks.base_aggregate import Aggregator, resolve_field
+
+
+def strip_domain(value: str) -> str:
+    """Strip the domain from a key like user@domain or DOMAIN\\user.
+
+    Args:
+        value: key to normalize
+    """
+    return re.sub(r"@.*$", "", value.rsplit("\\", 1)[-1])
+
+
+NORMALIZERS: t.Dict[str, t.Callable[[str], str]] = {
+    "strip": str.strip,
+    "lower": str.casefold,
+    "domain": strip_domain,
+}
+"""named functions to normalize join keys with"""
+
+JOIN_HOWS: t.List[str] = ["inner", "left"]
+"""valid types of join"""
+
+
+class AssetJoin:
+    """Join the assets of one asset type to the assets of another by matching field values.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect`
+
+        Join users to the devices they last used by matching the user name of users to the
+        last used users of devices, ignoring case and domains
+
+        >>> join = client.join_assets(
+        ...     left="users",
+        ...     right="devices",
+        ...     left_key="username",
+        ...     right_key="last_used_users",
+        ...     left_spec={"fields": ["username", "mail"]},
+        ...     right_spec={"fields": ["hostname", "last_used_users"]},
+        ...     normalize=["strip", "lower", "domain"],
+        ... )
+        >>> for row in join.get_generator():
+        ...     print(row["specific_data.data.hostname"], row["users:specific_data.data.mail"])
+
+        Write the joined rows to a CSV file, keeping devices without a matching user
+
+        >>> join = client.join_assets(
+        ...     left="users",
+        ...     right="devices",
+        ...     left_key="mail",
+        ...     right_key="last_used_users",
+        ...     right_spec={"export": "csv", "export_file": "joined.csv"},
+        ...     how="left",
+        ... )
+        >>> join.run()
+        {'build': 'users', 'build_rows': 300000, 'index_keys': 298114, ...}
+
+    Notes:
+        The assets of the smaller side (by count, unless build is supplied) are fetched first
+        and reduced to a hash index of their normalized key values, holding only the values of
+        the fields supplied in the ``fields`` of their spec and internal_axon_id. The assets
+        of the other side are then streamed through
+        :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_generator` with the
+        index as the ``join`` argument of the callbacks, so each row is joined as it is
+        fetched and passed on to the export of its spec, which can be any export format.
+
+        A key field can be a list field or a sub-field of a complex field, and every value of
+        it is a key. Each joined row is a row of the probed side with a column for each field
+        of the build side prefixed with the name of the build side, and a row that matches
+        more than one asset of the build side is returned once for each of them. With a how
+        of inner rows that match nothing are dropped, with a how of left they are returned
+        with empty build columns.
+    """
+
+    def __init__(
+        self,
+        apiobjs: t.Dict[str, t.Any],
+        left: str,
+        right: str,
+        left_key: str,
+        right_key: t.Optional[str] = None,
+        left_spec: t.Optional[dict] = None,
+        right_spec: t.Optional[dict] = None,
+        build: str = "auto",
+        how: str = "inner",
+        normalize: t.Optional[t.List[t.Union[str, t.Callable[[str], str]]]] = JOIN_NORMALIZE,
+        log: t.Optional[logging.Logger] = None,
+    ):
+        """Streaming hash join of the assets of two asset types.
+
+        Args:
+            apiobjs: asset objects keyed by asset type
+            left: asset type of the left side
+            right: asset type of the right side
+            left_key: field of the left side to match
+            right_key: field of the right side to match, defaults to left_key
+            left_spec: kwargs for get_generator of the left side
+            right_spec: kwargs for get_generator of the right side
+            build: side to build the index from, left, right, or auto for the smaller side
+            how: inner to only return rows that match, left to also return rows that do not
+            normalize: names of :data:`NORMALIZERS` or callables to apply to key values
+            log: logger to use
+        """
+        for side in [left, right]:
+            if side not in apiobjs:
+                raise ApiError(f"Invalid asset type {side!r}, valid: {list(apiobjs)}")
+        if build not in ["auto", "left", "right"]:
+            raise ApiError(f"Invalid build {build!r}, valid: ['auto', 'left', 'right']")
+        if how not in JOIN_HOWS:
+            raise ApiError(f"Invalid how {how!r}, valid: {JOIN_HOWS}")
+
+        self.apiobjs: t.Dict[str, t.Any] = {"left": apiobjs[left], "right": apiobjs[right]}
+        self.names: t.Dict[str, str] = {"left": left, "right": right}
+        self.keys: t.Dict[str, str] = {"left": left_key, "right": right_key or left_key}
+        self.specs: t.Dict[str, dict] = {
+            "left": dict(left_spec or {}),
+            "right": dict(right_spec or {}),
+        }
+        self.build: str = build
+        self.how: str = how
+        self.normalizers: t.List[t.Callable[[str], str]] = self.get_normalizers(normalize)
+        self.log: logging.Logger = log or logging.getLogger(__name__)
+
+        self.index: t.Dict[str, t.Union[int, t.List[int]]] = {}
+        self.values: t.List[tuple] = []
+        self.columns: t.List[str] = []
+        self.schemas: t.List[dict] = []
+        self.probe_key: t.Optional[str] = None
+        self.probe_root: t.Optional[str] = None
+        self.stats: dict = {}
+
+    @staticmethod
+    def get_normalizers(
+        normalize: t.Optional[t.List[t.Union[str, t.Callable[[str], str]]]]
+    ) -> t.List[t.Callable[[str], str]]:
+        """Get the functions to normalize key values with.
+
+        Args:
+            normalize: names of :data:`NORMALIZERS` or callables
+        """
+        normalizers = []
+        for item in listify(normalize):
+            if callable(item):
+                normalizers.append(item)
+            elif item in NORMALIZERS:
+                normalizers.append(NORMALIZERS[item])
+            else:
+                raise ApiError(f"Invalid normalize {item!r}, valid: {list(NORMALIZERS)}")
+        return normalizers
+
+    def get(self) -> t.List[dict]:
+        """Get the joined rows."""
+        return list(self.get_generator())
+
+    def run(self) -> dict:
+        """Join without keeping the rows, for a probe side spec that exports to a sink."""
+        for _ in self.get_generator():
+            pass
+        return self.stats
+
+    def get_generator(self) -> t.Generator[dict, None, None]:
+        """Build the index then yield the joined rows as the other side is fetched."""
+        build = self.get_build_side()
+        probe = "right" if build == "left" else "left"
+        self.build_index(side=build)
+
+        kwargs = dict(self.specs[probe])
+        kwargs["fields"] = listify(kwargs.get("fields")) + [self.probe_root]
+        kwargs["join"] = self
+        self.log.info(f"Joining {self.names[probe]} to index of {self.names[build]}")
+        yield from self.apiobjs[probe].get_generator(**kwargs)
+        self.log.info(f"Finished join: {self.stats}")
+
+    def get_build_side(self) -> str:
+        """Get the side to build the index from, counting both sides if build is auto."""
+        if self.build != "auto":
+            return self.build
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            futures = {
+                side: pool.submit(self.apiobjs[side].count, query=self.specs[side].get("query"))
+                for side in ["left", "right"]
+            }
+            counts = {side: future.result() for side, future in futures.items()}
+        self.log.info(f"Counts of join sides: {counts}")
+        return "left" if counts["left"] <= counts["right"] else "right"
+
+    def build_index(self, side: str):
+        """Fetch the assets of a side and index the values of their fields by key.
+
+        Notes:
+            The rows of the other side can then be joined by passing this object as the
+            ``join`` argument of its get or get_generator, as long as its key field is
+            included in the fields fetched.
+
+        Args:
+            side: left or right
+        """
+        apiobj = self.apiobjs[side]
+        name = self.names[side]
+        key, key_root = resolve_field(apiobj=apiobj, value=self.keys[side])
+
+        columns = [AXID.name]
+        for value in listify(self.specs[side].get("fields")):
+            root = resolve_field(apiobj=apiobj, value=value)[1]
+            if root not in columns:
+                columns.append(root)
+
+        kwargs = dict(self.specs[side])
+        kwargs.update(
+            {
+                "fields": [x for x in columns if x != AXID.name] + [key_root],
+                "export": DEFAULT_CALLBACKS_CLS,
+            }
+        )
+        kwargs.setdefault("fields_default", False)
+        for arg in ["field_titles", "field_flatten", "field_join", "field_compress"]:
+            kwargs[arg] = False
+
+        self.index, self.values, self.columns = {}, [], columns
+        self.schemas = [self.get_schema(apiobj=apiobj, name=name, column=x) for x in columns]
+        self.log.info(f"Building join index of {name} on {key}")
+
+        for row in apiobj.get_generator(**kwargs):
+            idx = len(self.values)
+            self.values.append(tuple(row.get(x) for x in columns))
+            for value in self.get_keys(row=row, field=key):
+                found = self.index.get(value)
+                if found is None:
+                    self.index[value] = idx
+                elif isinstance(found, int):
+                    self.index[value] = [found, idx]
+                else:
+                    found.append(idx)
+
+        probe = "right" if side == "left" else "left"
+        self.probe_key, self.probe_root = resolve_field(
+            apiobj=self.apiobjs[probe], value=self.keys[probe]
+        )
+        self.stats = {
+            "build": name,
+            "build_rows": len(self.values),
+            "index_keys": len(self.index),
+            "probe": self.names[probe],
+            "probe_rows": 0,
+            "joined_rows": 0,
+            "unmatched_rows": 0,
+        }
+        self.log.info(f"Built join index: {self.stats}")
+
+    def get_keys(self, row: dict, field: str) -> t.List[str]:
+        """Get the unique normalized keys of a field in a row.
+
+        Args:
+            row: row to get keys from
+            field: fully qualified name of field or sub-field
+        """
+        keys = []
+        for value in Aggregator.get_values(row=row, field=field):
+            value = str(value)
+            for normalizer in self.normalizers:
+                value = normalizer(value)
+            if value and value not in keys:
+                keys.append(value)
+        return keys
+
+    def join_rows(self, rows: t.List[dict]) -> t.List[dict]:
+        """Join rows of the probed side to the index.
+
+        Args:
+            rows: rows to join
+        """
+        joined = []
+        for row in rows:
+            matches = []
+            for value in self.get_keys(row=row, field=self.probe_key):
+                found = self.index.get(value)
+                for idx in [found] if isinstance(found, int) else found or []:
+                    if idx not in matches:
+                        matches.append(idx)
+
+            self.stats["probe_rows"] += 1
+            if not matches:
+                self.stats["unmatched_rows"] += 1
+                if self.how == "left":
+                    joined.append({**row, **{x["name_qual"]: None for x in self.schemas}})
+                continue
+
+            for idx in matches:
+                columns = zip(self.schemas, self.values[idx])
+                joined.append({**row, **{x["name_qual"]: value for x, value in columns}})
+            self.stats["joined_rows"] += len(matches)
+        return joined
+
+    @staticmethod
+    def get_schema(apiobj, name: str, column: str) -> dict:
+        """Get the custom schema of a column of the build side in joined rows.
+
+        Args:
+            apiobj (:obj:`axonius_api_client.api.assets.asset_mixin.AssetMixin`): asset
+                object of the build side
+            name: name of the build side
+            column: fully qualified name of a field of the build side
+        """
+        try:
+            schema = apiobj.fields.get_field_name(value=column, key=None, selectable_only=False)
+        except ApiError:
+            schema = {"column_title": column, "title": column, "type": "string"}
+
+        return {
+            "adapter_name": "join",
+            "column_name": f"{name}:{column}",
+            "column_title": f"{name.title()}: {schema.get('column_title') or column}",
+            "is_complex": False,
+            "is_list": bool(schema.get("is_list") or schema.get("is_complex")),
+            "is_root": True,
+            "parent": "root",
+            "name": f"{name}:{column}",
+            "name_base": f"{name}:{column}",
+            "name_qual": f"{name}:{column}",
+            "title": f"{name.title()}: {schema.get('title') or column}",
+            "type": schema.get("type", "string"),
+            "type_norm": schema.get("type_norm", "string"),
+            "is_custom": True,
+        }
+
+    def __getstate__(self) -> dict:
+        """Leave the asset objects out when shipped to transform worker processes."""
+        state = dict(self.__dict__)
+        state["apiobjs"] = {}
+        return state
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return (
+            f"{self.__class__.__name__}(left={self.names['left']!r}, "
+            f"right={self.names['right']!r}, keys={self.keys}, how={self.how!r})"
+        )
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
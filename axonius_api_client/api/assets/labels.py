@@ -1,13 +1,74 @@
 # -*- coding: utf-8 -*-
 """API for working with tags for assets."""
-from typing import List, Union
-
-from ...tools import listify
+import concurrent.futures
+import dataclasses
+import time
+from typing import Callable, Dict, List, Optional, Union
+
+import requests
+
+from ...constants.api import (
+    LABELS_CHUNK_SIZE,
+    LABELS_MAX_WORKERS,
+    LABELS_RETRIES,
+    LABELS_RETRY_SLEEP,
+)
+from ...data import BaseData
+from ...exceptions import InvalidCredentials, LabelsError, ResponseError
+from ...tools import dt_now, dt_sec_ago, listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ChildMixins
 
 
+@dataclasses.dataclass
+class LabelsBulkResult(BaseData):
+    """Result of adding or removing labels (tags) to assets in chunks."""
+
+    method: str
+    """'add' or 'remove'"""
+
+    labels: List[str]
+    """tags that were added or removed"""
+
+    count_ids: int
+    """count of unique asset IDs supplied"""
+
+    count_chunks: int
+    """count of chunks the asset IDs were split into"""
+
+    processed: int = 0
+    """count of assets the API reported as processed across all chunks"""
+
+    chunks_ok: int = 0
+    """count of chunks that succeeded"""
+
+    seconds: float = 0.0
+    """seconds taken to process all chunks"""
+
+    failures: List[dict] = dataclasses.field(default_factory=list)
+    """chunks that failed after all retries, with their IDs and last exception as error"""
+
+    @property
+    def ok(self) -> bool:
+        """Check if all chunks succeeded."""
+        return not self.failures
+
+    @property
+    def failed_ids(self) -> List[str]:
+        """Get the asset IDs from all failed chunks."""
+        return [x for failure in self.failures for x in failure["ids"]]
+
+    def __str__(self) -> str:
+        """Pass."""
+        return (
+            f"{self.__class__.__name__}(method={self.method!r}, labels={self.labels}, "
+            f"count_ids={self.count_ids}, processed={self.processed}, "
+            f"chunks_ok={self.chunks_ok}/{self.count_chunks}, failed_ids={len(self.failed_ids)}, "
+            f"seconds={self.seconds})"
+        )
+
+
 class Labels(ChildMixins):
     """API for working with tags for the parent asset type.
 
@@ -51,7 +112,7 @@ class Labels(ChildMixins):
         """
         return [x.value for x in self._get_expirable_names()]
 
-    def add(self, rows: Union[List[dict], str], labels: List[str]) -> int:
+    def add(self, rows: Union[List[dict], str], labels: List[str], **kwargs) -> int:
         """Add tags to assets.
 
         Examples:
@@ -67,21 +128,14 @@ class Labels(ChildMixins):
         Args:
             rows: list of internal_axon_id strs or list of assets returned from a get method
             labels: tags to add
-        """
-        ids = self._get_ids(rows=rows)
-        return self._add(labels=labels, ids=ids).value
-
-        # processed = 0
-
-        # # only do 100 labels at a time, more seems to break API
-        # for group in grouper(ids, 100):
-        #     group = [x for x in group if x is not None]
-        #     response = self._add(labels=labels, ids=group)
-        #     processed += response
+            **kwargs: passed to :meth:`bulk`
 
-        # return processed
+        Raises:
+            :exc:`LabelsError`: if any chunk failed after all retries
+        """
+        return self.bulk(method="add", rows=rows, labels=labels, **kwargs).processed
 
-    def remove(self, rows: List[dict], labels: List[str]) -> int:
+    def remove(self, rows: Union[List[dict], str], labels: List[str], **kwargs) -> int:
         """Remove tags from assets.
 
         Examples:
@@ -97,17 +151,174 @@ class Labels(ChildMixins):
         Args:
             rows: list of internal_axon_id strs or list of assets returned from a get method
             labels: tags to remove
+            **kwargs: passed to :meth:`bulk`
+
+        Raises:
+            :exc:`LabelsError`: if any chunk failed after all retries
         """
+        return self.bulk(method="remove", rows=rows, labels=labels, **kwargs).processed
+
+    def bulk(
+        self,
+        method: str,
+        rows: Union[List[dict], str],
+        labels: List[str],
+        chunk_size: int = LABELS_CHUNK_SIZE,
+        max_workers: int = LABELS_MAX_WORKERS,
+        retries: int = LABELS_RETRIES,
+        retry_sleep: int = LABELS_RETRY_SLEEP,
+        progress: Optional[Callable[[dict], None]] = None,
+        error: bool = True,
+    ) -> LabelsBulkResult:
+        """Add or remove tags to assets in chunks of IDs sent concurrently.
+
+        Examples:
+            Tag every asset from a large export, 500 IDs per request with 8 requests in flight
+
+            >>> rows = apiobj.get(fields=["internal_axon_id"], fields_default=False)
+            >>> result = apiobj.labels.bulk(
+            ...     method="add", rows=rows, labels=["api tag"], chunk_size=500, max_workers=8
+            ... )
+            >>> result.ok
+            True
+
+            Report progress and keep going if some chunks fail
+
+            >>> result = apiobj.labels.bulk(
+            ...     method="add", rows=rows, labels=["api tag"], progress=print, error=False
+            ... )
+            >>> result.failed_ids
+            []
+
+        Args:
+            method: 'add' or 'remove'
+            rows: list of internal_axon_id strs or list of assets returned from a get method
+            labels: tags to add or remove
+            chunk_size: number of asset IDs to send in each request
+            max_workers: number of requests to have in flight at once
+            retries: number of times to retry a chunk that failed with a transient error
+            retry_sleep: seconds to sleep between retries, multiplied by the attempt number
+            progress: callable to send a progress event dict to after each chunk finishes
+            error: raise :exc:`LabelsError` if any chunk failed after all retries
+
+        """
+        methods = {"add": self._add, "remove": self._remove}
+        if method not in methods:
+            raise LabelsError(f"Invalid method {method!r}, valids: {list(methods)}", result=None)
+
+        labels = listify(labels)
         ids = self._get_ids(rows=rows)
-        return self._remove(labels=labels, ids=ids).value
+        chunk_size = max(1, chunk_size or LABELS_CHUNK_SIZE)
+        chunks = [ids[slice(idx, idx + chunk_size)] for idx in range(0, len(ids), chunk_size)]
+
+        result = LabelsBulkResult(
+            method=method, labels=labels, count_ids=len(ids), count_chunks=len(chunks)
+        )
+        start_dt = dt_now()
+        self.LOG.info(f"Starting bulk {method} of tags {labels} to {len(ids)} assets")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                pool.submit(
+                    self._bulk_chunk,
+                    func=methods[method],
+                    labels=labels,
+                    ids=chunk,
+                    retries=retries,
+                    retry_sleep=retry_sleep,
+                ): (idx, chunk)
+                for idx, chunk in enumerate(chunks)
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                idx, chunk = futures[future]
+                event = {"method": method, "chunk": idx, "chunks_total": len(chunks)}
+                event.update(future.result())
+
+                if event["error"] is None:
+                    result.chunks_ok += 1
+                    result.processed += event["processed"]
+                else:
+                    result.failures.append(
+                        {
+                            "chunk": idx,
+                            "ids": chunk,
+                            "error": event["error"],
+                            "attempts": event["attempts"],
+                        }
+                    )
+
+                event["processed_total"] = result.processed
+                event["chunks_done"] = result.chunks_ok + len(result.failures)
+                self.LOG.debug(f"Bulk {method} of tags progress: {event}")
+                if callable(progress):
+                    progress(event)
+
+        result.seconds = dt_sec_ago(obj=start_dt, exact=True)
+        self.LOG.info(f"Finished bulk {method} of tags: {result}")
+
+        if result.failures and error:
+            raise LabelsError(
+                f"Failed to {method} tags for some chunks: {result}", result=result
+            ) from result.failures[0]["error"]
+        return result
+
+    def _bulk_chunk(
+        self,
+        func: Callable,
+        labels: List[str],
+        ids: List[str],
+        retries: int = LABELS_RETRIES,
+        retry_sleep: int = LABELS_RETRY_SLEEP,
+    ) -> Dict[str, Union[int, Exception, None]]:
+        """Send one chunk of a bulk tag request, retrying on transient failures.
+
+        Args:
+            func: :meth:`_add` or :meth:`_remove`
+            labels: tags to process
+            ids: internal_axon_id of assets in this chunk
+            retries: number of times to retry a chunk that failed with a transient error
+            retry_sleep: seconds to sleep between retries, multiplied by the attempt number
+
+        Notes:
+            Only connection errors, timeouts, and responses with a status code of 429 or 5xx
+            are retried, see :meth:`_is_transient`. Any other error fails the chunk at once
+            and is kept as the error of the chunk.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                processed = func(labels=labels, ids=ids).value
+                return {"processed": processed, "attempts": attempt, "error": None}
+            except Exception as exc:
+                if attempt > retries or not self._is_transient(exc=exc):
+                    return {"processed": 0, "attempts": attempt, "error": exc}
+                self.LOG.warning(f"Retrying tags chunk of {len(ids)} IDs after error: {exc!r}")
+                time.sleep(retry_sleep * attempt)
+
+    @staticmethod
+    def _is_transient(exc: Exception) -> bool:
+        """Check if an error from a tags request may succeed if retried.
+
+        Args:
+            exc: error raised by the request
+        """
+        if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(exc, ResponseError) and not isinstance(exc, InvalidCredentials):
+            code = getattr(exc.response, "status_code", None)
+            return isinstance(code, int) and (code == 429 or code >= 500)
+        return False
 
     def _get_ids(self, rows: Union[List[dict], str]) -> List[str]:
-        """Get the internal_axon_id from a list of assets.
+        """Get the unique internal_axon_id from a list of assets.
 
         Args:
             rows: list of internal_axon_id strs or list of assets returned from a get method
         """
-        return [x["internal_axon_id"] if isinstance(x, dict) else x for x in listify(rows)]
+        ids = (x["internal_axon_id"] if isinstance(x, dict) else x for x in listify(rows))
+        return list(dict.fromkeys(ids))
 
     def _add(self, labels: List[str], ids: List[str]) -> json_api.generic.IntValue:
         """Direct API method to add labels/tags to assets.
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""Memory budget for the pages of assets held by fetches."""
+import re
+import threading
+import time
+import typing as t
+
+from ...constants.api import MEMORY_BUDGET_OVERHEAD
+from ...exceptions import ApiError
+
+SIZE_RE: t.Pattern = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?)i?b?\s*$", re.I)
+"""pattern for sizes like 512MB, 1.5g, or 1048576"""
+
+SIZE_UNITS: t.Dict[str, int] = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3}
+"""multipliers for the units of sizes"""
+
+
+class MemoryBudget:
+    """Budget of bytes for the pages of assets held in memory by one or more fetches.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices
+
+        Keep the pages held by an export under about 256 MB and check the peak afterwards
+
+        >>> assets = apiobj.get(export="csv", export_file="out.csv", memory_budget="256MB")
+        >>> apiobj.LAST_CALLBACKS.STORE["memory_budget"]["peak_bytes"]
+
+        Share one budget between fetches running at the same time
+
+        >>> budget = MemoryBudget(max_bytes="384MB")
+        >>> fetch = client.get_assets(specs={"devices": {}, "users": {}}, memory_budget=budget)
+
+    Notes:
+        The bytes a page takes in memory are estimated from the size of its response
+        multiplied by :attr:`overhead`, since parsed rows take more memory than the JSON they
+        were parsed from. A fetch acquires the estimated bytes of each page before the page
+        is requested, using the bytes per row of the page before it or no bytes for the first
+        page, then adjusts them to the bytes of the response once the page arrives, and
+        releases them once every row of the page has been processed. Acquiring blocks while
+        the pages already held by other fetches would go over :attr:`max_bytes`, which stops
+        those fetches from getting more pages until the caller catches up.
+
+        The pages held by a budget are tracked by the thread that consumes them. A page is
+        always let through if no pages are held by other threads, so a page larger than the
+        budget can not stop a fetch forever, and fetches that share a budget in the same
+        thread, such as two generators consumed in turn, never wait on each other. A shared
+        budget only holds fetches back from each other if each fetch is consumed in its own
+        thread. If timeout is set, a page is let through after waiting that many seconds.
+    """
+
+    def __init__(
+        self,
+        max_bytes: t.Union[int, str],
+        overhead: float = MEMORY_BUDGET_OVERHEAD,
+        timeout: t.Optional[float] = None,
+    ):
+        """Budget of bytes for the pages of assets held in memory.
+
+        Args:
+            max_bytes: most bytes of pages to hold at once, as an int or a size like 512MB
+            overhead: multiplier from the bytes of a response to the bytes of its rows
+            timeout: most seconds to wait for a page to fit, None to wait until it fits
+        """
+        self.max_bytes: int = self.parse_size(value=max_bytes)
+        self.overhead: float = max(1.0, float(overhead or MEMORY_BUDGET_OVERHEAD))
+        self.timeout: t.Optional[float] = timeout
+        self.buffered_bytes: int = 0
+        self.peak_bytes: int = 0
+        self.pages: int = 0
+        self.waits: int = 0
+        self.wait_seconds: float = 0
+        self.timeouts: int = 0
+        self._owners: t.Dict[t.Hashable, int] = {}
+        self._cond: threading.Condition = threading.Condition()
+
+    @classmethod
+    def load(
+        cls, value: t.Optional[t.Union[int, str, "MemoryBudget"]]
+    ) -> t.Optional["MemoryBudget"]:
+        """Get a budget from an existing budget, a size, or None for no budget.
+
+        Args:
+            value: budget to share, or most bytes of pages to hold at once
+        """
+        if isinstance(value, cls) or not value:
+            return value or None
+        return cls(max_bytes=value)
+
+    @staticmethod
+    def parse_size(value: t.Union[int, str]) -> int:
+        """Parse a size like 512MB, 1.5G, or 1048576 into bytes.
+
+        Args:
+            value: size to parse
+        """
+        if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+            return value
+
+        match = SIZE_RE.match(str(value)) if isinstance(value, str) else None
+        if not match or not float(match.group(1)):
+            raise ApiError(f"Invalid memory budget {value!r}, must be a size like 512MB or 1G")
+        return int(float(match.group(1)) * SIZE_UNITS[match.group(2).lower()])
+
+    def estimate(self, response_bytes: int) -> int:
+        """Estimate the bytes a page takes in memory from the bytes of its response.
+
+        Args:
+            response_bytes: bytes of the response of the page
+        """
+        return int((response_bytes or 0) * self.overhead)
+
+    def acquire(self, nbytes: int, block: bool = True, owner: t.Hashable = None) -> int:
+        """Add the bytes of a page to the budget.
+
+        Args:
+            nbytes: estimated bytes of the page
+            block: wait until the page fits in the budget or no pages are held by other owners
+            owner: thread that will consume the page, defaults to the current thread
+
+        Returns:
+            the bytes that were acquired, to pass to :meth:`release`
+        """
+        owner = self._get_owner(owner=owner)
+        with self._cond:
+            if block and not self._fits(nbytes=nbytes, owner=owner):
+                self.waits += 1
+                start = time.monotonic()
+                while not self._fits(nbytes=nbytes, owner=owner):
+                    waited = time.monotonic() - start
+                    if self.timeout is not None and waited >= self.timeout:
+                        self.timeouts += 1
+                        break
+                    wait = 1 if self.timeout is None else min(1, self.timeout - waited)
+                    self._cond.wait(timeout=wait)
+                self.wait_seconds += time.monotonic() - start
+
+            self._add(nbytes=nbytes, owner=owner)
+            self.pages += 1
+        return nbytes
+
+    def adjust(self, acquired: int, nbytes: int, owner: t.Hashable = None) -> int:
+        """Change the bytes held for a page once its actual size is known, without waiting.
+
+        Args:
+            acquired: bytes that were returned by :meth:`acquire`
+            nbytes: actual estimated bytes of the page
+            owner: thread that acquired the page, defaults to the current thread
+
+        Returns:
+            the bytes now held for the page, to pass to :meth:`release`
+        """
+        owner = self._get_owner(owner=owner)
+        with self._cond:
+            self._add(nbytes=nbytes - acquired, owner=owner)
+            if nbytes < acquired:
+                self._cond.notify_all()
+        return nbytes
+
+    def release(self, nbytes: int, owner: t.Hashable = None):
+        """Remove the bytes of a page that is no longer held from the budget.
+
+        Args:
+            nbytes: bytes that were returned by :meth:`acquire` or :meth:`adjust`
+            owner: thread that acquired the page, defaults to the current thread
+        """
+        owner = self._get_owner(owner=owner)
+        with self._cond:
+            self._add(nbytes=-nbytes, owner=owner)
+            self._cond.notify_all()
+
+    @property
+    def is_full(self) -> bool:
+        """Check if the pages held have used up the budget."""
+        return self.buffered_bytes >= self.max_bytes
+
+    def fit_page_size(self, page_size: int, bytes_per_row: float) -> int:
+        """Get the largest page size up to page_size that fits in the budget.
+
+        Args:
+            page_size: page size that would be used next
+            bytes_per_row: bytes of the response per row of the last page
+        """
+        row_bytes = self.estimate(response_bytes=bytes_per_row)
+        if row_bytes <= 0:
+            return page_size
+        return max(1, min(page_size, int(self.max_bytes / row_bytes)))
+
+    def get_stats(self) -> dict:
+        """Get the metrics of this budget."""
+        return {
+            "max_bytes": self.max_bytes,
+            "buffered_bytes": self.buffered_bytes,
+            "peak_bytes": self.peak_bytes,
+            "pages": self.pages,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "timeouts": self.timeouts,
+        }
+
+    @staticmethod
+    def _get_owner(owner: t.Hashable = None) -> t.Hashable:
+        """Get the owner of a page, the current thread if not supplied."""
+        return threading.get_ident() if owner is None else owner
+
+    def _add(self, nbytes: int, owner: t.Hashable):
+        """Add bytes, or remove them if negative, to the budget and to the bytes of an owner.
+
+        Args:
+            nbytes: bytes to add
+            owner: owner of the bytes
+        """
+        held = max(0, self._owners.get(owner, 0) + nbytes)
+        if held:
+            self._owners[owner] = held
+        else:
+            self._owners.pop(owner, None)
+        self.buffered_bytes = max(0, self.buffered_bytes + nbytes)
+        self.peak_bytes = max(self.peak_bytes, self.buffered_bytes)
+
+    def _fits(self, nbytes: int, owner: t.Hashable) -> bool:
+        """Check if a page fits in the budget, always True if no other owners hold pages.
+
+        Args:
+            nbytes: estimated bytes of the page
+            owner: thread that will consume the page
+        """
+        others = self.buffered_bytes - self._owners.get(owner, 0)
+        return others <= 0 or self.buffered_bytes + nbytes <= self.max_bytes
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return (
+            f"{self.__class__.__name__}(max_bytes={self.max_bytes}, "
+            f"buffered_bytes={self.buffered_bytes}, peak_bytes={self.peak_bytes})"
+        )
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""Local mirror of assets kept current with incremental delta syncs."""
+import dataclasses
+import datetime
+import json
+import logging
+import pathlib
+import sqlite3
+import time
+import typing as t
+
+from ...constants.api import (
+    DEFAULT_CALLBACKS_CLS,
+    MIRROR_BATCH_SIZE,
+    MIRROR_CHANGE_FIELDS,
+    MIRROR_FULL_HOURS,
+    MIRROR_OVERLAP_MINUTES,
+)
+from ...constants.fields import AXID
+from ...exceptions import ApiError, StopFetch
+from ...tools import PathLike, dt_now, dt_now_file, dt_parse, get_path, json_dump, listify
+from .. import json_api
+from ..asset_callbacks.tools import get_callbacks_cls
+from .fetch_plan import FetchPlan
+
+SCHEMA: t.List[str] = [
+    "CREATE TABLE IF NOT EXISTS assets (id TEXT PRIMARY KEY, row TEXT NOT NULL, sync_id INTEGER)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+]
+"""statements to create the tables of a mirror database"""
+
+PLAN_KEYS: t.List[str] = ["asset_type", "url", "query", "fields_parsed"]
+"""keys of a fetch plan that must match the mirror, or a full sync is forced"""
+
+
+class AssetMirror:
+    """Local mirror of the assets returned by a query, keyed by internal_axon_id.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices
+
+        Create or open a mirror and sync it, the first sync is a full sync
+
+        >>> mirror = apiobj.get_mirror(path="devices.db", fields=["os.type"])
+        >>> mirror.sync()
+        {'mode': 'full', 'fetched': 50000, 'deleted': 0, ...}
+
+        Sync it again, only the assets that were fetched or seen since the last sync are fetched
+
+        >>> mirror.sync()
+        {'mode': 'delta', 'fetched': 1200, 'deleted': 0, ...}
+
+        Export the mirror using any of the export callbacks, without fetching anything
+
+        >>> assets = mirror.get(export="csv", export_file="devices.csv")
+
+    Notes:
+        A delta sync fetches only the assets where any of :attr:`change_fields` is later than
+        the high-water mark, which is the start time of the last successful sync less
+        :attr:`overlap`, and upserts them into the mirror.
+
+        A delta sync can not see assets that were deleted or merged into another asset, or
+        assets where only fields other than :attr:`change_fields` changed, such as tags. A
+        full sync fetches every asset, upserts them, and removes any asset it did not see.
+        A full sync is done on the first sync, after :attr:`full_every` has passed since the
+        last full sync, or when the query or fields of the mirror change.
+
+        The mirror is a SQLite database holding the rows as returned by the API, so rows
+        are the same as those returned by :meth:`AssetMixin.get` with the same fields.
+    """
+
+    def __init__(
+        self,
+        apiobj,
+        path: PathLike,
+        fetch_plan: t.Optional[FetchPlan] = None,
+        change_fields: t.Optional[t.List[str]] = None,
+        overlap: t.Union[int, datetime.timedelta] = MIRROR_OVERLAP_MINUTES,
+        full_every: t.Union[int, datetime.timedelta] = MIRROR_FULL_HOURS,
+        **kwargs,
+    ):
+        """Local mirror of the assets returned by a query.
+
+        Args:
+            apiobj (:obj:`axonius_api_client.api.assets.asset_mixin.AssetMixin`): asset
+                object to sync from
+            path: path to the SQLite database of the mirror
+            fetch_plan: query and fields to mirror, if not supplied one will be compiled
+                from kwargs using :meth:`AssetMixin.get_fetch_plan`
+            change_fields: date fields to check against the high-water mark in delta syncs
+            overlap: minutes before the high-water mark to start delta syncs from
+            full_every: hours between full syncs
+            **kwargs: passed to :meth:`AssetMixin.get_fetch_plan` and
+                :meth:`AssetMixin.get_generator`
+        """
+        if not isinstance(overlap, datetime.timedelta):
+            overlap = datetime.timedelta(minutes=overlap)
+        if not isinstance(full_every, datetime.timedelta):
+            full_every = datetime.timedelta(hours=full_every)
+
+        self.apiobj = apiobj
+        self.path: pathlib.Path = get_path(obj=path)
+        self.change_fields: t.List[str] = listify(change_fields or MIRROR_CHANGE_FIELDS)
+        self.overlap: datetime.timedelta = overlap
+        self.full_every: datetime.timedelta = full_every
+        self.kwargs: dict = kwargs
+        self.fetch_plan: FetchPlan = fetch_plan or apiobj.get_fetch_plan(**kwargs)
+        self.fetch_plan.check(apiobj=apiobj)
+        self.log: logging.Logger = apiobj.LOG.getChild(self.__class__.__name__)
+
+        if self.fetch_plan.history_date_parsed:
+            raise ApiError("An asset mirror can not be created for a history date")
+
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.db: sqlite3.Connection = sqlite3.connect(str(self.path))
+        for statement in SCHEMA:
+            self.db.execute(statement)
+        self.db.commit()
+
+    def sync(self, full: t.Optional[bool] = None) -> dict:
+        """Sync the mirror with the server.
+
+        Args:
+            full: True to force a full sync, False to do a delta sync even if
+                :attr:`full_every` has passed, None to pick based on :meth:`needs_full`
+
+        Returns:
+            stats of the sync
+        """
+        reason = self.needs_full(check_age=full is None)
+        if full and not reason:
+            reason = "a full sync was requested"
+        full = bool(reason)
+
+        started = dt_now()
+        sync_id = int(self.get_meta("sync_id") or 0) + 1
+        with self.db:
+            self.set_meta("sync_id", str(sync_id))
+
+        stats = {
+            "mode": "full" if full else "delta",
+            "sync_id": sync_id,
+            "fetched": 0,
+            "deleted": 0,
+            "mirrored": 0,
+            "since": None,
+            "seconds": 0,
+        }
+
+        if full:
+            self.log.info(f"Starting full sync of {self} because {reason}")
+            plan = self.fetch_plan
+        else:
+            since = dt_parse(obj=self.get_meta("high_water")) - self.overlap
+            stats["since"] = since.isoformat()
+            plan = dataclasses.replace(
+                self.fetch_plan, query=self.get_delta_query(since=since), expressions=None
+            )
+            self.log.info(f"Starting delta sync of {self} since {stats['since']}")
+
+        stats["fetched"] = self._fetch(plan=plan, sync_id=sync_id)
+
+        with self.db:
+            if full:
+                cursor = self.db.execute("DELETE FROM assets WHERE sync_id < ?", (sync_id,))
+                stats["deleted"] = cursor.rowcount
+                self.set_meta("last_full", started.isoformat())
+                self.set_meta("plan", json.dumps(self.get_plan_key()))
+            self.set_meta("high_water", started.isoformat())
+
+        stats["mirrored"] = len(self)
+        stats["seconds"] = round((dt_now() - started).total_seconds(), 3)
+        self.log.info(f"Finished sync of {self}: {json_dump(stats)}")
+        return stats
+
+    def needs_full(self, check_age: bool = True) -> t.Optional[str]:
+        """Get the reason a full sync is needed, if any.
+
+        Args:
+            check_age: check if :attr:`full_every` has passed since the last full sync
+        """
+        if not self.get_meta("high_water") or not self.get_meta("last_full"):
+            return "the mirror has never been synced"
+
+        if self.get_meta("plan") != json.dumps(self.get_plan_key()):
+            return "the query or fields of the mirror changed"
+
+        last_full = dt_parse(obj=self.get_meta("last_full"))
+        if check_age and dt_now() - last_full >= self.full_every:
+            return f"the last full sync was more than {self.full_every} ago"
+
+        return None
+
+    def get_plan_key(self) -> dict:
+        """Get the parts of :attr:`fetch_plan` that the rows in the mirror depend on."""
+        data = self.fetch_plan.to_dict()
+        return {k: data[k] for k in PLAN_KEYS}
+
+    def get_delta_query(self, since: datetime.datetime) -> str:
+        """Get the query for the assets that changed since a datetime.
+
+        Args:
+            since: datetime to check :attr:`change_fields` against
+        """
+        value = since.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        delta = " or ".join([f'("{x}" >= date("{value}"))' for x in self.change_fields])
+        query = self.fetch_plan.query
+        return f"({query}) and ({delta})" if query else delta
+
+    def _fetch(self, plan: FetchPlan, sync_id: int) -> int:
+        """Fetch the assets of a plan and upsert them into the mirror.
+
+        Args:
+            plan: query and fields to fetch
+            sync_id: ID of this sync to store with each row
+        """
+        kwargs = {k: v for k, v in self.kwargs.items() if not k.startswith("export")}
+        kwargs["export"] = DEFAULT_CALLBACKS_CLS
+        kwargs["fetch_plan"] = plan
+
+        fetched = 0
+        batch = []
+        for row in self.apiobj.get_generator(**kwargs):
+            batch.append((row[AXID.name], json.dumps(row), sync_id))
+            if len(batch) >= MIRROR_BATCH_SIZE:
+                fetched += self._upsert(batch=batch)
+                batch = []
+        fetched += self._upsert(batch=batch)
+        return fetched
+
+    def _upsert(self, batch: t.List[tuple]) -> int:
+        """Upsert a batch of rows into the mirror in one transaction.
+
+        Args:
+            batch: tuples of (internal_axon_id, row as JSON, sync ID)
+        """
+        if batch:
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO assets (id, row, sync_id) VALUES (?, ?, ?)", batch
+                )
+        return len(batch)
+
+    def rows(self) -> t.Generator[dict, None, None]:
+        """Get the rows in the mirror, ordered by internal_axon_id."""
+        for (row,) in self.db.execute("SELECT row FROM assets ORDER BY id"):
+            yield json.loads(row)
+
+    def get_by_id(self, id: str) -> t.Optional[dict]:
+        """Get a row in the mirror by internal_axon_id.
+
+        Args:
+            id: internal_axon_id of asset
+        """
+        found = self.db.execute("SELECT row FROM assets WHERE id = ?", (id,)).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def get(
+        self, generator: bool = False, **kwargs
+    ) -> t.Union[t.Generator[dict, None, None], t.List[dict]]:
+        """Get the rows in the mirror processed by a callbacks object.
+
+        Args:
+            generator: return an iterator instead of a list
+            **kwargs: passed to :meth:`get_generator`
+        """
+        gen = self.get_generator(**kwargs)
+        return gen if generator else list(gen)
+
+    def get_generator(
+        self, export: str = DEFAULT_CALLBACKS_CLS, **kwargs
+    ) -> t.Generator[dict, None, None]:
+        """Get the rows in the mirror processed by a callbacks object, without fetching.
+
+        Args:
+            export: export rows using a callback method
+            **kwargs: passed thru to the asset callback defined in ``export``
+        """
+        plan = self.fetch_plan
+        count = len(self)
+        file_date = kwargs.get("_file_date", dt_now_file())
+        store = {
+            "export": export,
+            "query": plan.query,
+            "fields_parsed": plan.fields_parsed,
+            "sort_field_parsed": plan.sort_field_parsed,
+            "history_date_parsed": None,
+            "include_details": self.kwargs.get("include_details", False),
+            "include_notes": self.kwargs.get("include_notes", False),
+            "initial_count": count,
+            "export_templates": {"{DATE}": file_date, "{HISTORY_DATE}": file_date},
+            "mirror": str(self.path),
+        }
+        state = json_api.assets.AssetsPage.create_state(initial_count=count)
+        state["rows_to_fetch_total"] = count
+
+        callbacks_cls = get_callbacks_cls(export=export)
+        callbacks = callbacks_cls(apiobj=self.apiobj, getargs=kwargs, state=state, store=store)
+
+        self.apiobj.LAST_CALLBACKS = callbacks
+        callbacks.start()
+
+        started = time.monotonic()
+        try:
+            for row in self.rows():
+                yield from listify(obj=callbacks.process_row(row=row))
+        except StopFetch as exc:
+            self.log.debug(f"Received {type(exc)}: {exc.reason}")
+
+        state["fetch_seconds_total"] = time.monotonic() - started
+        callbacks.stop()
+        callbacks.echo_profile()
+
+    def get_meta(self, key: str) -> t.Optional[str]:
+        """Get a value from the metadata of the mirror.
+
+        Args:
+            key: key of value
+        """
+        found = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return found[0] if found else None
+
+    def set_meta(self, key: str, value: str):
+        """Set a value in the metadata of the mirror.
+
+        Args:
+            key: key of value
+            value: value to set
+        """
+        self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self):
+        """Close the database of the mirror."""
+        self.db.close()
+
+    def __len__(self) -> int:
+        """Get the number of rows in the mirror."""
+        return self.db.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return (
+            f"{self.__class__.__name__}(asset_type={self.fetch_plan.asset_type!r}, "
+            f"path={str(self.path)!r})"
+        )
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
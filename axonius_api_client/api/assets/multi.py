@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""Concurrent fetch of several asset types into one stream."""
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+import typing as t
+
+from ...constants.api import MULTI_FETCH_PROGRESS_SECONDS, MULTI_FETCH_QUEUE_SIZE
+from ...exceptions import ApiError
+from .memory import MemoryBudget
+
+ROW: str = "row"
+"""kind of queue item that holds a row"""
+
+DONE: str = "done"
+"""kind of queue item that marks the end of the rows of a spec"""
+
+ERROR: str = "error"
+"""kind of queue item that holds the exception that stopped a spec"""
+
+
+class MultiAssetFetch:
+    """Fetch several asset types concurrently, each with its own query and fields.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect`
+
+        >>> fetch = client.get_assets(
+        ...     specs={
+        ...         "devices": {"query": '(specific_data.data.os.type == "Windows")'},
+        ...         "users": {"fields": ["username", "mail"]},
+        ...         "vulnerabilities": {"fields_default": True},
+        ...     },
+        ... )
+
+        Get a merged stream of rows tagged with the name of the spec they came from
+
+        >>> for name, row in fetch.get_generator():
+        ...     print(name, row["internal_axon_id"])
+
+        Write each asset type to its own file and get the stats of each one
+
+        >>> fetch = client.get_assets(
+        ...     specs={
+        ...         "devices": {"export": "csv", "export_file": "devices.csv"},
+        ...         "users": {"export": "json", "export_file": "users.json"},
+        ...     },
+        ... )
+        >>> fetch.run()
+        {'devices': {'rows': 50000, 'seconds': 90.1, 'error': None, ...}, ...}
+
+        Fetch the same asset type twice with different queries
+
+        >>> fetch = client.get_assets(
+        ...     specs={
+        ...         "windows": {"asset_type": "devices", "query": 'os.type == "Windows"'},
+        ...         "linux": {"asset_type": "devices", "query": 'os.type == "Linux"'},
+        ...     },
+        ... )
+
+    Notes:
+        Each spec is a dict of kwargs for :meth:`AssetMixin.get_generator` of the asset type
+        named by the ``asset_type`` key of the spec, or by the name of the spec. Each spec
+        is fetched in its own worker thread with its own callbacks object, so any export of
+        a spec writes to its own sink. At most max_workers specs are fetched at once.
+
+        All of the asset objects come from the same client, so they share its HTTP session,
+        connection pool, and timeouts. Rows are passed from the workers to the caller through
+        one queue of at most queue_size rows, so a slow consumer slows down every worker
+        instead of letting rows pile up in memory. If memory_budget is supplied, it is shared
+        by the fetches of every spec, so the pages held by all of them stay under one budget
+        on top of the rows in the queue. Progress of all specs is logged together every
+        progress_seconds.
+
+        If a spec fails, the other specs are stopped and the error is raised once the workers
+        have stopped. Closing the generator early stops all of the workers.
+    """
+
+    def __init__(
+        self,
+        apiobjs: t.Dict[str, t.Any],
+        specs: t.Dict[str, dict],
+        max_workers: t.Optional[int] = None,
+        queue_size: int = MULTI_FETCH_QUEUE_SIZE,
+        progress_seconds: int = MULTI_FETCH_PROGRESS_SECONDS,
+        memory_budget: t.Optional[t.Union[int, str, MemoryBudget]] = None,
+        log: t.Optional[logging.Logger] = None,
+    ):
+        """Concurrent fetch of several asset types.
+
+        Args:
+            apiobjs: asset objects keyed by asset type
+            specs: kwargs for get_generator keyed by the name of each spec
+            max_workers: most specs to fetch at once, defaults to the number of specs
+            queue_size: most rows to hold between the workers and the caller
+            progress_seconds: seconds between progress log messages, 0 to not log progress
+            memory_budget: most bytes of pages to hold in memory across all specs, as an int,
+                a size like 512MB, or a
+                :obj:`axonius_api_client.api.assets.memory.MemoryBudget`
+            log: logger to use
+        """
+        if not isinstance(specs, dict) or not specs:
+            raise ApiError(f"specs must be a non-empty dict of name to kwargs, not {specs!r}")
+
+        self.memory_budget: t.Optional[MemoryBudget] = MemoryBudget.load(value=memory_budget)
+        self.specs: t.Dict[str, dict] = {}
+        self.apiobjs: t.Dict[str, t.Any] = {}
+        for name, spec in specs.items():
+            spec = dict(spec or {})
+            asset_type = spec.pop("asset_type", name)
+            if self.memory_budget:
+                spec["memory_budget"] = self.memory_budget
+            if asset_type not in apiobjs:
+                valid = list(apiobjs)
+                raise ApiError(f"Invalid asset_type {asset_type!r} for {name!r}, valid: {valid}")
+            self.specs[name] = spec
+            self.apiobjs[name] = apiobjs[asset_type]
+
+        self.max_workers: int = max(1, max_workers or len(self.specs))
+        self.queue_size: int = max(1, queue_size)
+        self.progress_seconds: int = progress_seconds
+        self.log: logging.Logger = log or logging.getLogger(__name__)
+        self.stats: t.Dict[str, dict] = {}
+
+    def get(self) -> t.Dict[str, t.List[dict]]:
+        """Fetch all of the specs and get the rows of each one."""
+        rows = {x: [] for x in self.specs}
+        for name, row in self.get_generator():
+            rows[name].append(row)
+        return rows
+
+    def run(self) -> t.Dict[str, dict]:
+        """Fetch all of the specs without keeping the rows, for specs that export to a sink."""
+        for _ in self.get_generator():
+            pass
+        return self.stats
+
+    def get_generator(self) -> t.Generator[t.Tuple[str, dict], None, None]:
+        """Fetch all of the specs and yield each row with the name of its spec."""
+        rows = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        self.stats = {
+            x: {"rows": 0, "seconds": 0, "started": False, "finished": False, "error": None}
+            for x in self.specs
+        }
+        errors = []
+        running = len(self.specs)
+        last_progress = time.monotonic()
+
+        self.log.info(f"Starting fetch of {list(self.specs)} with {self.max_workers} workers")
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for name in self.specs:
+                pool.submit(self._worker, name=name, rows=rows, stop=stop)
+
+            while running:
+                try:
+                    kind, name, value = rows.get(timeout=1)
+                except queue.Empty:
+                    kind = None
+
+                if kind == ROW:
+                    self.stats[name]["rows"] += 1
+                    yield name, value
+                elif kind == DONE:
+                    running -= 1
+                elif kind == ERROR:
+                    errors.append(value)
+                    break
+
+                if self.progress_seconds and (
+                    time.monotonic() - last_progress >= self.progress_seconds
+                ):
+                    self.log.info(f"Fetch progress: {self.get_progress()}")
+                    last_progress = time.monotonic()
+        finally:
+            stop.set()
+            self._drain(rows=rows)
+            pool.shutdown(wait=True)
+            self._drain(rows=rows)
+
+        self.log.info(f"Finished fetch: {self.get_progress()}")
+        if self.memory_budget:
+            self.log.info(f"Memory budget: {self.memory_budget.get_stats()}")
+        if errors:
+            raise errors[0]
+
+    def get_progress(self) -> str:
+        """Get the progress of each spec."""
+        items = []
+        for name, stats in self.stats.items():
+            status = (
+                "error"
+                if stats["error"]
+                else "finished"
+                if stats["finished"]
+                else "running"
+                if stats["started"]
+                else "waiting"
+            )
+            items.append(f"{name}: {stats['rows']} rows ({status})")
+        return ", ".join(items)
+
+    def _worker(self, name: str, rows: queue.Queue, stop: threading.Event):
+        """Fetch the rows of a spec and put them on the queue until done or stopped.
+
+        Args:
+            name: name of spec
+            rows: queue to put rows on
+            stop: event that is set when all workers should stop
+        """
+        stats = self.stats[name]
+        stats["started"] = True
+        start = time.monotonic()
+        gen = None
+        try:
+            if stop.is_set():
+                return
+
+            gen = self.apiobjs[name].get_generator(**self.specs[name])
+            for row in gen:
+                if not self._put(rows=rows, stop=stop, item=(ROW, name, row)):
+                    return
+            stats["finished"] = True
+        except Exception as exc:
+            stats["error"] = f"{type(exc).__name__}: {exc}"
+            self.log.error(f"Fetch of {name!r} failed: {stats['error']}")
+            self._put(rows=rows, stop=stop, item=(ERROR, name, exc))
+            return
+        finally:
+            if gen is not None:
+                gen.close()
+            stats["seconds"] = time.monotonic() - start
+
+        self._put(rows=rows, stop=stop, item=(DONE, name, None))
+
+    @staticmethod
+    def _put(rows: queue.Queue, stop: threading.Event, item: tuple) -> bool:
+        """Put an item on the queue, waiting for room unless all workers have been stopped.
+
+        Args:
+            rows: queue to put item on
+            stop: event that is set when all workers should stop
+            item: item to put on queue
+        """
+        while not stop.is_set():
+            try:
+                rows.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _drain(rows: queue.Queue):
+        """Remove all items from the queue so that no worker is blocked on a full queue.
+
+        Args:
+            rows: queue to drain
+        """
+        while True:
+            try:
+                rows.get_nowait()
+            except queue.Empty:
+                break
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        return (
+            f"{self.__class__.__name__}(specs={list(self.specs)}, "
+            f"max_workers={self.max_workers}, queue_size={self.queue_size})"
+        )
+
+    def __repr__(self) -> str:
+        """Show info for this object."""
+        return self.__str__()
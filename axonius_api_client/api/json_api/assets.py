@@ -8,7 +8,14 @@ import marshmallow
 import marshmallow_jsonapi
 
 from ... import LOG
-from ...constants.api import MAX_PAGE_SIZE, PAGE_SIZE
+from ...constants.api import (
+    MAX_PAGE_SIZE,
+    PAGE_SIZE,
+    PAGE_SIZE_GROWTH,
+    PAGE_SIZE_MIN,
+    PAGE_TARGET_BYTES,
+    PAGE_TARGET_SECONDS,
+)
 from ...exceptions import ApiError, StopFetch
 from ...http import Http
 from ...tools import coerce_int, dt_now, dt_parse, dt_sec_ago, json_dump, parse_int_min_max
@@ -210,6 +217,26 @@ class AssetTypeHistoryDates(BaseModel):
             value=days_ago, exact=exact
         )
 
+    def get_dates_between(
+        self,
+        start: t.Optional[t.Union[str, datetime.datetime]] = None,
+        end: t.Optional[t.Union[str, datetime.datetime]] = None,
+    ) -> t.List[str]:
+        """Get the exact history dates between two dates, oldest first.
+
+        Args:
+            start: earliest date to include, no limit if not supplied
+            end: latest date to include, no limit if not supplied
+        """
+        start = dt_parse(obj=start, default_tz_utc=True) if start else None
+        end = dt_parse(obj=end, default_tz_utc=True) if end else None
+        dates = sorted(self.dates, key=lambda x: x.date)
+        return [
+            x.date_api_exact
+            for x in dates
+            if (start is None or x.date >= start) and (end is None or x.date <= end)
+        ]
+
     @staticmethod
     def get_schema_cls() -> t.Any:
         """Pass."""
@@ -363,6 +390,7 @@ class AssetsPage(BaseModel):
         """Pass."""
         self.page_start_dt = dt_now()
         self.row_start_dt = dt_now()
+        self.response_bytes: int = 0
 
     @classmethod
     def load_response(cls, data: dict, http: Http, **kwargs):
@@ -372,7 +400,10 @@ class AssetsPage(BaseModel):
         meta = data.get("meta") or {}
         new_data = {"assets": assets, "meta": meta, "empty_response": empty}
         schema = cls.schema()
-        return cls._load_schema(schema=schema, data=new_data, http=http)
+        page = cls._load_schema(schema=schema, data=new_data, http=http)
+        response = kwargs.get("response")
+        page.response_bytes = len(getattr(response, "content", None) or b"")
+        return page
 
     def __str__(self):
         """Pass."""
@@ -454,6 +485,9 @@ class AssetsPage(BaseModel):
         page_start: int = 0,
         row_start: int = 0,
         initial_count: int = 0,
+        page_size_adaptive: bool = False,
+        page_target_seconds: float = PAGE_TARGET_SECONDS,
+        page_target_bytes: int = PAGE_TARGET_BYTES,
     ) -> dict:
         """Pass."""
         max_rows = parse_int_min_max(value=max_rows, default=0, min_value=0)
@@ -470,6 +504,8 @@ class AssetsPage(BaseModel):
         page_size = max_rows if max_rows and max_rows < page_size else page_size
 
         state = {
+            "bytes_fetched_this_page": 0,
+            "bytes_fetched_total": 0,
             "fetch_seconds_this_page": 0,
             "fetch_seconds_total": 0,
             "max_pages": max_pages,
@@ -479,6 +515,11 @@ class AssetsPage(BaseModel):
             "page_loop": 1,
             "page_number": 0,
             "page_size": page_size,
+            "page_size_adaptive": bool(page_size_adaptive),
+            "page_target_seconds": page_target_seconds or PAGE_TARGET_SECONDS,
+            "page_target_bytes": page_target_bytes or 0,
+            "page_seconds_per_row": 0,
+            "page_bytes_per_row": 0,
             "page_sleep": page_sleep,
             "page_start": page_start,
             "pages_to_fetch_left": 0,
@@ -511,7 +552,11 @@ class AssetsPage(BaseModel):
                 f"Row total count changed from previous {prev_count} to {this_count}"
             )
 
+        this_page_bytes = self.response_bytes
+
         state["page"] = self.page
+        state["bytes_fetched_this_page"] = this_page_bytes
+        state["bytes_fetched_total"] += this_page_bytes
         state["fetch_seconds_this_page"] = this_page_took
         state["fetch_seconds_total"] += this_page_took
         state["rows_to_fetch_total"] = this_count
@@ -527,9 +572,59 @@ class AssetsPage(BaseModel):
         if not self.assets:
             state = self.process_stop(state=state, reason="no more rows returned", apiobj=apiobj)
 
+        state = self.process_page_size(state=state, apiobj=apiobj)
+
         apiobj.LOG.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
         return state
 
+    def process_page_size(self, state: dict, apiobj) -> dict:
+        """Adjust the page size of the next page when page_size_adaptive is enabled.
+
+        Notes:
+            The seconds and bytes per row of each page are averaged with the average of the
+            pages before it, an exponentially weighted average that favors recent pages. The
+            next page size is the number of rows expected to take page_target_seconds and fit
+            in page_target_bytes. A page size can shrink to
+            PAGE_SIZE_MIN at once, but only grow by PAGE_SIZE_GROWTH per page, and is never
+            larger than MAX_PAGE_SIZE or the number of rows left to reach max_rows.
+
+            The offset of the next page is the number of rows received so far and the cursor
+            is the one returned by the last page, neither depends on the size of the pages
+            before it, so changing the page size between pages does not skip or repeat rows.
+        """
+        rows = state["rows_fetched_this_page"]
+        if not state.get("page_size_adaptive") or not rows:
+            return state
+
+        seconds_per_row = state["fetch_seconds_this_page"] / rows
+        bytes_per_row = state["bytes_fetched_this_page"] / rows
+
+        if state["page_seconds_per_row"]:
+            seconds_per_row = (state["page_seconds_per_row"] + seconds_per_row) / 2
+            bytes_per_row = (state["page_bytes_per_row"] + bytes_per_row) / 2
+
+        state["page_seconds_per_row"] = seconds_per_row
+        state["page_bytes_per_row"] = bytes_per_row
+
+        sizes = [MAX_PAGE_SIZE, state["page_size"] * PAGE_SIZE_GROWTH]
+        if seconds_per_row:
+            sizes.append(state["page_target_seconds"] / seconds_per_row)
+        if bytes_per_row and state["page_target_bytes"]:
+            sizes.append(state["page_target_bytes"] / bytes_per_row)
+
+        rows_left = state["max_rows"] - state["rows_fetched_total"]
+        if state["max_rows"] and rows_left > 0:
+            sizes.append(rows_left)
+
+        page_size = max(PAGE_SIZE_MIN, int(min(sizes)))
+        if page_size != state["page_size"]:
+            apiobj.LOG.debug(
+                f"Adjusting page size from {state['page_size']} to {page_size} "
+                f"({seconds_per_row:.5f} seconds and {bytes_per_row:.0f} bytes per row)"
+            )
+            state["page_size"] = page_size
+        return state
+
     def start_row(self, state: dict, apiobj, row: dict) -> dict:
         """Pass."""
         self.row_start_dt = dt_now()
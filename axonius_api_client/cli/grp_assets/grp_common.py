@@ -2,6 +2,7 @@
 """Command line interface for Axonius API Client."""
 from ... import DEFAULT_PATH
 from ...api import asset_callbacks
+from ...constants.api import CHECKPOINT_PAGES
 from ...constants.wizards import Results, Types
 from ...tools import echo_error, path_read
 from ..context import CONTEXT_SETTINGS, SplitEquals, click
@@ -127,13 +128,57 @@ GET_EXPORT = [
         type=click.INT,
         hidden=False,
     ),
+    click.option(
+        "--progress-bar/--no-progress-bar",
+        "progress_bar",
+        default=True,
+        help="Show a progress bar with throughput and ETA if STDERR is a TTY",
+        show_envvar=True,
+        show_default=True,
+        is_flag=True,
+        hidden=False,
+    ),
+    click.option(
+        "--resume/--no-resume",
+        "resume",
+        default=False,
+        help=(
+            "Resume an export to --export-file from its last checkpoint and save checkpoints "
+            "while exporting (csv and json only)"
+        ),
+        show_envvar=True,
+        show_default=True,
+        is_flag=True,
+        hidden=False,
+    ),
+    click.option(
+        "--checkpoint-pages",
+        "checkpoint_pages",
+        default=0,
+        help=f"Save a checkpoint every N pages (0 = {CHECKPOINT_PAGES} if --resume, else never)",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
+    click.option(
+        "--memory-budget",
+        "memory_budget",
+        default=None,
+        help="Most memory to use for fetched pages, as a size like 512MB (empty = no limit)",
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
     click.option(
         "--export-format",
         "-xt",
         "export",
         default="json",
         help="Formatter to use when exporting asset data",
-        type=click.Choice([x for x in asset_callbacks.CB_MAP if x not in ["base"]]),
+        type=click.Choice(
+            [x for x in asset_callbacks.CB_MAP if x not in ["base", "dataframe"]]
+        ),
         show_envvar=True,
         show_default=True,
     ),
@@ -178,6 +223,96 @@ GET_EXPORT = [
         show_default=True,
         hidden=False,
     ),
+    click.option(
+        "--sqlite-table",
+        "sqlite_table",
+        default=asset_callbacks.Sqlite.args_map()["sqlite_table"],
+        help="Name of root table for --export-format=sqlite (default: asset type)",
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--agg-group-by",
+        "agg_group_by",
+        help="Field to group by for --export-format=aggregate (multiples)",
+        multiple=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--agg-count-distinct",
+        "agg_count_distinct",
+        help="Field to count distinct values of per group for --export-format=aggregate "
+        "(multiples)",
+        multiple=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--agg-min-max",
+        "agg_min_max",
+        help="Date field to get min and max of per group for --export-format=aggregate "
+        "(multiples)",
+        multiple=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--agg-top",
+        "agg_top",
+        default=asset_callbacks.Aggregate.args_map()["agg_top"],
+        help="Only export the N groups with the highest counts for --export-format=aggregate "
+        "(0 = all)",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
+    click.option(
+        "--agg-format",
+        "agg_format",
+        default=asset_callbacks.Aggregate.args_map()["agg_format"],
+        help="Output format for --export-format=aggregate",
+        type=click.Choice(asset_callbacks.base_aggregate.AGG_FORMATS),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--profile-top",
+        "profile_top",
+        default=asset_callbacks.Profile.args_map()["profile_top"],
+        help="Number of most common values to report per field for --export-format=profile",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
+    click.option(
+        "--profile-precision",
+        "profile_precision",
+        default=asset_callbacks.Profile.args_map()["profile_precision"],
+        help="Precision of approximate distinct counts for --export-format=profile "
+        "(uses 2**N bytes per field)",
+        show_envvar=True,
+        show_default=True,
+        type=click.IntRange(4, 16),
+        hidden=False,
+    ),
+    click.option(
+        "--profile-format",
+        "profile_format",
+        default=asset_callbacks.Profile.args_map()["profile_format"],
+        help="Output format for --export-format=profile",
+        type=click.Choice(asset_callbacks.base_profile.PROFILE_FORMATS),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
     click.option(
         "--titles/--no-titles",
         "field_titles",
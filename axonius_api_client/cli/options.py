@@ -4,7 +4,7 @@ import click
 import tabulate
 
 from .. import DEFAULT_PATH
-from ..constants.api import MAX_PAGE_SIZE, TABLE_FORMAT
+from ..constants.api import MAX_PAGE_SIZE, PAGE_TARGET_SECONDS, TABLE_FORMAT
 from ..tools import coerce_int
 from . import context
 from .helps import HELPSTRS
@@ -289,6 +289,24 @@ PAGING = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--page-size-adaptive/--no-page-size-adaptive",
+        "page_size_adaptive",
+        default=False,
+        help="Adjust --page-size between pages so each page takes --page-target-seconds",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-target-seconds",
+        "page_target_seconds",
+        default=PAGE_TARGET_SECONDS,
+        help="Seconds each page should take to fetch with --page-size-adaptive",
+        type=click.FLOAT,
+        show_envvar=True,
+        show_default=True,
+    ),
     click.option(
         "--row-start",
         "row_start",
@@ -3,7 +3,7 @@
 import logging
 import pathlib
 import re
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 import requests
 
@@ -30,6 +30,7 @@ from .api import (
     Users,
     Vulnerabilities,
 )
+from .api.assets import AssetJoin, MultiAssetFetch
 from .auth import ApiKey, Credentials
 from .constants.api import TIMEOUT_CONNECT, TIMEOUT_RESPONSE
 from .constants.logs import (
@@ -384,6 +385,73 @@ class Connect:
             self._devices = Devices(**self.API_ARGS)
         return self._devices
 
+    def get_assets(
+        self, specs: Dict[str, dict], max_workers: Optional[int] = None, **kwargs
+    ) -> MultiAssetFetch:
+        """Fetch several asset types concurrently, each with its own query and fields.
+
+        Examples:
+            Get devices and users at the same time as one stream of rows tagged with
+            their asset type
+
+            >>> fetch = client.get_assets(
+            ...     specs={"devices": {"fields": ["hostname"]}, "users": {"fields": ["mail"]}}
+            ... )
+            >>> for asset_type, row in fetch.get_generator():
+            ...     print(asset_type, row["internal_axon_id"])
+
+        Args:
+            specs: kwargs for get_generator of each asset type, keyed by the asset type or by
+                a name of your own choosing with the asset type in the ``asset_type`` key
+            max_workers: most asset types to fetch at once, defaults to the number of specs
+            **kwargs: passed to :obj:`axonius_api_client.api.assets.multi.MultiAssetFetch`
+        """
+        apiobjs = {
+            "devices": self.devices,
+            "users": self.users,
+            "vulnerabilities": self.vulnerabilities,
+        }
+        return MultiAssetFetch(apiobjs=apiobjs, specs=specs, max_workers=max_workers, **kwargs)
+
+    def join_assets(
+        self, left: str, right: str, left_key: str, right_key: Optional[str] = None, **kwargs
+    ) -> AssetJoin:
+        """Join the assets of one asset type to the assets of another by matching field values.
+
+        Examples:
+            Join devices to the users that last used them, matching user names without
+            case or domains
+
+            >>> join = client.join_assets(
+            ...     left="users",
+            ...     right="devices",
+            ...     left_key="username",
+            ...     right_key="last_used_users",
+            ...     normalize=["strip", "lower", "domain"],
+            ... )
+            >>> rows = join.get()
+
+        Args:
+            left: asset type of the left side
+            right: asset type of the right side
+            left_key: field of the left side to match
+            right_key: field of the right side to match, defaults to left_key
+            **kwargs: passed to :obj:`axonius_api_client.api.assets.join.AssetJoin`
+        """
+        apiobjs = {
+            "devices": self.devices,
+            "users": self.users,
+            "vulnerabilities": self.vulnerabilities,
+        }
+        return AssetJoin(
+            apiobjs=apiobjs,
+            left=left,
+            right=right,
+            left_key=left_key,
+            right_key=right_key,
+            **kwargs,
+        )
+
     @property
     def adapters(self) -> Adapters:
         """Work with adapters and adapter connections."""
@@ -53,6 +53,93 @@ COUNT_POLLING_ATTEMPTS: int = 1800
 COUNT_POLLING_SLEEP: int = 1
 """Number of seconds sleep will wait between attempts."""
 
+LABELS_CHUNK_SIZE: int = 100
+"""Number of asset IDs to send in each request when adding or removing labels (tags)."""
+
+LABELS_MAX_WORKERS: int = 4
+"""Number of label (tag) requests to have in flight at once."""
+
+LABELS_RETRIES: int = 3
+"""Number of times to retry a chunk of label (tag) requests that failed with a transient error."""
+
+LABELS_RETRY_SLEEP: int = 2
+"""Seconds to sleep between retries of a failed chunk, multiplied by the attempt number."""
+
+QUERY_CHUNK_LENGTH: int = 20000
+"""Most characters of values to put in the 'in' clause of each query of a chunked get."""
+
+QUERY_CHUNK_WORKERS: int = 4
+"""Number of chunk queries to have in flight at once in a chunked get."""
+
+COUNT_WORKERS: int = 8
+"""Number of count requests to have in flight at once in count_many."""
+
+TRANSFORM_CHUNK_SIZE: int = 100
+"""Number of rows to send to a worker process at a time when transform_workers is enabled."""
+
+PROGRESS_WINDOW: int = 10
+"""Number of pages to calculate rows/sec and bytes/sec over for fetch progress."""
+
+PAGE_TARGET_SECONDS: float = 15.0
+"""Seconds each page should take to fetch when page_size_adaptive is enabled."""
+
+PAGE_TARGET_BYTES: int = 50 * 1024 * 1024
+"""Bytes each page should be at most when page_size_adaptive is enabled."""
+
+PAGE_SIZE_MIN: int = 25
+"""Smallest page size that page_size_adaptive will shrink to."""
+
+PAGE_SIZE_GROWTH: float = 2.0
+"""Most that page_size_adaptive will grow the page size by from one page to the next."""
+
+CHECKPOINT_PAGES: int = 10
+"""Save a checkpoint of a resumable export after every N pages."""
+
+MIRROR_CHANGE_FIELDS: List[str] = ["specific_data.data.fetch_time", "specific_data.data.last_seen"]
+"""Date fields that a delta sync of an asset mirror checks against the high-water mark."""
+
+MIRROR_OVERLAP_MINUTES: int = 15
+"""Minutes before the high-water mark to start a delta sync from, to cover clock skew."""
+
+MIRROR_FULL_HOURS: int = 24
+"""Hours between full syncs of an asset mirror, which remove assets deleted on the server."""
+
+MIRROR_BATCH_SIZE: int = 1000
+"""Rows to write to an asset mirror in each transaction."""
+
+HISTORY_DIFF_BATCH_SIZE: int = 1000
+"""Changed assets to fetch the rows of at a time when diffing history dates."""
+
+HISTORY_DIFF_WORKERS: int = 2
+"""Number of history dates to fetch at once when diffing history dates."""
+
+MEMORY_BUDGET_OVERHEAD: float = 3.0
+"""Multiplier from the bytes of a page response to the estimated bytes of its parsed rows."""
+
+AGG_DISTINCT_EXACT: int = 64
+"""Distinct values to count exactly per group and field of an aggregate before estimating."""
+
+AGG_PRECISION: int = 10
+"""Bits of the hash used to pick a HyperLogLog register in an aggregate (2**N bytes/group)."""
+
+JOIN_NORMALIZE: List[str] = ["strip", "lower"]
+"""Normalizers to apply to the key values of both sides of an asset join."""
+
+DATAFRAME_CATEGORY_RATIO: float = 0.5
+"""Most unique values per row for a string column of a DataFrame export to be categorical."""
+
+PROFILE_TOP: int = 5
+"""Number of most common values to report per field in a profile export."""
+
+PROFILE_PRECISION: int = 12
+"""Bits of the hash used to pick a HyperLogLog register in a profile export (2**N bytes/field)."""
+
+MULTI_FETCH_QUEUE_SIZE: int = 5000
+"""Most rows to hold between the workers and the caller of a fetch of several asset types."""
+
+MULTI_FETCH_PROGRESS_SECONDS: int = 60
+"""Seconds between progress log messages of a fetch of several asset types."""
+
 AS_DATACLASS: bool = False
 """Global default for returning objects as dataclass instead of dict."""
 
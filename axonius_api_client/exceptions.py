@@ -432,6 +432,15 @@ class FeatureNotEnabledError(ApiError):
         super().__init__(msg)
 
 
+class LabelsError(ApiError):
+    """Pass."""
+
+    def __init__(self, msg: str, result: object):
+        """Pass."""
+        self.result = result
+        super().__init__(msg)
+
+
 class RunnerError(ApiError):
     """Pass."""
 
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 """Parsers for field schemas."""
 import copy
-from typing import List, Optional
+import hashlib
+import json
+import sys
+from typing import Dict, List, MutableMapping, Optional
 
 from ..constants.fields import (
     AGG_ADAPTER_NAME,
@@ -14,20 +17,62 @@ from ..constants.fields import (
 from ..tools import strip_left, strip_right
 
 
-def parse_fields(raw: dict) -> dict:
+INTERN_KEYS: List[str] = [
+    "adapter_name",
+    "adapter_name_raw",
+    "adapter_prefix",
+    "adapter_title",
+    "expr_field_type",
+    "format",
+    "parent",
+    "type",
+    "type_norm",
+]
+"""field schema keys whose values repeat across schemas and are interned by
+:func:`intern_schemas`"""
+
+
+def parse_fields(
+    raw: dict,
+    cache: Optional[MutableMapping[str, List[dict]]] = None,
+    hashes: Optional[Dict[str, str]] = None,
+) -> dict:
     """Parse all generic and adapter specific fields.
 
+    Notes:
+        If cache is supplied, the parsed field schemas of each adapter are stored in it keyed
+        by a hash of the name and raw fields they were parsed from, and an adapter whose raw
+        fields hash to a key already in cache is not parsed again. The schemas of the generic fields
+        determine which fields of other adapters are aggregated, so the hash of every other
+        adapter includes the hash of the generic fields.
+
+        The same list of schemas is returned for every parse that reuses it from cache, so
+        it must not be modified.
+
     Args:
         raw: field schemas returned by :meth:`axonius_api_client.api.assets.fields.Fields._get`
+        cache: mapping of hashes of raw fields to parsed field schemas to reuse and update
+        hashes: dict to fill with the hash of the raw fields of each adapter
     """
-    agg_fields: List[dict] = parse_schemas(
-        adapter_name=AGG_ADAPTER_NAME,
-        adapter_title=AGG_ADAPTER_TITLE,
-        adapter_name_raw=f"{AGG_ADAPTER_NAME}_adapter",
-        adapter_prefix="specific_data.data",
-        all_field="specific_data",
-        raw_fields=raw["generic"],
-    )
+    hashes = {} if hashes is None else hashes
+    use_cache = cache is not None
+    cache = {} if cache is None else cache
+
+    agg_hash = hash_fields(raw_fields=raw["generic"]) if use_cache else ""
+    hashes[AGG_ADAPTER_NAME] = agg_hash
+
+    agg_fields: Optional[List[dict]] = cache.get(agg_hash) if use_cache else None
+    if agg_fields is None:
+        agg_fields = parse_schemas(
+            adapter_name=AGG_ADAPTER_NAME,
+            adapter_title=AGG_ADAPTER_TITLE,
+            adapter_name_raw=f"{AGG_ADAPTER_NAME}_adapter",
+            adapter_prefix="specific_data.data",
+            all_field="specific_data",
+            raw_fields=raw["generic"],
+        )
+        if use_cache:
+            cache[agg_hash] = intern_schemas(schemas=agg_fields)
 
     agg_base_names: List[str] = [x["name_base"] for x in agg_fields]
 
@@ -45,21 +90,60 @@ def parse_fields(raw: dict) -> dict:
 
         title = " ".join(name.split("_")).title()
 
-        fields = parse_schemas(
-            adapter_name_raw=raw_name,
-            adapter_name=name,
-            adapter_prefix=prefix,
-            adapter_title=title,
-            all_field=prefix,
-            raw_fields=raw_fields,
-            agg_base_names=agg_base_names,
-        )
+        fields_hash = ""
+        if use_cache:
+            fields_hash = hash_fields(raw_fields=raw_fields, extra=[raw_name, agg_hash])
+        hashes[name] = fields_hash
+
+        fields: Optional[List[dict]] = cache.get(fields_hash) if use_cache else None
+        if fields is None:
+            fields = parse_schemas(
+                adapter_name_raw=raw_name,
+                adapter_name=name,
+                adapter_prefix=prefix,
+                adapter_title=title,
+                all_field=prefix,
+                raw_fields=raw_fields,
+                agg_base_names=agg_base_names,
+            )
+            if use_cache:
+                cache[fields_hash] = intern_schemas(schemas=fields)
 
         parsed[name] = fields
 
     return parsed
 
 
+def hash_fields(raw_fields: List[dict], extra: Optional[List[str]] = None) -> str:
+    """Get a hash of the raw fields of an adapter.
+
+    Args:
+        raw_fields: raw unparsed fields of an adapter
+        extra: other hashes the parsed fields depend on
+    """
+    digest = hashlib.sha256()
+    for item in extra or []:
+        digest.update(item.encode("utf-8"))
+    value = json.dumps(raw_fields, sort_keys=True, separators=(",", ":"), default=str)
+    digest.update(value.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def intern_schemas(schemas: List[dict]) -> List[dict]:
+    """Intern the values of keys that repeat across field schemas, including sub fields.
+
+    Args:
+        schemas: parsed field schemas to intern in place
+    """
+    for schema in schemas:
+        for key in INTERN_KEYS:
+            value = schema.get(key)
+            if isinstance(value, str):
+                schema[key] = sys.intern(value)
+        intern_schemas(schemas=schema.get("sub_fields") or [])
+    return schemas
+
+
 def is_complex(field: dict) -> bool:
     """Determine if a field is complex from its schema.
 
@@ -61,6 +61,15 @@ KEY_DEBUG_PRINT: str = f"{KEY_PRE}DEBUG_PRINT"
 KEY_USER_AGENT: str = f"{KEY_PRE}USER_AGENT"
 """OS env to use a custom User Agent string."""
 
+KEY_FIELDS_CACHE: str = f"{KEY_PRE}FIELDS_CACHE"
+"""OS env to enable the on-disk cache of field schemas"""
+
+KEY_FIELDS_CACHE_PATH: str = f"{KEY_PRE}FIELDS_CACHE_PATH"
+"""OS env to get the directory to store the on-disk cache of field schemas in"""
+
+KEY_FIELDS_CACHE_TTL: str = f"{KEY_PRE}FIELDS_CACHE_TTL"
+"""OS env to get the seconds the on-disk cache of field schemas is valid for"""
+
 DEFAULT_DEBUG: str = "no"
 """Default for :attr:`KEY_DEBUG`"""
 
@@ -78,6 +87,15 @@ DEFAULT_CERTWARN: str = "yes"
 DEFAULT_ENV_FILE: str = ".env"
 """Default for :attr:`KEY_ENV_FILE`"""
 
+DEFAULT_FIELDS_CACHE: str = "no"
+"""Default for :attr:`KEY_FIELDS_CACHE`"""
+
+DEFAULT_FIELDS_CACHE_PATH: str = "~/.axonius_api_client/fields_cache"
+"""Default for :attr:`KEY_FIELDS_CACHE_PATH`"""
+
+DEFAULT_FIELDS_CACHE_TTL: str = "3600"
+"""Default for :attr:`KEY_FIELDS_CACHE_TTL`"""
+
 KEYS_HIDDEN: List[str] = [KEY_KEY, KEY_SECRET]
 """List of keys to hide in :meth:`get_env_ax`"""
 
@@ -261,6 +279,28 @@ def get_env_connect(**kwargs) -> dict:
     }
 
 
+def get_env_fields_cache(**kwargs) -> dict:
+    """Get the on-disk field schema cache settings from OS env vars.
+
+    Args:
+        **kwargs: passed to :meth:`load_dotenv`
+    """
+    load_dotenv(**kwargs)
+    ttl = get_env_str(key=KEY_FIELDS_CACHE_TTL, default=DEFAULT_FIELDS_CACHE_TTL)
+    try:
+        ttl = int(ttl)
+    except ValueError:
+        raise ValueError(f"OS environment variable {KEY_FIELDS_CACHE_TTL!r} must be an integer")
+
+    return {
+        "enabled": get_env_bool(key=KEY_FIELDS_CACHE, default=DEFAULT_FIELDS_CACHE),
+        "path": get_env_path(
+            key=KEY_FIELDS_CACHE_PATH, default=DEFAULT_FIELDS_CACHE_PATH, get_dir=False
+        ),
+        "ttl": ttl,
+    }
+
+
 def get_env_features(**kwargs) -> List[str]:
     """Get list of features to enable from OS env vars.
 
@@ -721,6 +721,141 @@ class CallbacksFull(Callbacks):
             for sub_schema in cbobj.get_sub_schemas(schema=cbobj.schema_to_explode):
                 assert sub_schema["name_qual"] in row
 
+    def test_do_row_iter_explode_field_complex(self, cbexport, apiobj):
+        field_complex = apiobj.FIELD_COMPLEX
+        original_row = copy.deepcopy(apiobj.COMPLEX_ROWS[0])
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            store={"fields_parsed": [field_complex]},
+            getargs={"field_explode": field_complex},
+        )
+
+        rows_list = cbobj.do_row(rows=copy.deepcopy(original_row))
+        rows_iter = cbobj.do_row_iter(rows=copy.deepcopy(original_row))
+        assert not isinstance(rows_iter, list)
+        assert list(rows_iter) == rows_list
+
+    def test_transform_workers(self, cbexport, apiobj):
+        field_complex = apiobj.FIELD_COMPLEX
+        original_rows = copy.deepcopy(apiobj.COMPLEX_ROWS)
+        getargs = {"field_explode": field_complex, "field_flatten": True}
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            store={"fields_parsed": [field_complex]},
+            getargs=getargs,
+        )
+        rows_exp = [cbobj.do_row(rows=copy.deepcopy(x)) for x in original_rows]
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            store={"fields_parsed": [field_complex]},
+            getargs={"transform_workers": 2, "transform_chunk_size": 1, **getargs},
+        )
+        cbobj.transform_submit(rows=copy.deepcopy(original_rows))
+        rows = [cbobj.do_row(rows=copy.deepcopy(x)) for x in original_rows]
+        cbobj.transform_close()
+        assert rows == rows_exp
+        if cbobj.TRANSFORM_WORKERS_SUPPORTED:
+            assert cbobj.transform_pool.executor is None
+            assert not cbobj.transform_pool.disabled
+        else:
+            assert cbobj.transform_pool is None
+
+    def test_echo_fetch_progress(self, cbexport, apiobj, caplog):
+        events = []
+        state = {
+            "rows_fetched_total": 10,
+            "rows_to_fetch_total": 40,
+            "bytes_fetched_total": 1000,
+            "fetch_seconds_total": 0.5,
+        }
+        cbobj = self.get_cbobj(
+            apiobj=apiobj, cbexport=cbexport, state=state, getargs={"progress_cb": events.append}
+        )
+        caplog.set_level(logging.DEBUG)
+        cbobj.echo_fetch_progress()
+        state["rows_fetched_total"] = 40
+        cbobj.echo_fetch_progress(done=True)
+
+        assert [x["done"] for x in events] == [False, True]
+        assert events[0]["rows_left"] == 30
+        assert events[1]["rows_left"] == 0
+        assert events[1]["percent"] == 100.0
+        assert events[1]["bytes_fetched"] == 1000
+        assert events[1]["seconds_fetch"] == 0.5
+        assert [x.fetch_progress for x in caplog.records if hasattr(x, "fetch_progress")] == events
+
+    def test_debug_profile(self, cbexport, apiobj, caplog):
+        field_complex = apiobj.FIELD_COMPLEX
+        original_row = copy.deepcopy(apiobj.COMPLEX_ROWS[0])
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            state={"fetch_seconds_this_page": 1.5},
+            store={"fields_parsed": [field_complex]},
+            getargs={"field_explode": field_complex, "debug_profile": True},
+        )
+        cbobj.profile.add(step="fetch", seconds=cbobj.STATE["fetch_seconds_this_page"])
+        rows = list(cbobj.do_row_iter(rows=original_row))
+
+        steps = {x["step"]: x for x in cbobj.profile.report()}
+        assert steps["fetch"]["total_seconds"] == 1.5
+        assert steps["do_excludes"]["count"] == 1
+        assert steps["do_explode_field"]["count"] == len(rows) + 1
+        assert steps["do_join_values"]["count"] == len(rows)
+        assert cbobj.profile.report()[0]["step"] == "fetch"
+
+        caplog.set_level(logging.INFO)
+        cbobj.echo_profile()
+        assert "do_explode_field" in caplog.text
+
+    def test_debug_profile_disabled(self, cbexport, apiobj):
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport)
+        cbobj.do_row(rows=copy.deepcopy(apiobj.ORIGINAL_ROWS[0]))
+        assert cbobj.profile is None
+        with cbobj.profile_step(step="write"):
+            pass
+
+    def test_transform_workers_custom_cbs_in_process(self, cbexport, apiobj):
+        original_row = copy.deepcopy(apiobj.ORIGINAL_ROWS[0])
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"transform_workers": 2, "custom_cbs": [lambda self, rows: rows]},
+        )
+        cbobj.transform_submit(rows=[copy.deepcopy(original_row)])
+        rows = cbobj.do_row(rows=copy.deepcopy(original_row))
+        assert rows
+        assert cbobj.transform_pool is None
+        cbobj.transform_close()
+
+    def test_transform_workers_out_of_order(self, cbexport, apiobj):
+        original_rows = copy.deepcopy(apiobj.ORIGINAL_ROWS[:2])
+        if len(original_rows) < 2:
+            pytest.skip("Need at least 2 rows")
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"transform_workers": 1, "transform_chunk_size": 1},
+        )
+        if not cbobj.TRANSFORM_WORKERS_SUPPORTED:
+            pytest.skip("Callbacks object does not support transform workers")
+
+        cbobj.transform_submit(rows=copy.deepcopy(original_rows))
+        try:
+            with pytest.raises(ApiError):
+                cbobj.do_row(rows=copy.deepcopy(original_rows[1]))
+        finally:
+            cbobj.transform_close()
+
     def test_do_explode_field_simple(self, cbexport, apiobj):
         original_row = copy.deepcopy(apiobj.ORIGINAL_ROWS[0])
         test_row = copy.deepcopy(original_row)
@@ -906,6 +1041,36 @@ class CallbacksFull(Callbacks):
                 assert schema["name_qual"] in row
                 assert field in row
 
+    def test_sw_whitelist_large(self, cbexport, api_devices):
+        field = "specific_data.data.installed_software"
+        schemas = SCHEMAS_CUSTOM["report_software_whitelist"]
+        get_schema(apiobj=api_devices, field=field)
+
+        query = '(specific_data.data.installed_software.name == regex("chrome", "i"))'
+        rows = api_devices.get(fields=field, query=query, max_rows=1)
+        whitelist = ["chrome", "^adobe.*acrobat"] + [random_string(12) for _ in range(10000)]
+
+        cbobj = self.get_cbobj(
+            apiobj=api_devices,
+            cbexport=cbexport,
+            store={"fields_parsed": field},
+            getargs={"report_software_whitelist": whitelist},
+        )
+
+        for row in rows:
+            names = [x["name"] for x in row.get(field, []) if isinstance(x.get("name"), str)]
+            cbobj.add_report_software_whitelist(rows=row)
+
+            missing = row[schemas["software_missing"]["name_qual"]]
+            extras = row[schemas["software_extra"]["name_qual"]]
+            assert "chrome" not in missing
+            assert len(missing) >= len(whitelist) - 2
+            for name in names:
+                if "chrome" in name.lower():
+                    assert name not in extras
+            for name in extras:
+                assert name in names
+
     def test_do_field_compress_true(self, cbexport, apiobj):
         agg = "agg:id"
         specific = "active_directory:id"
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+
+import copy
+import json
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks import Aggregator, HyperLogLog
+from axonius_api_client.exceptions import ApiError
+
+from .test_callbacks import Callbacks
+
+FIELDS = ["specific_data.data.hostname", "specific_data.data.last_seen"]
+
+
+class TestCallbacksAggregate(Callbacks):
+    @pytest.fixture(params=["api_devices"], scope="class")
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        return "aggregate"
+
+    def test_aggregate(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.json"
+        rows = copy.deepcopy(apiobj.ORIGINAL_ROWS)
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={
+                "export_file": export_file,
+                "agg_group_by": ["hostname"],
+                "agg_min_max": ["last_seen"],
+                "agg_format": "json",
+            },
+            store={"fields_parsed": FIELDS},
+        )
+        cbobj.start()
+
+        for row in rows:
+            rows_ret = cbobj.process_row(row=copy.deepcopy(row))
+            assert rows_ret == []
+
+        cbobj.stop()
+
+        results = json.loads(export_file.read_text())
+        assert results == cbobj.STORE["aggregate"]
+        assert sum(x["count"] for x in results) >= len(rows)
+        for result in results:
+            assert "specific_data.data.hostname" in result
+            assert "min:specific_data.data.last_seen" in result
+            assert "max:specific_data.data.last_seen" in result
+
+    def test_fail_field_not_fetched(self, cbexport, apiobj):
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"agg_group_by": ["os.type"]},
+            store={"fields_parsed": FIELDS},
+        )
+        with pytest.raises(ApiError):
+            cbobj.start()
+
+    def test_fail_agg_format(self, cbexport, apiobj):
+        with pytest.raises(ApiError):
+            self.get_cbobj(
+                apiobj=apiobj,
+                cbexport=cbexport,
+                getargs={"agg_group_by": ["hostname"], "agg_format": "badwolf"},
+            )
+
+
+class TestAggregator:
+    def test_group_by(self):
+        agg = Aggregator(group_by="os", count_distinct="host", top=2)
+        agg.add(row={"os": "Windows", "host": ["a", "b"]})
+        agg.add(row={"os": ["Windows", "Linux"], "host": "a"})
+        agg.add(row={"os": [], "host": None})
+        agg.add(row={"host": "c"})
+
+        assert agg.rows == 4
+        assert len(agg.groups) == 3
+        assert agg.get_results() == [
+            {"os": "Windows", "count": 2, "count_distinct:host": 2},
+            {"os": None, "count": 2, "count_distinct:host": 1},
+        ]
+
+    def test_count_distinct_estimate(self):
+        agg = Aggregator(group_by="os", count_distinct="host")
+        for value in range(5000):
+            agg.add(row={"os": "Linux", "host": [f"h{value}", f"h{value // 2}"]})
+        agg.add(row={"os": "Windows", "host": ["a", "b", "a"]})
+
+        linux, windows = agg.get_results()
+        assert isinstance(agg.groups[("Linux",)]["distinct"]["host"], HyperLogLog)
+        assert abs(linux["count_distinct:host"] - 5000) <= 5000 * 0.1
+        assert isinstance(agg.groups[("Windows",)]["distinct"]["host"], set)
+        assert windows["count_distinct:host"] == 2
+
+    def test_complex_sub_field(self):
+        agg = Aggregator(group_by=["os", "nics.mac"])
+        agg.add(row={"os": "Linux", "nics": [{"mac": "m1"}, {"mac": ["m1", "m2"]}]})
+        agg.add(row={"os": "Linux", "nics": {"mac": "m2"}})
+
+        assert agg.get_results() == [
+            {"os": "Linux", "nics.mac": "m2", "count": 2},
+            {"os": "Linux", "nics.mac": "m1", "count": 1},
+        ]
+
+    def test_min_max(self):
+        agg = Aggregator(group_by="os", min_max="seen")
+        agg.add(row={"os": "Linux", "seen": ["2023-01-02T00:00:00+00:00", "badwolf"]})
+        agg.add(row={"os": "Linux", "seen": "2023-01-05 00:00:00"})
+        agg.add(row={"os": "Linux"})
+
+        assert agg.get_results() == [
+            {
+                "os": "Linux",
+                "count": 3,
+                "min:seen": "2023-01-02T00:00:00+00:00",
+                "max:seen": "2023-01-05T00:00:00+00:00",
+            }
+        ]
+
+    def test_fail_no_group_by(self):
+        with pytest.raises(ApiError):
+            Aggregator(group_by=[])
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks.base_dataframe import ColumnBuffer
+
+
+def get_buffer(type_norm, category_ratio=0.5, **kwargs):
+    pd = pytest.importorskip("pandas")
+    schema = {"type_norm": type_norm, "parent": "root", **kwargs}
+    return ColumnBuffer(pd=pd, schema=schema, category_ratio=category_ratio)
+
+
+def fill(buffer, pages):
+    for page in pages:
+        for value in page:
+            buffer.append(value)
+        buffer.flush()
+    return buffer.get_series(name="badwolf")
+
+
+class TestColumnBuffer:
+    @pytest.mark.parametrize(
+        "schema,expected",
+        [
+            ({"type_norm": "string_datetime"}, "datetime"),
+            ({"type_norm": "integer"}, "integer"),
+            ({"type_norm": "boolean"}, "boolean"),
+            ({"type_norm": "number"}, "number"),
+            ({"type_norm": "string_ip"}, "string"),
+            ({"type_norm": "array_string", "is_list": True}, "object"),
+            ({"type_norm": "string", "parent": "specific_data.data.network_interfaces"}, "object"),
+        ],
+    )
+    def test_get_kind(self, schema, expected):
+        assert ColumnBuffer.get_kind(schema=schema) == expected
+
+    def test_datetime(self):
+        series = fill(
+            buffer=get_buffer("string_datetime"),
+            pages=[["2023-01-01T00:00:00+00:00", None], ["Mon, 02 Jan 2023 00:00:00 GMT"]],
+        )
+        assert str(series.dtype).startswith("datetime64")
+        assert str(series.dt.tz) == "UTC"
+        assert series.isna().tolist() == [False, True, False]
+
+    def test_datetime_invalid(self):
+        series = fill(buffer=get_buffer("string_datetime"), pages=[["badwolf", None]])
+        assert series.dtype == object
+        assert series.tolist() == ["badwolf", None]
+
+    def test_integer_boolean(self):
+        series = fill(buffer=get_buffer("integer"), pages=[[1, None], [3]])
+        assert str(series.dtype) == "Int64"
+        assert series.isna().tolist() == [False, True, False]
+
+        series = fill(buffer=get_buffer("boolean"), pages=[[True], [None, False]])
+        assert str(series.dtype) == "boolean"
+
+    def test_string_category(self):
+        pd = pytest.importorskip("pandas")
+        series = fill(buffer=get_buffer("string"), pages=[["a", "a", "b"], ["b", "c", None]])
+        assert isinstance(series.dtype, pd.CategoricalDtype)
+        assert series.tolist()[:5] == ["a", "a", "b", "b", "c"]
+
+        series = fill(buffer=get_buffer("string", category_ratio=0.1), pages=[["a", "b", "c"]])
+        assert not isinstance(series.dtype, pd.CategoricalDtype)
+
+    @pytest.mark.parametrize(
+        "pages,expected",
+        [
+            ([["a", "b"], [None, None]], ["a", "b", None, None]),
+            ([[None], ["a"]], [None, "a"]),
+            ([[None], [None]], [None, None]),
+        ],
+    )
+    def test_string_category_nulls(self, pages, expected):
+        pd = pytest.importorskip("pandas")
+        series = fill(buffer=get_buffer("string", category_ratio=1), pages=pages)
+        assert isinstance(series.dtype, pd.CategoricalDtype)
+        assert [None if pd.isna(x) else x for x in series.tolist()] == expected
+
+    def test_lists(self):
+        series = fill(buffer=get_buffer("string"), pages=[[["a", "b"], "c"]])
+        assert series.dtype == object
+        assert series.tolist() == [["a", "b"], "c"]
+
+    def test_empty(self):
+        series = get_buffer("integer").get_series(name="badwolf")
+        assert series.empty
+        assert series.name == "badwolf"
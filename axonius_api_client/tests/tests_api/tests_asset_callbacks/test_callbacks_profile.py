@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+
+import copy
+import json
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks import FieldProfile, FrequentItems, HyperLogLog
+from axonius_api_client.exceptions import ApiError
+
+from .test_callbacks import Callbacks
+
+FIELDS = ["specific_data.data.hostname", "specific_data.data.network_interfaces"]
+
+
+class TestCallbacksProfile(Callbacks):
+    @pytest.fixture(params=["api_devices"], scope="class")
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        return "profile"
+
+    def test_profile(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.json"
+        rows = copy.deepcopy(apiobj.ORIGINAL_ROWS)
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"export_file": export_file, "profile_format": "json"},
+            store={"fields_parsed": FIELDS},
+        )
+        cbobj.start()
+
+        for row in rows:
+            rows_ret = cbobj.process_row(row=copy.deepcopy(row))
+            assert rows_ret == []
+
+        cbobj.stop()
+
+        results = json.loads(export_file.read_text())
+        assert results == cbobj.STORE["profile"]
+        fields = [x["field"] for x in results]
+        assert "specific_data.data.hostname" in fields
+        assert "specific_data.data.network_interfaces.mac" in fields
+        assert "specific_data.data.network_interfaces" not in fields
+        for result in results:
+            assert result["rows"] == len(rows)
+            assert result["filled"] <= result["rows"]
+            assert result["distinct"] <= result["values"]
+            assert isinstance(result["top"], list)
+
+    def test_fail_profile_format(self, cbexport, apiobj):
+        with pytest.raises(ApiError):
+            self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={"profile_format": "badwolf"})
+
+
+class TestHyperLogLog:
+    @pytest.mark.parametrize("count", [0, 1, 100, 5000, 100000])
+    def test_count(self, count):
+        hll = HyperLogLog(precision=12)
+        for value in range(count):
+            hll.add(value=value)
+            hll.add(value=str(value))
+        assert abs(hll.count() - count) <= max(2, count * 0.05)
+
+    @pytest.mark.parametrize("precision", [3, 17])
+    def test_fail_precision(self, precision):
+        with pytest.raises(ApiError):
+            HyperLogLog(precision=precision)
+
+
+class TestFrequentItems:
+    def test_top(self):
+        items = FrequentItems(capacity=10)
+        values = ["a"] * 500 + ["b"] * 300 + [f"x{x}" for x in range(2000)]
+        for value in values:
+            items.add(value=value)
+
+        top = items.get_top(top=2)
+        assert [x[0] for x in top] == ["a", "b"]
+        assert items.error > 0
+        assert 500 - items.error <= top[0][1] <= 500
+        assert 300 - items.error <= top[1][1] <= 300
+        assert len(items.counts) <= 10
+
+    def test_exact(self):
+        items = FrequentItems(capacity=10)
+        for value in ["a", "b", "a", "c", "a", "b"]:
+            items.add(value=value)
+        assert items.error == 0
+        assert items.get_top(top=5) == [("a", 3), ("b", 2), ("c", 1)]
+
+
+class TestFieldProfile:
+    def test_add(self):
+        profile = FieldProfile(schema={"name_qual": "nics.mac", "type_norm": "string"}, top=2)
+        profile.add(row={"nics": [{"mac": "m1"}, {"mac": ["m1", "m2"]}]})
+        profile.add(row={"nics": {"mac": "m2"}})
+        profile.add(row={"nics": []})
+        profile.add(row={})
+
+        assert profile.get_result() == {
+            "field": "nics.mac",
+            "title": None,
+            "type": "string",
+            "rows": 4,
+            "filled": 2,
+            "fill_rate": 50.0,
+            "values": 3,
+            "distinct": 2,
+            "top": "m2 (2), m1 (1)",
+        }
+        assert profile.get_result(fmt="json")["top"] == [
+            {"value": "m2", "count": 2},
+            {"value": "m1", "count": 1},
+        ]
+
+    def test_no_top(self):
+        profile = FieldProfile(schema={"name_qual": "host"}, top=0)
+        profile.add(row={"host": "a"})
+        result = profile.get_result()
+        assert result["top"] == ""
+        assert result["fill_rate"] == 100.0
+        assert profile.frequent.total == 0
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+
+import copy
+import sqlite3
+
+import pytest
+
+from axonius_api_client.exceptions import ApiError
+
+from .test_callbacks import Callbacks
+
+
+class TestCallbacksSqlite(Callbacks):
+    @pytest.fixture(params=["api_devices"], scope="class")
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        return "sqlite"
+
+    def test_sqlite(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.db"
+        rows = copy.deepcopy(apiobj.ORIGINAL_ROWS)
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"export_file": export_file, "export_schema": True},
+        )
+        cbobj.start()
+        cbobj.process_page(rows=[])
+
+        for row in rows:
+            row_id = row["internal_axon_id"]
+            rows_ret = cbobj.process_row(row=copy.deepcopy(row))
+            assert isinstance(rows_ret, list)
+            assert len(rows_ret) == 1
+            assert rows_ret[0] == {"internal_axon_id": row_id}
+
+        cbobj.stop()
+
+        assert export_file.is_file()
+        db = sqlite3.connect(str(export_file))
+        tables = [x[0] for x in db.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+        indexes = [x[0] for x in db.execute("SELECT name FROM sqlite_master WHERE type='index'")]
+        assert apiobj.ASSET_TYPE in tables
+        assert "_schema" in tables
+        assert f"idx_{apiobj.ASSET_TYPE}_internal_axon_id" in indexes
+
+        count = db.execute(f'SELECT COUNT(*) FROM "{apiobj.ASSET_TYPE}"').fetchone()[0]
+        assert count == len(rows)
+
+        for table in tables:
+            if table.startswith(f"{apiobj.ASSET_TYPE}_"):
+                columns = [x[1] for x in db.execute(f'PRAGMA table_info("{table}")')]
+                assert columns[:2] == ["internal_axon_id", "item_index"]
+        db.close()
+
+    def test_sqlite_table(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.db"
+        rows = copy.deepcopy(apiobj.ORIGINAL_ROWS)
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"export_file": export_file, "sqlite_table": "assets"},
+        )
+        cbobj.start()
+        for row in rows:
+            cbobj.process_row(row=copy.deepcopy(row))
+        cbobj.stop()
+
+        db = sqlite3.connect(str(export_file))
+        count = db.execute('SELECT COUNT(*) FROM "assets"').fetchone()[0]
+        assert count == len(rows)
+        db.close()
+
+    def test_fail_no_export_file(self, cbexport, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={})
+            cbobj.start()
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
 import datetime
+import json
+import types
 from typing import Any, List
 
 import pytest
 
-from axonius_api_client.api import json_api, mixins
+from axonius_api_client.api import FetchPlan, json_api, mixins
+from axonius_api_client.api.assets import HistoryDiff
 
-# from axonius_api_client.constants.api import MAX_PAGE_SIZE
+from axonius_api_client.constants.api import PAGE_SIZE_MIN
 from axonius_api_client.exceptions import ApiError, NotFoundError, StopFetch
 from axonius_api_client.tools import listify
 
@@ -124,6 +127,14 @@ class TestAssetsPrivate(ModelMixinsBase):
 
             date = obj.get_date_by_date(value="1999-01-01", exact=False)
             assert date == date_oldest.date_api_exact
+
+            dates = obj.get_dates_between()
+            assert dates[0] == date_oldest.date_api_exact
+            assert len(dates) == len(obj.dates)
+            assert obj.get_dates_between(start=date_oldest.date, end=date_oldest.date) == [
+                date_oldest.date_api_exact
+            ]
+            assert obj.get_dates_between(end="1999-01-01") == []
             # with pytest.raises(ApiError):
             #     obj.get_date(date="1999-01-01")
 
@@ -150,6 +161,7 @@ class TestAssetsPrivate(ModelMixinsBase):
             assert isinstance(page.cursor, str) and page.cursor
             assert isinstance(page.page, dict) and page.page
             assert isinstance(page.pages_total, int)
+            assert page.response_bytes == len(page.RESPONSE.content)
 
         page1 = apiobj._get(offset=0, limit=1)
         check_page(page1)
@@ -181,6 +193,53 @@ class TestAssetsPrivate(ModelMixinsBase):
             with pytest.raises(StopFetch):
                 page3.process_page(state={**state1}, start_dt=page1.page_start_dt, apiobj=apiobj)
 
+    def test_process_page_bytes(self, apiobj):
+        data = {"data": [{"attributes": {"internal_axon_id": "x"}}], "meta": {}}
+        response = types.SimpleNamespace(content=b"x" * 1234)
+        page = json_api.assets.AssetsPage.load_response(data=data, http=None, response=response)
+        assert page.response_bytes == 1234
+
+        state = page.create_state()
+        state = page.process_page(state=state, start_dt=page.page_start_dt, apiobj=apiobj)
+        assert state["bytes_fetched_this_page"] == 1234
+        assert state["bytes_fetched_total"] == 1234
+
+    def test_process_page_size(self, apiobj):
+        page = json_api.assets.AssetsPage(assets=[{}] * 100)
+        state = page.create_state(
+            page_size=100, page_size_adaptive=True, page_target_seconds=10, page_target_bytes=0
+        )
+        state.update(rows_fetched_this_page=100, fetch_seconds_this_page=1)
+        state = page.process_page_size(state=state, apiobj=apiobj)
+        assert state["page_size"] == 200
+
+        state.update(rows_fetched_this_page=200, fetch_seconds_this_page=38)
+        state = page.process_page_size(state=state, apiobj=apiobj)
+        assert state["page_size"] == 100
+
+        state.update(rows_fetched_this_page=100, fetch_seconds_this_page=90)
+        state = page.process_page_size(state=state, apiobj=apiobj)
+        assert state["page_size"] == PAGE_SIZE_MIN
+
+        by_bytes = page.create_state(
+            page_size=100, page_size_adaptive=True, page_target_bytes=100 * 1000
+        )
+        by_bytes.update(
+            rows_fetched_this_page=100, fetch_seconds_this_page=0.1, bytes_fetched_this_page=200000
+        )
+        assert page.process_page_size(state=by_bytes, apiobj=apiobj)["page_size"] == 50
+
+        fixed = page.create_state(page_size=100)
+        fixed.update(rows_fetched_this_page=100, fetch_seconds_this_page=1)
+        assert page.process_page_size(state=fixed, apiobj=apiobj)["page_size"] == 100
+
+    @FLAKY()
+    def test_get_page_size_adaptive(self, apiobj):
+        rows = apiobj.get(page_size=1, page_size_adaptive=True, max_rows=5, fields_default=False)
+        ids = [x["internal_axon_id"] for x in rows]
+        assert len(ids) == len(set(ids))
+        assert apiobj.LAST_CALLBACKS.STATE["page_size"] >= 1
+
     @pytest.mark.skip("BREAKER: induces timeout")
     def test_get_pages(self, apiobj):
         page1 = apiobj._get(offset=0, limit=5)
@@ -300,6 +359,25 @@ class TestAssetsPublic(ModelMixinsBase):
         data = apiobj.count_by_saved_query(name=sq_name)
         assert isinstance(data, int)
 
+    def test_count_many(self, apiobj):
+        query = QUERIES["not_last_seen_day"]
+        sq_name = apiobj.saved_query.get()[0]["name"]
+        data = apiobj.count_many(
+            queries={"query": query},
+            saved_queries=[sq_name, "badwolf"],
+            wiz_entries={"wiz": "simple active_directory:id exists"},
+            max_workers=2,
+            cache_ttl=60,
+        )
+        assert list(data) == ["query", sq_name, "badwolf", "wiz"]
+        assert data["query"]["count"] == apiobj.count(query=query)
+        assert isinstance(data[sq_name]["count"], int)
+        assert isinstance(data["wiz"]["count"], int)
+        assert data["badwolf"]["count"] is None and data["badwolf"]["error"]
+
+        data = apiobj.count_many(queries=[query], cache_ttl=60)
+        assert data[query]["cached"] is True
+
     # def test_get_no_dups(self, apiobj):
     #     rows = apiobj.get(generator=True)
     #     ids = {}
@@ -398,6 +476,284 @@ class TestAssetsPublic(ModelMixinsBase):
         with pytest.raises(NotFoundError):
             apiobj.get_by_id(id="badwolf")
 
+    @FLAKY()
+    def test_get_by_ids(self, apiobj):
+        axids = [x["internal_axon_id"] for x in apiobj.ORIGINAL_ROWS[:5]]
+
+        result = apiobj.get_by_ids(
+            ids=axids + ["badwolf"], chunk_length=100, max_workers=2, fields_default=False
+        )
+        assert sorted([x["internal_axon_id"] for x in result.assets]) == sorted(axids)
+        assert result.ids_missing == ["badwolf"]
+        assert apiobj.LAST_CALLBACKS.STORE["ids_missing"] == ["badwolf"]
+
+    @FLAKY()
+    def test_get_by_ids_query(self, apiobj):
+        axids = [x["internal_axon_id"] for x in apiobj.ORIGINAL_ROWS[:5]]
+        query = f'internal_axon_id != "{axids[0]}"'
+
+        result = apiobj.get_by_ids(
+            ids=axids, chunk_length=100, generator=True, query=query, fields_default=False
+        )
+        assert result.ids_missing is None
+        rows = list(result)
+        assert sorted([x["internal_axon_id"] for x in rows]) == sorted(axids[1:])
+        assert result.ids_missing == [axids[0]]
+
+    def test_get_by_ids_max_rows(self, apiobj, monkeypatch):
+        axids = [f"badwolf{x:02d}" for x in range(30)]
+        fetched = []
+
+        def get_query_rows(fetch_plan, **kwargs):
+            fetched.append(fetch_plan.query)
+            rows = [{"internal_axon_id": x} for x in axids if f"'{x}'" in fetch_plan.query]
+            return rows, 0, 0, 0
+
+        with monkeypatch.context() as m:
+            m.setattr(apiobj, "_get_query_rows", get_query_rows)
+            args = dict(ids=axids, chunk_length=60, max_workers=1, fields_default=False)
+
+            result = apiobj.get_by_ids(max_rows=7, **args)
+            assert [x["internal_axon_id"] for x in result.assets] == axids[:7]
+            assert result.ids_missing is None
+            assert len(fetched) <= 3
+
+            fetched.clear()
+            result = apiobj.get_by_ids(max_pages=2, **args)
+            assert [x["internal_axon_id"] for x in result.assets] == axids[:8]
+            assert result.ids_missing is None
+
+            result = apiobj.get_by_ids(max_rows=100, **args)
+            assert len(result.assets) == len(axids)
+            assert result.ids_missing == []
+
+    @FLAKY()
+    def test_get_by_values_chunked(self, apiobj):
+        axids = [x["internal_axon_id"] for x in apiobj.ORIGINAL_ROWS[:5]]
+        args = dict(values=axids + axids[:2], field="internal_axon_id", fields_default=False)
+
+        rows = apiobj.get_by_values(chunk_length=100, max_workers=2, **args)
+        rows_single = apiobj.get_by_values(**args)
+        assert len(rows) == len(axids)
+        assert sorted([x["internal_axon_id"] for x in rows]) == sorted(
+            [x["internal_axon_id"] for x in rows_single]
+        )
+
+    @FLAKY()
+    def test_get_by_values_query(self, apiobj):
+        axids = [x["internal_axon_id"] for x in apiobj.ORIGINAL_ROWS[:5]]
+        query = f'internal_axon_id != "{axids[0]}"'
+        args = dict(values=axids, field="internal_axon_id", fields_default=False, query=query)
+
+        rows = apiobj.get_by_values(**args)
+        assert "chunked" not in apiobj.LAST_CALLBACKS.STORE["query"]
+        rows_chunked = apiobj.get_by_values(chunk_length=50, max_workers=2, **args)
+        assert "chunked" in apiobj.LAST_CALLBACKS.STORE["query"]
+
+        expected = sorted(axids[1:])
+        assert sorted([x["internal_axon_id"] for x in rows]) == expected
+        assert sorted([x["internal_axon_id"] for x in rows_chunked]) == expected
+
+    def test_chunk_values(self, apiobj):
+        values = [f"value{x}" for x in range(10)]
+        queries = apiobj._chunk_values(field="x", values=values, chunk_length=30)
+        assert len(queries) == 4
+        assert queries[0] == "x in ['value0', 'value1', 'value2']"
+        assert sum(x.count("'value") for x in queries) == len(values)
+
+        queries = apiobj._chunk_values(field="x", values=values, chunk_length=0)
+        assert len(queries) == 1
+
+    @FLAKY()
+    def test_get_fetch_plan(self, apiobj, tmp_path, monkeypatch):
+        plan = apiobj.get_fetch_plan(wiz_entries=WizData.wiz_str, fields="hostname")
+        assert plan.asset_type == apiobj.ASSET_TYPE
+        assert plan.query and "active_directory" in plan.query
+        assert "specific_data.data.hostname" in plan.fields_parsed
+        assert plan.count is False
+
+        path = tmp_path / "plan.json"
+        plan.save(path)
+        loaded = FetchPlan.load(path)
+        assert loaded == plan
+
+        def no_call(*args, **kwargs):
+            raise AssertionError("preflight called with a fetch plan")
+
+        with monkeypatch.context() as m:
+            m.setattr(apiobj.fields, "validate", no_call)
+            m.setattr(apiobj, "count", no_call)
+            m.setattr(apiobj, "history_dates_obj", no_call)
+            rows = apiobj.get(fetch_plan=loaded, max_rows=1)
+        check_assets(rows)
+        assert apiobj.LAST_CALLBACKS.STORE["initial_count"] is None
+        assert apiobj.LAST_CALLBACKS.STORE["query"] == plan.query
+
+    def test_get_fetch_plan_count_history(self, apiobj, monkeypatch):
+        plan = apiobj.get_fetch_plan(count=True)
+        plan.history_date_parsed = "2022-02-02"
+        plan.saved_query_id = "badwolf"
+        calls = []
+
+        class Counted(Exception):
+            pass
+
+        def count_value(**kwargs):
+            calls.append(kwargs)
+            raise Counted()
+
+        with monkeypatch.context() as m:
+            m.setattr(apiobj, "_count_value", count_value)
+            with pytest.raises(Counted):
+                apiobj.get(fetch_plan=plan, max_rows=1)
+
+        assert calls == [
+            {"query": plan.query, "history_date": "2022-02-02", "saved_query_id": "badwolf"}
+        ]
+
+    def test_get_fetch_plan_wrong_asset_type(self, apiobj):
+        plan = apiobj.get_fetch_plan()
+        plan.asset_type = "badwolf"
+        with pytest.raises(ApiError):
+            apiobj.get(fetch_plan=plan, max_rows=1)
+
+    def test_fetch_plan_from_dict_error(self):
+        with pytest.raises(ApiError):
+            FetchPlan.from_dict(data={"url": "https://badwolf"})
+
+    def test_get_resume(self, apiobj, tmp_path):
+        args = dict(
+            export="json",
+            export_path=tmp_path,
+            fields_default=False,
+            page_size=1,
+            max_rows=3,
+            sort_field="internal_axon_id",
+        )
+        apiobj.get(export_file="ref.json", **args)
+        checkpoint = tmp_path / "run.json.checkpoint.json"
+
+        gen = apiobj.get(export_file="run.json", generator=True, checkpoint_pages=1, **args)
+        for _ in gen:
+            if checkpoint.is_file():
+                break
+        gen.close()
+        assert checkpoint.is_file()
+
+        apiobj.get(export_file="run.json", resume=True, **args)
+        assert not checkpoint.exists()
+        assert (tmp_path / "run.json").read_text() == (tmp_path / "ref.json").read_text()
+
+    def test_get_memory_budget(self, apiobj):
+        rows = apiobj.get(fields_default=False, max_rows=5, page_size=5, memory_budget="1KB")
+        stats = apiobj.LAST_CALLBACKS.STORE["memory_budget"]
+        assert len(rows) == 5
+        assert stats["max_bytes"] == 1024
+        assert stats["buffered_bytes"] == 0
+        assert stats["peak_bytes"] > 0
+
+    def test_get_resume_not_supported(self, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(export="table", export_file="x.txt", export_path=tmp_path, resume=True)
+
+    def test_get_resume_no_export_file(self, apiobj):
+        with pytest.raises(ApiError):
+            apiobj.get(export="json", resume=True)
+
+    def test_get_mirror(self, apiobj, tmp_path):
+        mirror = apiobj.get_mirror(path=tmp_path / "mirror.db", fields_default=False)
+        assert mirror.needs_full()
+
+        stats = mirror.sync()
+        assert stats["mode"] == "full"
+        assert stats["mirrored"] == len(mirror)
+        assert not mirror.needs_full()
+
+        stats = mirror.sync()
+        assert stats["mode"] == "delta"
+        assert stats["since"]
+        assert "date(" in mirror.get_delta_query(since=datetime.datetime.now())
+
+        rows = mirror.get()
+        assert len(rows) == len(mirror)
+        for row in rows:
+            assert mirror.get_by_id(row["internal_axon_id"])["internal_axon_id"]
+
+        export_file = tmp_path / "profile.json"
+        mirror.get(export="profile", export_file=export_file, profile_format="json")
+        store = apiobj.LAST_CALLBACKS.STORE
+        assert store["mirror"] == str(mirror.path)
+        assert store["profile"] == json.loads(export_file.read_text())
+        assert {x["rows"] for x in store["profile"]} == {len(mirror)}
+
+        mirror_changed = apiobj.get_mirror(path=tmp_path / "mirror.db", fields="hostname")
+        assert mirror_changed.needs_full()
+        mirror.close()
+        mirror_changed.close()
+
+    def test_get_mirror_history_date(self, apiobj, tmp_path):
+        dates = apiobj.history_dates_obj()
+        if not dates.dates:
+            pytest.skip("No history dates available")
+        with pytest.raises(ApiError):
+            apiobj.get_mirror(path=tmp_path / "mirror.db", history_days_ago=1)
+
+    @FLAKY()
+    def test_get_history_diff(self, apiobj, monkeypatch):
+        dates = apiobj.history_dates_obj()
+        if not dates.dates:
+            pytest.skip("No history dates available")
+
+        date = dates.get_dates_between()[-1]
+        rows = apiobj.get(
+            history_date=date, max_rows=3, sort_field="internal_axon_id", fields_default=False
+        )
+        axids = [x["internal_axon_id"] for x in rows]
+        if len(axids) < 3:
+            pytest.skip(f"Not enough assets in history date {date}")
+
+        query = apiobj._chunk_values(field="internal_axon_id", values=axids, chunk_length=0)[0]
+        args = dict(query=query, fields_default=False, max_workers=1)
+        assert apiobj.get_history_diff(dates=[date, date], **args) == []
+
+        diff = HistoryDiff(apiobj=apiobj, dates=[date, None], **args)
+        get_fingerprints = diff.get_fingerprints
+        get_rows = diff._get_rows
+
+        def get_fingerprints_changed(date):
+            prints = get_fingerprints(date=date)
+            if date is None:
+                prints.pop(axids[1], None)
+                prints[axids[0]] = b"badwolf"
+            return prints
+
+        def get_rows_changed(ids, date):
+            rows = get_rows(ids=ids, date=date)
+            if date is None and axids[0] in rows:
+                rows[axids[0]]["badwolf"] = "badwolf"
+            return rows
+
+        monkeypatch.setattr(diff, "get_fingerprints", get_fingerprints_changed)
+        monkeypatch.setattr(diff, "_get_rows", get_rows_changed)
+        changes = {x["id"]: x for x in diff}
+
+        assert set(changes).issubset(set(axids))
+        assert changes[axids[1]]["change"] == "removed"
+        assert changes[axids[0]]["change"] == "changed"
+        assert {"field": "badwolf", "old": None, "new": "badwolf"} in changes[axids[0]]["fields"]
+        for change in changes.values():
+            assert change["date_old"] == date and change["date_new"] is None
+
+        stats = diff.stats[0]
+        assert stats["added"] == 0
+        assert stats["removed"] >= 1
+        assert stats["changed"] >= 1
+        assert stats["removed"] + stats["changed"] == len(changes)
+
+    def test_get_history_diff_one_date(self, apiobj):
+        with pytest.raises(ApiError):
+            apiobj.get_history_diff(dates=[None])
+
     @FLAKY()
     def test_get_by_saved_query(self, apiobj):
         sq = apiobj.saved_query.get()[0]
@@ -276,6 +276,24 @@ class TestFieldsPublic:
         fields = apiobj.fields.get()
         self.val_parsed_fields(fields=fields)
 
+    def test_get_disk_cache(self, apiobj, monkeypatch, tmp_path):
+        monkeypatch.setattr(apiobj.fields, "CACHE_ENABLED", True)
+        monkeypatch.setattr(apiobj.fields, "CACHE_PATH", tmp_path)
+        fields = apiobj.fields.get(refresh=True)
+        assert apiobj.fields.cache_file.is_file()
+        assert apiobj.fields.cache_file.parent == tmp_path
+
+        def no_get():
+            raise AssertionError("Fields._get called with a valid on-disk cache")
+
+        with monkeypatch.context() as m:
+            m.setattr(apiobj.fields, "_get", no_get)
+            assert apiobj.fields._get_parsed() == fields
+
+        monkeypatch.setattr(apiobj.fields, "CACHE_TTL", -1)
+        assert apiobj.fields._load_cache(build=apiobj.fields.cache_build) is None
+        apiobj.fields.get(refresh=True)
+
     def val_parsed_fields(self, fields):
         fields = copy.deepcopy(fields)
         assert isinstance(fields, dict)
@@ -522,6 +540,38 @@ class TestFieldsPublic:
         result = apiobj.fields.get_field_schema(value=search, schemas=schemas)
         assert exp == result
 
+    def test_get_index(self, apiobj):
+        fields = apiobj.fields.get()
+        schemas = fields["agg"]
+        index = apiobj.fields.get_index(schemas=schemas)
+        assert index is not None
+        assert apiobj.fields.get_index(schemas=schemas) is index
+        assert apiobj.fields.get_index(schemas=list(schemas)) is None
+
+        for schema in schemas[:50]:
+            for key in ["name", "name_qual", "title"]:
+                value = schema[key].lower()
+                exp = [x for x in schemas if x[key].lower() == value][0]
+                assert index.find(value=value, keys=[key], selectable_only=False) is exp
+
+        everything = apiobj.fields.get_index()
+        schema = schemas[0]
+        value = schema["name_qual"].lower()
+        assert everything.find(value=value, keys=["name_qual"], selectable_only=False) is schema
+
+    @pytest.mark.parametrize("search", ["host", "hostnme", "last seen", "zzzzzz"])
+    def test_fuzzy_filter_index(self, apiobj, search):
+        schemas = apiobj.fields.get()["agg"]
+        index = apiobj.fields.get_index(schemas=schemas)
+        exp = apiobj.fields.fuzzy_filter(search=search, schemas=schemas, key="")
+        result = apiobj.fields.fuzzy_filter(search=search, schemas=schemas, key="", index=index)
+        assert result == exp
+
+        selectable = [x for x in schemas if x.get("selectable", True)][:100]
+        exp = apiobj.fields.fuzzy_filter(search=search, schemas=selectable)
+        result = apiobj.fields.fuzzy_filter(search=search, schemas=selectable, index=index)
+        assert result == exp
+
     def test_get_field_names_re(self, apiobj):
         search = ["seen"]
         get_schema(apiobj=apiobj, field="specific_data.data.last_seen")
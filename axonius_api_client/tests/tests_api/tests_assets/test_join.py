@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import pickle
+
+import pytest
+
+from axonius_api_client.api.assets import AssetJoin
+from axonius_api_client.api.assets.join import strip_domain
+from axonius_api_client.exceptions import ApiError
+
+APIOBJS = {"users": None, "devices": None}
+
+
+def get_join(**kwargs):
+    join = AssetJoin(apiobjs=APIOBJS, left="users", right="devices", left_key="username", **kwargs)
+    join.schemas = [{"name_qual": "users:internal_axon_id"}]
+    join.values = [("u1",), ("u2",), ("u3",)]
+    join.index = {"bob": 0, "alice": [1, 2]}
+    join.probe_key = "last_used_users"
+    join.stats = {"probe_rows": 0, "joined_rows": 0, "unmatched_rows": 0}
+    return join
+
+
+class TestAssetJoin:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("bob@corp.com", "bob"), ("CORP\\bob", "bob"), ("bob", "bob"), ("a\\b@c", "b")],
+    )
+    def test_strip_domain(self, value, expected):
+        assert strip_domain(value) == expected
+
+    def test_get_keys(self):
+        join = get_join(normalize=["strip", "lower", "domain"])
+        row = {"last_used_users": [" CORP\\Bob", "bob@corp.com", None, "", "Alice"]}
+        assert join.get_keys(row=row, field="last_used_users") == ["bob", "alice"]
+
+    def test_join_rows_inner(self):
+        join = get_join()
+        rows = [
+            {"id": "d1", "last_used_users": ["Bob", "bob"]},
+            {"id": "d2", "last_used_users": ["alice", "bob"]},
+            {"id": "d3", "last_used_users": "nobody"},
+        ]
+        joined = join.join_rows(rows=rows)
+        assert [(x["id"], x["users:internal_axon_id"]) for x in joined] == [
+            ("d1", "u1"),
+            ("d2", "u2"),
+            ("d2", "u3"),
+            ("d2", "u1"),
+        ]
+        assert join.stats == {"probe_rows": 3, "joined_rows": 4, "unmatched_rows": 1}
+
+    def test_join_rows_left(self):
+        join = get_join(how="left")
+        joined = join.join_rows(rows=[{"id": "d3", "last_used_users": []}])
+        assert joined == [{"id": "d3", "last_used_users": [], "users:internal_axon_id": None}]
+
+    def test_pickle(self):
+        join = pickle.loads(pickle.dumps(get_join(normalize=["lower", str.upper])))
+        assert join.apiobjs == {}
+        assert join.get_keys(row={"x": "Bob"}, field="x") == ["BOB"]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"left": "badwolf"}, {"build": "badwolf"}, {"how": "badwolf"}, {"normalize": "badwolf"}],
+    )
+    def test_invalid(self, kwargs):
+        args = {"apiobjs": APIOBJS, "left": "users", "right": "devices", "left_key": "x"}
+        args.update(kwargs)
+        with pytest.raises(ApiError):
+            AssetJoin(**args)
@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonapi.api.assets."""
+import logging
+
 import pytest
+import requests
 
 from axonius_api_client.api import json_api
+from axonius_api_client.api.assets.labels import Labels, LabelsBulkResult
+from axonius_api_client.exceptions import InvalidCredentials, LabelsError, ResponseNotOk
 
 
 class TestLabelsPrivate:
@@ -132,3 +137,125 @@ class LabelsPublic:
 
         for label in labels:
             assert label not in all_labels_post_remove
+
+    def test_bulk_add_remove_chunked(self, apiobj):
+        labels = ["badwolf_bulk"]
+        rows = apiobj.get(max_rows=5)
+        ids = [x["internal_axon_id"] for x in rows]
+        events = []
+
+        result = apiobj.labels.bulk(
+            method="add", rows=rows + ids, labels=labels, chunk_size=2, progress=events.append
+        )
+        assert isinstance(result, LabelsBulkResult)
+        assert result.ok
+        assert result.count_ids == len(ids)
+        assert result.count_chunks == len(events) == (len(ids) + 1) // 2
+        assert result.processed == len(ids)
+        assert events[-1]["processed_total"] == len(ids)
+
+        result = apiobj.labels.bulk(method="remove", rows=ids, labels=labels, chunk_size=2)
+        assert result.ok
+        assert result.processed >= 1
+        assert labels[0] not in apiobj.labels.get()
+
+    def test_bulk_invalid_method(self, apiobj):
+        with pytest.raises(LabelsError):
+            apiobj.labels.bulk(method="badwolf", rows=["x"], labels=["x"])
+
+
+def get_response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "badwolf"
+    response.url = "https://badwolf/api/tags"
+    response.request = requests.Request(method="POST", url=response.url).prepare()
+    response._content = b"{}"
+    return response
+
+
+class TestLabelsBulkOffline:
+    @pytest.fixture
+    def labels(self):
+        labels = Labels.__new__(Labels)
+        labels.LOG = logging.getLogger(__name__)
+        return labels
+
+    @staticmethod
+    def get_func(errors):
+        calls = []
+
+        def func(labels, ids):
+            calls.append(list(ids))
+            error = errors.get(ids[0])
+            if error:
+                errors[ids[0]] = error[1:]
+                if error[0] is not None:
+                    raise error[0]
+            return json_api.generic.IntValue(value=len(ids))
+
+        return func, calls
+
+    @pytest.mark.parametrize(
+        "exc,transient",
+        [
+            (requests.ConnectionError("badwolf"), True),
+            (requests.Timeout("badwolf"), True),
+            (ResponseNotOk(response=get_response(503)), True),
+            (ResponseNotOk(response=get_response(429)), True),
+            (ResponseNotOk(response=get_response(400)), False),
+            (InvalidCredentials(response=get_response(500)), False),
+            (TypeError("badwolf"), False),
+        ],
+    )
+    def test_is_transient(self, exc, transient):
+        assert Labels._is_transient(exc=exc) is transient
+
+    def test_retry_exhausted(self, labels):
+        exc = requests.ConnectionError("badwolf")
+        func, calls = self.get_func(errors={"a": [exc] * 5})
+        ret = labels._bulk_chunk(func=func, labels=["x"], ids=["a"], retries=2, retry_sleep=0)
+        assert ret == {"processed": 0, "attempts": 3, "error": exc}
+        assert len(calls) == 3
+
+    def test_retry_recovers(self, labels):
+        func, calls = self.get_func(errors={"a": [requests.Timeout("badwolf"), None]})
+        ret = labels._bulk_chunk(func=func, labels=["x"], ids=["a", "b"], retries=2, retry_sleep=0)
+        assert ret == {"processed": 2, "attempts": 2, "error": None}
+
+    def test_no_retry_not_transient(self, labels):
+        exc = ResponseNotOk(response=get_response(400))
+        func, calls = self.get_func(errors={"a": [exc] * 5})
+        ret = labels._bulk_chunk(func=func, labels=["x"], ids=["a"], retries=3, retry_sleep=0)
+        assert ret["error"] is exc
+        assert ret["attempts"] == 1
+        assert len(calls) == 1
+
+    def test_partial_failure(self, labels):
+        exc = TypeError("badwolf")
+        labels._add, calls = self.get_func(errors={"c": [exc]})
+        result = labels.bulk(
+            method="add",
+            rows=["a", "b", "c", "d", "e", "a"],
+            labels=["x"],
+            chunk_size=2,
+            error=False,
+            retry_sleep=0,
+        )
+        assert result.count_ids == 5
+        assert result.count_chunks == 3
+        assert result.processed == 3
+        assert result.chunks_ok == 2
+        assert not result.ok
+        assert result.failed_ids == ["c", "d"]
+        assert result.failures[0]["error"] is exc
+
+    @pytest.mark.parametrize("method", ["add", "remove"])
+    def test_add_remove_raise(self, labels, method):
+        exc = ResponseNotOk(response=get_response(404))
+        setattr(labels, f"_{method}", self.get_func(errors={"a": [exc]})[0])
+        with pytest.raises(LabelsError) as raised:
+            getattr(labels, method)(rows=[{"internal_axon_id": "a"}, "b"], labels=["x"])
+        assert raised.value.__cause__ is exc
+        assert raised.value.result.failed_ids == ["a", "b"]
+        assert raised.value.result.processed == 0
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import threading
+
+import pytest
+
+from axonius_api_client.api.assets import MemoryBudget
+from axonius_api_client.exceptions import ApiError
+
+
+class TestMemoryBudget:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [(1024, 1024), ("100", 100), ("2k", 2048), ("512MB", 512 * 1024**2), ("1.5G", 1610612736)],
+    )
+    def test_parse_size(self, value, expected):
+        assert MemoryBudget.parse_size(value=value) == expected
+
+    @pytest.mark.parametrize("value", ["badwolf", "0", 0, "-1MB", True, None])
+    def test_parse_size_error(self, value):
+        with pytest.raises(ApiError):
+            MemoryBudget.parse_size(value=value)
+
+    def test_load(self):
+        budget = MemoryBudget(max_bytes="1MB")
+        assert MemoryBudget.load(value=budget) is budget
+        assert MemoryBudget.load(value=None) is None
+        assert MemoryBudget.load(value="2MB").max_bytes == 2 * 1024**2
+
+    def test_acquire_release(self):
+        budget = MemoryBudget(max_bytes=1000, overhead=2)
+        assert budget.estimate(response_bytes=300) == 600
+        assert budget.acquire(nbytes=600, owner="badwolf") == 600
+        assert not budget.is_full
+
+        timer = threading.Timer(0.2, budget.release, kwargs={"nbytes": 600, "owner": "badwolf"})
+        timer.start()
+        budget.acquire(nbytes=600)
+        timer.join()
+
+        stats = budget.get_stats()
+        assert stats["buffered_bytes"] == 600
+        assert stats["peak_bytes"] == 600
+        assert stats["pages"] == 2
+        assert stats["waits"] == 1 and stats["wait_seconds"] > 0
+
+        budget.acquire(nbytes=600, block=False, owner="badwolf")
+        assert budget.is_full
+        assert budget.get_stats()["peak_bytes"] == 1200
+
+    def test_acquire_larger_than_budget(self):
+        budget = MemoryBudget(max_bytes=100)
+        assert budget.acquire(nbytes=500) == 500
+        budget.release(nbytes=500)
+        assert budget.buffered_bytes == 0
+
+    def test_acquire_same_owner(self):
+        budget = MemoryBudget(max_bytes=1000)
+        budget.acquire(nbytes=800)
+        budget.acquire(nbytes=800)
+        assert budget.buffered_bytes == 1600
+        assert budget.waits == 0
+
+    def test_acquire_timeout(self):
+        budget = MemoryBudget(max_bytes=1000, timeout=0.1)
+        budget.acquire(nbytes=800, owner="badwolf")
+        budget.acquire(nbytes=800)
+        stats = budget.get_stats()
+        assert stats["buffered_bytes"] == 1600
+        assert stats["waits"] == 1 and stats["timeouts"] == 1
+
+    def test_adjust(self):
+        budget = MemoryBudget(max_bytes=1000)
+        held = budget.acquire(nbytes=100, owner="badwolf")
+        held = budget.adjust(acquired=held, nbytes=700, owner="badwolf")
+        assert held == 700 and budget.buffered_bytes == 700
+
+        timer = threading.Timer(
+            0.2, budget.adjust, kwargs={"acquired": held, "nbytes": 200, "owner": "badwolf"}
+        )
+        timer.start()
+        budget.acquire(nbytes=500)
+        timer.join()
+        assert budget.buffered_bytes == 700
+        assert budget.waits == 1
+
+        budget.release(nbytes=200, owner="badwolf")
+        budget.release(nbytes=500)
+        assert budget.buffered_bytes == 0
+
+    def test_fit_page_size(self):
+        budget = MemoryBudget(max_bytes=3000, overhead=3)
+        assert budget.fit_page_size(page_size=2000, bytes_per_row=10) == 100
+        assert budget.fit_page_size(page_size=50, bytes_per_row=10) == 50
+        assert budget.fit_page_size(page_size=50, bytes_per_row=5000) == 1
+        assert budget.fit_page_size(page_size=50, bytes_per_row=0) == 50
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Test suite."""
-from axonius_api_client.parsers.fields import schema_custom
+from axonius_api_client.parsers.fields import parse_fields, schema_custom
 
 
 def test_schema_custom():
@@ -30,3 +30,45 @@ def test_schema_custom():
         "is_details": False,
     }
     assert schema == exp
+
+
+def get_raw_fields(extra=None):
+    raw = {
+        "generic": [
+            {"name": "specific_data.data.hostname", "title": "Host Name", "type": "string"}
+        ],
+        "specific": {
+            "aws_adapter": [
+                {
+                    "name": "adapters_data.aws_adapter.hostname",
+                    "title": "Host Name",
+                    "type": "string",
+                }
+            ],
+            "csv_adapter": [],
+            "json_adapter": [],
+        },
+    }
+    if extra:
+        raw["specific"]["aws_adapter"].append(
+            {"name": f"adapters_data.aws_adapter.{extra}", "title": extra, "type": "integer"}
+        )
+    return raw
+
+
+def test_parse_fields_cache():
+    cache = {}
+    hashes = {}
+    exp = parse_fields(raw=get_raw_fields())
+    first = parse_fields(raw=get_raw_fields(), cache=cache, hashes=hashes)
+    assert first == exp
+    assert list(hashes) == ["agg", "aws", "csv", "json"]
+    assert len(set(hashes.values())) == len(cache) == 4
+
+    second = parse_fields(raw=get_raw_fields(extra="badwolf"), cache=cache)
+    assert second == parse_fields(raw=get_raw_fields(extra="badwolf"))
+    assert second["agg"] is first["agg"]
+    assert second["csv"] is first["csv"]
+    assert second["aws"] is not first["aws"]
+    assert second["csv"] != second["json"]
+    assert len(cache) == 5
@@ -5,7 +5,7 @@ import logging
 import pytest
 
 from axonius_api_client.connect import Connect
-from axonius_api_client.exceptions import ConnectError, InvalidCredentials
+from axonius_api_client.exceptions import ApiError, ConnectError, InvalidCredentials
 from axonius_api_client.http import requests
 
 from ..utils import IS_LINUX, get_key_creds, get_url
@@ -67,6 +67,52 @@ class TestConnect:
             assert format(prop_attr)
             assert repr(prop_attr)
 
+    def test_get_assets(self, request):
+        ax_url = get_url(request)
+
+        c = Connect(url=ax_url, certwarn=False, **get_key_creds(request))
+        fetch = c.get_assets(
+            specs={
+                "devices": {"max_rows": 2, "fields_default": False},
+                "more_devices": {"asset_type": "devices", "max_rows": 1, "fields_default": False},
+                "users": {"max_rows": 2, "fields_default": False},
+            },
+            max_workers=2,
+        )
+        rows = fetch.get()
+        assert list(rows) == ["devices", "more_devices", "users"]
+        assert len(rows["more_devices"]) <= 1
+        for name, stats in fetch.stats.items():
+            assert stats["finished"] and not stats["error"]
+            assert stats["rows"] == len(rows[name])
+
+        with pytest.raises(ApiError):
+            c.get_assets(specs={"badwolf": {}})
+
+    def test_join_assets(self, request):
+        ax_url = get_url(request)
+
+        c = Connect(url=ax_url, certwarn=False, **get_key_creds(request))
+        join = c.join_assets(
+            left="users",
+            right="devices",
+            left_key="username",
+            right_key="last_used_users",
+            left_spec={"fields": ["mail"]},
+            right_spec={"max_rows": 5, "fields_default": False},
+            build="left",
+            how="left",
+            normalize=["strip", "lower", "domain"],
+        )
+        rows = join.get()
+        assert join.stats["probe_rows"] <= 5
+        assert len(rows) == join.stats["joined_rows"] + join.stats["unmatched_rows"]
+        for row in rows:
+            assert "users:specific_data.data.mail" in row
+
+        with pytest.raises(ApiError):
+            c.join_assets(left="badwolf", right="devices", left_key="username")
+
     def test_invalid_creds(self, request):
         ax_url = get_url(request)
 
@@ -12,6 +12,9 @@ from axonius_api_client.setup_env import (
     KEY_ENV_FILE,
     KEY_ENV_PATH,
     KEY_FEATURES,
+    KEY_FIELDS_CACHE,
+    KEY_FIELDS_CACHE_PATH,
+    KEY_FIELDS_CACHE_TTL,
     KEY_KEY,
     KEY_OVERRIDE,
     KEY_SECRET,
@@ -24,6 +27,7 @@ from axonius_api_client.setup_env import (
     get_env_connect,
     get_env_csv,
     get_env_features,
+    get_env_fields_cache,
     get_env_path,
     get_env_str,
 )
@@ -43,6 +47,32 @@ class TestGetEnvFeatures:
         assert ret == ["abc", "def", "ghi"]
 
 
+class TestGetEnvFieldsCache:
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv(KEY_FIELDS_CACHE, raising=False)
+        monkeypatch.delenv(KEY_FIELDS_CACHE_PATH, raising=False)
+        monkeypatch.delenv(KEY_FIELDS_CACHE_TTL, raising=False)
+        monkeypatch.setenv(KEY_OVERRIDE, "no")
+        ret = get_env_fields_cache()
+        assert ret["enabled"] is False
+        assert ret["ttl"] == 3600
+        assert isinstance(ret["path"], pathlib.Path)
+
+    def test_set(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(KEY_FIELDS_CACHE, "yes")
+        monkeypatch.setenv(KEY_FIELDS_CACHE_PATH, str(tmp_path))
+        monkeypatch.setenv(KEY_FIELDS_CACHE_TTL, "60")
+        monkeypatch.setenv(KEY_OVERRIDE, "no")
+        ret = get_env_fields_cache()
+        assert ret == {"enabled": True, "path": tmp_path.resolve(), "ttl": 60}
+
+    def test_invalid_ttl(self, monkeypatch):
+        monkeypatch.setenv(KEY_FIELDS_CACHE_TTL, "x")
+        monkeypatch.setenv(KEY_OVERRIDE, "no")
+        with pytest.raises(ValueError):
+            get_env_fields_cache()
+
+
 class TestFindDotEnv:
     def test_supplied(self, monkeypatch, tmp_path):
         path = tmp_path / ".env"
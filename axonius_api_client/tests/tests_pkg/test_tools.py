@@ -12,6 +12,7 @@ from axonius_api_client.constants.api import GUI_PAGE_SIZES
 from axonius_api_client.constants.general import IS_WINDOWS
 from axonius_api_client.exceptions import ToolsError
 from axonius_api_client.tools import (
+    PatternMatcher,
     bom_strip,
     calc_perc_gb,
     calc_percent,
@@ -1499,3 +1500,49 @@ class TestGetPathsFormat:
         exp = pathlib.Path("/x/xxx/z/ddd_xxx.txt")
         ret = get_paths_format("/x", "{DATE}", "z", "ddd_{DATE}.txt", mapping={"{DATE}": "xxx"})
         assert exp == ret
+
+
+class TestPatternMatcher:
+    def test_literal_and_regex(self):
+        matcher = PatternMatcher(patterns=["chrome", "^adobe.*acrobat", "zoom", "chrome"])
+        assert matcher.patterns == ["chrome", "^adobe.*acrobat", "zoom"]
+        assert list(matcher.literals) == [0, 2]
+        assert list(matcher.regexes) == [1]
+
+        names = ["Google Chrome", "Adobe Reader Acrobat", "Notepad++", "notepad++", "Acrobat adobe"]
+        extras, missing = matcher.report(values=names)
+        assert extras == ["Acrobat adobe", "Notepad++", "notepad++"]
+        assert missing == ["zoom"]
+
+    def test_overlapping_literals(self):
+        matcher = PatternMatcher(patterns=["he", "she", "his", "hers"])
+        assert matcher.search_literals(value="USHERS") == {0, 1, 3}
+        assert matcher.is_match(value="this")
+        assert not matcher.is_match(value="hat")
+
+    def test_empty_values(self):
+        matcher = PatternMatcher(patterns=["chrome", "fire.*fox"])
+        extras, missing = matcher.report(values=[])
+        assert extras == []
+        assert missing == ["chrome", "fire.*fox"]
+
+    def test_large_whitelist(self):
+        literals = [f"software package {idx:05d}" for idx in range(9000)]
+        regexes = [f"^vendor{idx:04d} .*suite$" for idx in range(1000)]
+        matcher = PatternMatcher(patterns=literals + regexes)
+        assert len(matcher.patterns) == 10000
+
+        names = [
+            "Software Package 00042 x64",
+            "software package 08999",
+            "VENDOR0007 office suite",
+            "vendor0007 office suite lite",
+            "unlisted tool",
+        ]
+        extras, missing = matcher.report(values=names)
+        assert extras == ["unlisted tool", "vendor0007 office suite lite"]
+        assert len(missing) == 10000 - 3
+        assert "software package 00042" not in missing
+        assert "software package 08999" not in missing
+        assert "^vendor0007 .*suite$" not in missing
+        assert "^vendor0008 .*suite$" in missing
@@ -2107,6 +2107,163 @@ def is_pattern(value: t.Any) -> bool:
     return isinstance(value, t.Pattern)
 
 
+class PatternMatcher:
+    """Match many strings against many case insensitive regex patterns in one pass.
+
+    Notes:
+        Patterns without regex special characters are matched as literal substrings using
+        an Aho-Corasick automaton, so the cost of checking a string does not grow with the
+        number of literal patterns. All other patterns are merged into one compiled
+        alternation to check if a string matches any of them, and are only checked one by
+        one for strings that matched the alternation.
+    """
+
+    REGEX_CHARS: t.FrozenSet[str] = frozenset(".^$*+?{}[]\\|()")
+    """characters that make a pattern a regex instead of a literal"""
+
+    def __init__(self, patterns: t.List[str], flags: int = re.I):
+        """Build the matchers for a list of patterns.
+
+        Args:
+            patterns: regex patterns to match against
+            flags: flags to use when compiling regex patterns
+        """
+        self.patterns: t.List[str] = list(dict.fromkeys(listify(patterns)))
+        self.literals: t.Dict[int, str] = {}
+        self.regexes: t.Dict[int, t.Pattern] = {}
+
+        for idx, pattern in enumerate(self.patterns):
+            if pattern and not set(pattern) & self.REGEX_CHARS:
+                self.literals[idx] = pattern.lower()
+            else:
+                self.regexes[idx] = re.compile(pattern, flags)
+
+        try:
+            self.regex_any: t.Optional[t.Pattern] = (
+                re.compile("|".join(f"(?:{x.pattern})" for x in self.regexes.values()), flags)
+                if self.regexes
+                else None
+            )
+        except re.error:  # pragma: no cover
+            # back references and the like can not be merged
+            self.regex_any = None
+
+        self._build_automaton()
+
+    def _build_automaton(self):
+        """Build the Aho-Corasick automaton for the literal patterns."""
+        self._goto: t.List[t.Dict[str, int]] = [{}]
+        self._fail: t.List[int] = [0]
+        self._out: t.Dict[int, t.Tuple[int, ...]] = {}
+
+        for idx, literal in self.literals.items():
+            node = 0
+            for char in literal:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                node = nxt
+            self._out[node] = self._out.get(node, ()) + (idx,)
+
+        # breadth first, so each fail target is complete before its children are visited
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = fail = self._goto[fail].get(char, 0)
+                if fail in self._out:
+                    self._out[nxt] = self._out.get(nxt, ()) + self._out[fail]
+
+    def search_literals(self, value: str) -> t.Set[int]:
+        """Get the indexes of all literal patterns found in a string.
+
+        Args:
+            value: string to search
+        """
+        found = set()
+        node = 0
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+
+        for char in value.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if node in out:
+                found.update(out[node])
+        return found
+
+    def search(self, value: str, skip: t.Optional[t.Set[int]] = None) -> t.Set[int]:
+        """Get the indexes of all patterns that match a string.
+
+        Args:
+            value: string to search
+            skip: indexes of regex patterns that do not need to be checked
+        """
+        found = self.search_literals(value=value) if self.literals else set()
+
+        if self.regexes and (self.regex_any is None or self.regex_any.search(value)):
+            skip = skip or set()
+            found.update(
+                idx
+                for idx, regex in self.regexes.items()
+                if idx not in skip and regex.search(value)
+            )
+        return found
+
+    def is_match(self, value: str) -> bool:
+        """Check if a string matches any pattern.
+
+        Args:
+            value: string to check
+        """
+        if self.literals and self.search_literals(value=value):
+            return True
+        if self.regex_any is not None:
+            return bool(self.regex_any.search(value))
+        return any(x.search(value) for x in self.regexes.values())
+
+    def report(self, values: t.List[str]) -> t.Tuple[t.List[str], t.List[str]]:
+        """Get the values that match no patterns and the patterns that match no values.
+
+        Args:
+            values: strings to check against all patterns
+
+        Returns:
+            t.Tuple[t.List[str], t.List[str]]: sorted values that did not match any pattern,
+            sorted patterns that did not match any value
+        """
+        matched = set()
+        extras = []
+
+        for value in dict.fromkeys(listify(values)):
+            found = self.search(value=value, skip=matched)
+            if not found and not self.is_match(value=value):
+                extras.append(value)
+            matched.update(found)
+
+        missing = [x for idx, x in enumerate(self.patterns) if idx not in matched]
+        return sorted(extras), sorted(missing)
+
+    def __str__(self) -> str:
+        """Pass."""
+        return (
+            f"{self.__class__.__name__}(literals={len(self.literals)}, "
+            f"regexes={len(self.regexes)})"
+        )
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
 def is_tty(value: t.Any) -> bool:
     """Pass."""
     try: